@@ -4,19 +4,29 @@ This should be used as the main entry point for executing season scoring
 in a production context.
 """
 
+import concurrent.futures
+import contextlib
+import cProfile
+import itertools
 import json
 import logging
+import multiprocessing
+import os
 import pathlib
+import time
 from logging import config as logging_config
+from typing import TYPE_CHECKING, Iterator, NamedTuple
 
 import click
-import courses
-import google_sheet
-import gspread
-import season_config
-import season_controller
-import season_model
-import season_view
+from utils import tracing
+
+# The season packages and their dependencies (gspread, pandas, pydantic and numpy) are slow to import, so they're
+# imported when a season is run. Invocations that exit early, e.g. for --help or invalid options, stay fast.
+if TYPE_CHECKING:
+    import courses
+    import google_sheet
+    import season_config
+    import season_view
 
 # Get a reference to the root logger
 logger = logging.getLogger()
@@ -27,12 +37,25 @@ SERVICE_ACCOUNT_CREDENTIALS_FILE = (
 
 LOGGING_CONFIG_FILE = pathlib.Path(__file__).parent / "logging_config.json"
 
+READ_SNAPSHOT_CACHE_DIR = pathlib.Path(__file__).parent.parent.parent / ".cache" / "read_snapshots"
+
+EVENT_RESULT_CACHE_DIR = pathlib.Path(__file__).parent.parent.parent / ".cache" / "event_results"
+
+LOCAL_WORKBOOKS_DIR = pathlib.Path(__file__).parent.parent.parent / ".cache" / "local_workbooks"
+
+COURSE_INDEX_FILE = pathlib.Path(__file__).parent.parent.parent / ".cache" / "course_index.json"
+
+# Checking for changes costs one Drive API request, which is well within the per-minute quotas at this interval.
+DEFAULT_WATCH_INTERVAL_SECONDS = 30.0
+
 
 class GoogleSheetViewConfigGenerator:
-    def __init__(self, season_cfg: season_config.SeasonConfig) -> None:
+    def __init__(self, season_cfg: "season_config.SeasonConfig") -> None:
         self._season_cfg = season_cfg
 
-    def generate(self) -> season_view.GoogleSheetSeasonViewConfig:
+    def generate(self) -> "season_view.GoogleSheetSeasonViewConfig":
+        import season_view
+
         ordered_event_names = self._season_cfg.ordered_event_names()
         event_configs = [
             self._generate_event_config(event_num, event_name) for event_num, event_name in ordered_event_names.items()
@@ -55,7 +78,9 @@ class GoogleSheetViewConfigGenerator:
             finale_config=finale_view_config,
         )
 
-    def _generate_event_config(self, event_num: int, event_name: str) -> season_view.GoogleSheetSeasonViewEventConfig:
+    def _generate_event_config(self, event_num: int, event_name: str) -> "season_view.GoogleSheetSeasonViewEventConfig":
+        import season_view
+
         season_event_config = self._season_cfg.get_event_config(event_name)
         return season_view.GoogleSheetSeasonViewEventConfig(
             event_number=event_num,
@@ -72,60 +97,421 @@ def setup_logging() -> None:
     logging_config.dictConfig(config)
 
 
-def run_prod_mode_app(season_name: str) -> None:
+@contextlib.contextmanager
+def profile_run(trace_file: pathlib.Path | None = None, stats_file: pathlib.Path | None = None) -> Iterator[None]:
+    """Record the spans of a run as a Chrome trace, and profile the run with cProfile, when the files are given."""
+    tracer = tracing.Tracer()
+    profiler = cProfile.Profile()
+
+    with tracing.activate(tracer) if trace_file is not None else contextlib.nullcontext():
+        if stats_file is not None:
+            profiler.enable()
+        try:
+            yield
+        finally:
+            if stats_file is not None:
+                profiler.disable()
+                stats_file.parent.mkdir(parents=True, exist_ok=True)
+                profiler.dump_stats(stats_file)
+                logger.info(f"cProfile stats written to {stats_file}")
+
+            if trace_file is not None:
+                tracer.write_chrome_trace(trace_file)
+                logger.info(tracer.summary())
+                logger.info(f"Chrome trace written to {trace_file}")
+
+
+def run_prod_mode_app(
+    season_name: str,
+    is_forced: bool = False,
+    api_report_file: pathlib.Path | None = None,
+    watch_interval_seconds: float | None = None,
+    course_provider: "courses.CourseProvider | None" = None,
+    shared_quota: "google_sheet.SharedRequestQuota | None" = None,
+) -> None:
+    import courses
+    import google_sheet
+    import gspread
+    import season_config
+    import season_controller
+    import season_model
+    import season_view
+
     logger.debug(f"Loading config for {season_name}")
     season_cfg = season_config.load_season_config(season_name)
 
-    model = season_model.ConcreteSeasonModel()
+    # Results are cached per season since event names are only unique within a season.
+    result_cache = season_model.EventResultCache(cache_dir=EVENT_RESULT_CACHE_DIR / season_name)
+    if is_forced:
+        result_cache.clear()
+    model = season_model.ConcreteSeasonModel(result_cache=result_cache)
 
     logger.debug(f"Creating gspread client with service account credentials from {SERVICE_ACCOUNT_CREDENTIALS_FILE}")
     gspread_client = gspread.service_account(filename=SERVICE_ACCOUNT_CREDENTIALS_FILE)
+    request_scheduler = google_sheet.RequestScheduler(
+        config=sheet_api_scheduler_config(season_cfg),
+        shared_quota=shared_quota,
+    )
+    api_call_recorder = google_sheet.ApiCallRecorder()
     google_sheet_controller = google_sheet.ConcreteGoogleSheetController(
         gspread_client=gspread_client,
         sheet_id=season_cfg.sheet_id,
+        scheduler=request_scheduler,
+        recorder=api_call_recorder,
+    )
+
+    if course_provider is None:
+        course_provider = courses.build_default_indexed_course_provider(index_file=COURSE_INDEX_FILE)
+
+    # Any change to the season config, the courses or the scoring code invalidates the snapshot since it may change the
+    # results.
+    snapshot_cache = season_view.ReadSnapshotCache(
+        cache_dir=READ_SNAPSHOT_CACHE_DIR,
+        config_salt="\0".join(
+            [season_cfg.model_dump_json(), course_provider.digest(), str(season_model.SCORING_VERSION)]
+        ),
     )
+    if is_forced:
+        snapshot_cache.clear(sheet_id=season_cfg.sheet_id)
 
     view_config = GoogleSheetViewConfigGenerator(season_cfg=season_cfg).generate()
     view = season_view.GoogleSheetSeasonView(
         config=view_config,
         sheet_controller=google_sheet_controller,
+        snapshot_cache=snapshot_cache,
     )
 
-    course_provider = courses.build_default_concrete_course_provider()
-
     controller = season_controller.SeasonController(
         model=model,
         view=view,
         config=season_cfg,
         course_provider=course_provider,
+        phase_listener=api_call_recorder.start_phase,
+    )
+
+    def report_api_calls() -> None:
+        api_call_recorder.finish()
+        logger.info(api_call_recorder.summary())
+        if api_report_file is not None:
+            api_call_recorder.write_json(api_report_file)
+            logger.info(f"Sheets API report written to {api_report_file}")
+
+    def report_and_reset_api_calls() -> None:
+        # Each run in watch mode is reported on its own, so the recorded calls don't grow for as long as the season is
+        # watched. The API report is rewritten with the latest run.
+        report_api_calls()
+        api_call_recorder.reset()
+
+    logger.debug("Running season controller")
+    if watch_interval_seconds is None:
+        try:
+            controller.run_season()
+        finally:
+            report_api_calls()
+    else:
+        season_controller.SeasonWatcher(
+            controller=controller,
+            interval_seconds=watch_interval_seconds,
+            after_run=report_and_reset_api_calls,
+        ).watch()
+
+    logger.debug(f"Sheets API requests: {request_scheduler.stats.summary()}")
+
+
+def sheet_api_scheduler_config(season_cfg: "season_config.SeasonConfig") -> "google_sheet.RequestSchedulerConfig":
+    import google_sheet
+
+    limits = season_cfg.sheet_api_limits
+    return google_sheet.RequestSchedulerConfig(
+        read_requests_per_minute=limits.read_requests_per_minute,
+        write_requests_per_minute=limits.write_requests_per_minute,
+        max_retries=limits.max_retries,
+        max_backoff_seconds=limits.max_backoff_seconds,
+    )
+
+
+def batch_scheduler_config(season_cfgs: list["season_config.SeasonConfig"]) -> "google_sheet.RequestSchedulerConfig":
+    """Scheduler config for seasons that are run at the same time, which uses the strictest limits of the seasons.
+
+    Every season is scored with the same service account, so the seasons share its quotas.
+    """
+    import google_sheet
+
+    scheduler_configs = [sheet_api_scheduler_config(season_cfg) for season_cfg in season_cfgs]
+    return google_sheet.RequestSchedulerConfig(
+        read_requests_per_minute=min(config.read_requests_per_minute for config in scheduler_configs),
+        write_requests_per_minute=min(config.write_requests_per_minute for config in scheduler_configs),
+        max_retries=min(config.max_retries for config in scheduler_configs),
+        max_backoff_seconds=min(config.max_backoff_seconds for config in scheduler_configs),
+    )
+
+
+class BatchSeasonResult(NamedTuple):
+    season_name: str
+    elapsed_seconds: float
+    # The error that the season run failed with, if it failed.
+    error: str | None = None
+
+
+# State of a batch worker process, which is set by the initializer of the process pool.
+_batch_course_provider: "courses.CourseProvider | None" = None
+_batch_shared_quota: "google_sheet.SharedRequestQuota | None" = None
+
+
+def _init_batch_worker(
+    course_provider: "courses.CourseProvider",
+    shared_quota: "google_sheet.SharedRequestQuota",
+) -> None:
+    global _batch_course_provider, _batch_shared_quota
+    _batch_course_provider = course_provider
+    _batch_shared_quota = shared_quota
+
+    setup_logging()
+
+
+def run_batch_season(season_name: str, is_forced: bool = False) -> BatchSeasonResult:
+    """Run a season in a batch worker process. A failed run is returned as a result so that other seasons still run."""
+    start = time.perf_counter()
+    try:
+        run_prod_mode_app(
+            season_name=season_name,
+            is_forced=is_forced,
+            course_provider=_batch_course_provider,
+            shared_quota=_batch_shared_quota,
+        )
+    except Exception as err:
+        logger.exception(f"Season {season_name} failed")
+        return BatchSeasonResult(season_name, time.perf_counter() - start, error=f"{err.__class__.__name__}: {err}")
+
+    return BatchSeasonResult(season_name, time.perf_counter() - start)
+
+
+def run_batch_mode_app(
+    season_names: list[str],
+    is_forced: bool = False,
+    max_workers: int | None = None,
+) -> list[BatchSeasonResult]:
+    """Run several seasons in parallel, each in a worker process.
+
+    The course provider is loaded once and shared by the workers. Sheets API requests from all of the workers are
+    throttled together, since the seasons share the quotas of the service account.
+    """
+    import courses
+    import google_sheet
+    import season_config
+
+    # Load every config before starting any runs, so that an invalid config fails the batch up front.
+    season_cfgs = [season_config.load_season_config(season_name) for season_name in season_names]
+
+    course_provider = courses.build_default_indexed_course_provider(index_file=COURSE_INDEX_FILE)
+
+    # Spawned workers don't inherit any state of the parent, e.g. its open connections, on any platform.
+    context = multiprocessing.get_context("spawn")
+    shared_quota = google_sheet.SharedRequestQuota.from_config(batch_scheduler_config(season_cfgs), context=context)
+
+    if max_workers is None:
+        max_workers = min(len(season_names), os.cpu_count() or 1)
+
+    logger.info(f"🏃🏽‍♀️ Running {len(season_names)} seasons with {max_workers} workers")
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=context,
+        initializer=_init_batch_worker,
+        initargs=(course_provider, shared_quota),
+    ) as executor:
+        results = list(executor.map(run_batch_season, season_names, itertools.repeat(is_forced)))
+
+    for result in results:
+        outcome = "✅ succeeded" if result.error is None else f"❌ failed: {result.error}"
+        logger.info(f"Season {result.season_name} {outcome} in {result.elapsed_seconds:.1f}s")
+
+    return results
+
+
+def run_dev_mode_app(season_name: str, workbook_dir: pathlib.Path | None = None) -> None:
+    """Score a season offline, reading from and writing to a local copy of its Google Sheet.
+
+    The local workbook is downloaded from the season's Google Sheet the first time that it's needed. After that,
+    runs don't make any Sheets API requests, so the full pipeline can be profiled and benchmarked offline.
+    """
+    import courses
+    import google_sheet
+    import gspread
+    import season_config
+    import season_controller
+    import season_model
+    import season_view
+
+    logger.debug(f"Loading config for {season_name}")
+    season_cfg = season_config.load_season_config(season_name)
+
+    if workbook_dir is None:
+        workbook_dir = LOCAL_WORKBOOKS_DIR / season_name
+
+    if not workbook_dir.exists():
+        logger.info(f"Downloading the season's Google Sheet to local workbook {workbook_dir}")
+        gspread_client = gspread.service_account(filename=SERVICE_ACCOUNT_CREDENTIALS_FILE)
+        google_sheet.save_local_workbook(
+            source=google_sheet.ConcreteGoogleSheetController(
+                gspread_client=gspread_client, sheet_id=season_cfg.sheet_id
+            ),
+            workbook_dir=workbook_dir,
+        )
+
+    logger.debug(f"Using local workbook {workbook_dir}")
+    local_sheet_controller = google_sheet.LocalGoogleSheetController(workbook_dir=workbook_dir)
+
+    view_config = GoogleSheetViewConfigGenerator(season_cfg=season_cfg).generate()
+    view = season_view.GoogleSheetSeasonView(config=view_config, sheet_controller=local_sheet_controller)
+
+    controller = season_controller.SeasonController(
+        model=season_model.ConcreteSeasonModel(),
+        view=view,
+        config=season_cfg,
+        course_provider=courses.build_default_indexed_course_provider(index_file=COURSE_INDEX_FILE),
     )
 
     logger.debug("Running season controller")
     controller.run_season()
 
 
-def run_dev_mode_app(season_name: str) -> None:
-    raise NotImplementedError("Dev mode app is not available at this time.")
+def check_watch_options(
+    is_dev_mode: bool,
+    trace_file: pathlib.Path | None,
+    profile_stats_file: pathlib.Path | None,
+) -> None:
+    if is_dev_mode:
+        raise click.UsageError("--watch can't be used with --dev-mode.")
+
+    # Profiles are written when the run ends, so a watch would collect them for as long as the season is watched.
+    for option, file in [("--profile", trace_file), ("--profile-stats", profile_stats_file)]:
+        if file is not None:
+            raise click.UsageError(f"{option} can't be used with --watch.")
 
 
 @click.command()
-@click.option("--season", "season_name", required=True, help="Season to be executed.")
+@click.option(
+    "--season",
+    "season_names",
+    required=True,
+    multiple=True,
+    help="Season to be executed. Repeat the option to run several seasons in parallel.",
+)
 @click.option(
     "--dev-mode",
     "is_dev_mode",
     is_flag=True,
     default=False,
-    help="Use development mode. Behavior may vary, see source code for details.",
+    help="Use development mode, which runs against a local workbook instead of the Google Sheet.",
 )
-def cli(season_name: str, is_dev_mode: bool) -> None:
+@click.option(
+    "--force",
+    "is_forced",
+    is_flag=True,
+    default=False,
+    help="Score the season from scratch, even if the sheet is unchanged since the last run.",
+)
+@click.option(
+    "--workbook",
+    "workbook_dir",
+    type=click.Path(file_okay=False, path_type=pathlib.Path),
+    default=None,
+    help="Local workbook directory to use in development mode. Defaults to a local copy of the season's sheet.",
+)
+@click.option(
+    "--api-report",
+    "api_report_file",
+    type=click.Path(dir_okay=False, path_type=pathlib.Path),
+    default=None,
+    help="Write a JSON report of every Sheets API request made by the run, or by the latest run in watch mode, to this "
+    "file.",
+)
+@click.option(
+    "--profile",
+    "trace_file",
+    type=click.Path(dir_okay=False, path_type=pathlib.Path),
+    default=None,
+    help="Write a Chrome trace of the phases of the run to this file. View it in chrome://tracing or ui.perfetto.dev.",
+)
+@click.option(
+    "--profile-stats",
+    "profile_stats_file",
+    type=click.Path(dir_okay=False, path_type=pathlib.Path),
+    default=None,
+    help="Profile the run with cProfile and write the stats to this file, e.g. for pstats or snakeviz.",
+)
+@click.option(
+    "--watch",
+    "is_watching",
+    is_flag=True,
+    default=False,
+    help="Keep running and rescore the season whenever the sheet changes, until interrupted.",
+)
+@click.option(
+    "--watch-interval",
+    "watch_interval_seconds",
+    type=click.FloatRange(min=1.0),
+    default=DEFAULT_WATCH_INTERVAL_SECONDS,
+    show_default=True,
+    help="Seconds between checks for changes to the sheet in watch mode.",
+)
+@click.option(
+    "--workers",
+    "max_workers",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Number of seasons to run at the same time when several seasons are given. Defaults to the number of CPUs.",
+)
+def cli(
+    season_names: tuple[str, ...],
+    is_dev_mode: bool,
+    is_forced: bool,
+    workbook_dir: pathlib.Path | None,
+    api_report_file: pathlib.Path | None,
+    trace_file: pathlib.Path | None,
+    profile_stats_file: pathlib.Path | None,
+    is_watching: bool,
+    watch_interval_seconds: float,
+    max_workers: int | None,
+) -> None:
+    if is_watching:
+        check_watch_options(is_dev_mode=is_dev_mode, trace_file=trace_file, profile_stats_file=profile_stats_file)
+
+    if len(set(season_names)) != len(season_names):
+        raise click.UsageError("Each season can only be given once.")
+
+    is_batch = len(season_names) > 1
+    if is_batch:
+        for option, is_used in [
+            ("--dev-mode", is_dev_mode),
+            ("--watch", is_watching),
+            ("--api-report", api_report_file),
+        ]:
+            if is_used:
+                raise click.UsageError(f"{option} can't be used with more than one season.")
+
     setup_logging()
 
-    if is_dev_mode:
-        logger.info(f"Running dev mode for season {season_name}")
-        run_dev_mode_app(season_name=season_name)
-    else:
-        logger.info(f"🏃🏽‍♀️ Running season {season_name}")
-        run_prod_mode_app(season_name=season_name)
+    with profile_run(trace_file=trace_file, stats_file=profile_stats_file):
+        if is_batch:
+            results = run_batch_mode_app(season_names=list(season_names), is_forced=is_forced, max_workers=max_workers)
+            failed_season_names = [result.season_name for result in results if result.error is not None]
+            if failed_season_names:
+                raise click.ClickException(f"Seasons failed: {', '.join(failed_season_names)}")
+            return
+
+        [season_name] = season_names
+        if is_dev_mode:
+            logger.info(f"Running dev mode for season {season_name}")
+            run_dev_mode_app(season_name=season_name, workbook_dir=workbook_dir)
+        else:
+            logger.info(f"🏃🏽‍♀️ Running season {season_name}")
+            run_prod_mode_app(
+                season_name=season_name,
+                is_forced=is_forced,
+                api_report_file=api_report_file,
+                watch_interval_seconds=watch_interval_seconds if is_watching else None,
+            )
 
 
 if __name__ == "__main__":
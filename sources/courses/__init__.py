@@ -1,10 +1,14 @@
 from .course import (  # noqa: F401 - names exposed for public use
     Course,
     TeeInfo,
+    TeeTable,
 )
 from .provider import (  # noqa: F401 - names exposed for public use
     ConcreteCourseProvider,
     CourseProvider,
+    IndexedCourseProvider,
     build_concrete_course_provider_from_folder,
     build_default_concrete_course_provider,
+    build_default_indexed_course_provider,
+    build_indexed_course_provider,
 )
@@ -1,7 +1,10 @@
+import dataclasses
+import functools
 import pathlib
 
+import numpy as np
+import numpy.typing as npt
 import pydantic
-import pydantic_yaml
 from season_common import player
 
 
@@ -22,6 +25,69 @@ class TeeInfo(pydantic.BaseModel):
     slope: int = pydantic.Field(ge=MIN_TEE_SLOPE, le=MAX_TEE_SLOPE)
 
 
+# Tee tables are compared by identity, since they hold arrays. Courses cache their tee tables, and pydantic compares
+# the cached values before it compares the fields of two courses.
+@dataclasses.dataclass(frozen=True, eq=False)
+class TeeTable:
+    """Handicap and scoring values of one tee of a course, which are precomputed for calculations over many players.
+
+    The values are combined with the same operations, in the same order, as the scalar `Course` methods, so the
+    results are identical.
+    """
+
+    rating: float
+    slope: int
+    par: int
+    # Factor of the handicap index in a course handicap, i.e. slope / 113.
+    slope_factor: float
+    # Term that is added to the course handicap, i.e. rating - par.
+    rating_minus_par: float
+    # Factor of the gross strokes over the rating in a score differential, i.e. 113 / slope.
+    differential_factor: float
+    hole_pars: npt.NDArray[np.int64]
+    # Maximum strokes that count for each hole, i.e. double par plus two.
+    max_hole_strokes: npt.NDArray[np.int64]
+
+    @staticmethod
+    def from_tee_info(tee_info: TeeInfo, hole_pars: list[int]) -> "TeeTable":
+        par = sum(hole_pars)
+        hole_pars_array = np.array(hole_pars, dtype=np.int64)
+        hole_pars_array.flags.writeable = False
+        max_hole_strokes = 2 * hole_pars_array + 2
+        max_hole_strokes.flags.writeable = False
+
+        return TeeTable(
+            rating=tee_info.rating,
+            slope=tee_info.slope,
+            par=par,
+            slope_factor=tee_info.slope / 113,
+            rating_minus_par=tee_info.rating - par,
+            differential_factor=113 / tee_info.slope,
+            hole_pars=hole_pars_array,
+            max_hole_strokes=max_hole_strokes,
+        )
+
+    def course_handicap_unrounded(self, player_hcp_index: float) -> float:
+        return player_hcp_index * self.slope_factor + self.rating_minus_par
+
+    def course_handicaps(self, player_hcp_indices: npt.ArrayLike) -> npt.NDArray[np.int64]:
+        """Course handicaps for an array of handicap indices."""
+        course_hcps_raw = np.asarray(player_hcp_indices, dtype=float) * self.slope_factor + self.rating_minus_par
+        # Rounding to a whole number rounds half to even, like Python's `round`.
+        return np.rint(course_hcps_raw).astype(np.int64)
+
+    def scoring_differential(self, gross_strokes: int) -> float:
+        return round(self.differential_factor * (gross_strokes - self.rating), 1)
+
+    def scoring_differentials(self, gross_strokes: npt.ArrayLike) -> list[float]:
+        """Score differentials for an array of 18 hole gross strokes.
+
+        Rounding is done with Python's `round` rather than NumPy's, which rounds to decimals differently.
+        """
+        differentials_raw = self.differential_factor * (np.asarray(gross_strokes, dtype=float) - self.rating)
+        return [round(differential, 1) for differential in differentials_raw.tolist()]
+
+
 class Course(pydantic.BaseModel):
     model_config = pydantic.ConfigDict(frozen=True, extra="forbid", strict=True)
 
@@ -32,7 +98,7 @@ class Course(pydantic.BaseModel):
     mens_tees_: dict[str, TeeInfo] = pydantic.Field(alias="mens_tees")
     womens_tees_: dict[str, TeeInfo] = pydantic.Field(alias="womens_tees")
 
-    @property
+    @functools.cached_property
     def par(self) -> int:
         return sum(self.hole_pars_)
 
@@ -42,7 +108,7 @@ class Course(pydantic.BaseModel):
 
     @property
     def total_par(self) -> int:
-        return sum(self.hole_pars_)
+        return self.par
 
     def tees(self, player_gender: player.PlayerGender) -> dict[str, TeeInfo]:
         match player_gender:
@@ -69,6 +135,23 @@ class Course(pydantic.BaseModel):
                 f"Tee named '{tee_name}' not found for course: {self.name}. Available tees: {available_tees}"
             ) from exc
 
+    def tee_table(self, tee_name: str, player_gender: player.PlayerGender = player.PlayerGender.MALE) -> TeeTable:
+        tee_table = self._tee_tables.get((player_gender, tee_name))
+        if tee_table is None:
+            # Raises the same errors as looking up the tee info of an unknown tee or gender.
+            self.get_tee_info(tee_name=tee_name, player_gender=player_gender)
+            raise KeyError(f"Tee named '{tee_name}' not found for course: {self.name}.")
+
+        return tee_table
+
+    @functools.cached_property
+    def _tee_tables(self) -> dict[tuple[player.PlayerGender, str], TeeTable]:
+        return {
+            (player_gender, tee_name): TeeTable.from_tee_info(tee_info=tee_info, hole_pars=self.hole_pars_)
+            for player_gender in player.PlayerGender
+            for tee_name, tee_info in self.tees(player_gender=player_gender).items()
+        }
+
     def course_handicap(self, tee: str, player_hcp_index: float, player_gender: player.PlayerGender) -> int:
         course_hcp_raw = self._course_handicap_unrounded(
             tee=tee, player_hcp_index=player_hcp_index, player_gender=player_gender
@@ -81,8 +164,8 @@ class Course(pydantic.BaseModel):
         player_hcp_index: float,
         player_gender: player.PlayerGender,
     ) -> float:
-        tee_info = self.get_tee_info(tee_name=tee, player_gender=player_gender)
-        return player_hcp_index * (tee_info.slope / 113) + (tee_info.rating - self.par)
+        tee_table = self.tee_table(tee_name=tee, player_gender=player_gender)
+        return tee_table.course_handicap_unrounded(player_hcp_index=player_hcp_index)
 
     def playing_handicap(
         self,
@@ -101,8 +184,8 @@ class Course(pydantic.BaseModel):
 
     def scoring_differential(self, tee: str, gross_strokes: int, player_gender: player.PlayerGender) -> float:
         """Handicap score differential based on 18 hole strokes and tees."""
-        tee_info = self.get_tee_info(tee_name=tee, player_gender=player_gender)
-        return round((113 / tee_info.slope) * (gross_strokes - tee_info.rating), 1)
+        tee_table = self.tee_table(tee_name=tee, player_gender=player_gender)
+        return tee_table.scoring_differential(gross_strokes=gross_strokes)
 
     @pydantic.field_validator("hole_pars_")
     @classmethod
@@ -118,6 +201,9 @@ class Course(pydantic.BaseModel):
 
 
 def load_course_file(file_path: pathlib.Path) -> Course:
+    # The YAML parser is slow to import and is only needed when course files are compiled into the course index.
+    import pydantic_yaml
+
     try:
         return pydantic_yaml.parse_yaml_file_as(Course, file_path)
 
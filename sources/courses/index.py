@@ -0,0 +1,134 @@
+import hashlib
+import json
+import logging
+import os
+import pathlib
+from typing import Any, NamedTuple
+
+from courses.course import Course, CourseError, load_course_file
+
+logger = logging.getLogger(__name__)
+
+# Increment this when the structure of the index file or of the course data changes so that indexes written by older
+# code are rebuilt.
+COURSE_INDEX_FORMAT_VERSION = 1
+
+
+class CourseLoadError(Exception):
+    """Exception to be raised when an error is encountered while attempting to load a course."""
+
+
+class CourseIndexEntry(NamedTuple):
+    """Validated data of one course file, along with the state of the file that it was compiled from."""
+
+    file_name: str
+    mtime_ns: int
+    size: int
+    sha256: str
+    course_name: str
+    # The course as JSON, which is validated again when the course is materialized.
+    course_json: str
+
+    def is_current(self, stat: os.stat_result) -> bool:
+        return self.mtime_ns == stat.st_mtime_ns and self.size == stat.st_size
+
+
+class CourseIndex:
+    """Compiled index of the course files in a folder, which is stored as a single JSON file.
+
+    The index is rebuilt incrementally: files whose modification time and size are unchanged are not read at all,
+    files that were touched but whose content is unchanged are hashed but not parsed, and only new or modified files
+    are parsed from YAML.
+    """
+
+    def __init__(self, entries: list[CourseIndexEntry]) -> None:
+        self._entries = entries
+
+    @property
+    def entries(self) -> list[CourseIndexEntry]:
+        return self._entries
+
+    def digest(self) -> str:
+        """Digest of the content of every course file in the index, which changes whenever any course changes."""
+        digest = hashlib.sha256(str(COURSE_INDEX_FORMAT_VERSION).encode())
+        for entry in self._entries:
+            digest.update(f"\0{entry.file_name}\0{entry.sha256}".encode())
+
+        return digest.hexdigest()
+
+    @classmethod
+    def load_or_build(cls, courses_dir: pathlib.Path, index_file: pathlib.Path | None = None) -> "CourseIndex":
+        """Index of the course files in a folder, reusing and updating the index file if one is given."""
+        previous_entries = _load_entries(index_file) if index_file is not None else {}
+
+        entries: list[CourseIndexEntry] = []
+        for course_file in sorted(courses_dir.glob("*.yaml")):
+            entries.append(_index_entry(course_file, previous_entries.get(course_file.name)))
+
+        index = cls(entries)
+        if index_file is not None and entries != list(previous_entries.values()):
+            logger.debug(f"Writing course index to {index_file}")
+            index._write(index_file)
+
+        return index
+
+    def _write(self, index_file: pathlib.Path) -> None:
+        index_json = {
+            "format_version": COURSE_INDEX_FORMAT_VERSION,
+            "entries": [entry._asdict() for entry in self._entries],
+        }
+
+        index_file.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first so that an index is never left partially written.
+        temp_file = index_file.with_suffix(".tmp")
+        temp_file.write_text(json.dumps(index_json))
+        os.replace(temp_file, index_file)
+
+
+def _load_entries(index_file: pathlib.Path) -> dict[str, CourseIndexEntry]:
+    if not index_file.is_file():
+        return {}
+
+    try:
+        index_json: dict[str, Any] = json.loads(index_file.read_text())
+        if index_json.get("format_version") != COURSE_INDEX_FORMAT_VERSION:
+            return {}
+
+        entries = [CourseIndexEntry(**entry) for entry in index_json["entries"]]
+    except Exception:
+        # An index that can't be loaded is treated the same as a missing one. It will be rebuilt from the course files.
+        logger.warning(f"Unable to load course index from {index_file}. It will be rebuilt.", exc_info=True)
+        return {}
+
+    return {entry.file_name: entry for entry in entries}
+
+
+def _index_entry(course_file: pathlib.Path, previous_entry: CourseIndexEntry | None) -> CourseIndexEntry:
+    stat = course_file.stat()
+    if previous_entry is not None and previous_entry.is_current(stat):
+        return previous_entry
+
+    content = course_file.read_bytes()
+    sha256 = hashlib.sha256(content).hexdigest()
+    if previous_entry is not None and previous_entry.sha256 == sha256:
+        return previous_entry._replace(mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+
+    try:
+        course = load_course_file(course_file)
+    except CourseError as exc:
+        raise CourseLoadError(
+            f"Unable to load database. Error encountere while processing file: {course_file}."
+        ) from exc
+
+    return CourseIndexEntry(
+        file_name=course_file.name,
+        mtime_ns=stat.st_mtime_ns,
+        size=stat.st_size,
+        sha256=sha256,
+        course_name=course.name,
+        course_json=course.model_dump_json(by_alias=True),
+    )
+
+
+def materialize_course(entry: CourseIndexEntry) -> Course:
+    return Course.model_validate_json(entry.course_json)
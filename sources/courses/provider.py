@@ -1,15 +1,18 @@
 import abc
+import hashlib
 import pathlib
 
-from courses.course import Course, CourseError, load_course_file
+from courses.course import Course
+from courses.index import (
+    CourseIndex,
+    CourseIndexEntry,
+    CourseLoadError,  # noqa: F401 - name exposed for public use
+    materialize_course,
+)
 
 DEFAULT_COURSE_DATA_PATH = pathlib.Path(__file__).parent / "data"
 
 
-class CourseLoadError(Exception):
-    """Exception to be raised when an error is encountered while attempting to load a course."""
-
-
 class CourseProviderError(Exception):
     """Exception to be raised when an error is encountered in a course provider."""
 
@@ -19,52 +22,104 @@ class CourseProvider(abc.ABC):
     def get_course(self, course_name: str) -> Course:
         pass
 
+    @abc.abstractmethod
+    def digest(self) -> str:
+        """Digest of every course that the provider provides, which changes whenever any of the courses change."""
+        pass
+
 
 class ConcreteCourseProvider(CourseProvider):
     def __init__(self, courses: list[Course]) -> None:
         self.courses = courses
-        self._check_duplicate_course_names()
+        _check_duplicate_course_names([course.name for course in courses])
+        self._courses_by_name = {course.name.lower(): course for course in courses}
 
     def get_course(self, course_name: str) -> Course:
-        for course in self.courses:
-            if course.name.lower() == course_name.lower():
-                return course
+        try:
+            return self._courses_by_name[course_name.lower()]
+        except KeyError:
+            raise _course_not_found_error(course_name, self._course_names()) from None
 
-        raise CourseProviderError(
-            f"Could not find any courses with the name {course_name}. "
-            f"Available courses:\n{'\n'.join(self._course_names())}"
-        )
+    def digest(self) -> str:
+        digest = hashlib.sha256()
+        for course_json in sorted(course.model_dump_json(by_alias=True) for course in self.courses):
+            digest.update(course_json.encode())
+            digest.update(b"\0")
+
+        return digest.hexdigest()
 
     def _course_names(self) -> list[str]:
         return [course.name for course in self.courses]
 
-    def _check_duplicate_course_names(self) -> None:
-        course_names = [course.name for course in self.courses]
-        num_courses = len(course_names)
 
-        unique_courses = set(course_names)
-        num_unique_courses = len(unique_courses)
+class IndexedCourseProvider(CourseProvider):
+    """Course provider backed by a compiled course index, which only materializes the courses that are requested."""
+
+    def __init__(self, index: CourseIndex) -> None:
+        _check_duplicate_course_names([entry.course_name for entry in index.entries])
+        self._entries_by_name: dict[str, CourseIndexEntry] = {
+            entry.course_name.lower(): entry for entry in index.entries
+        }
+        self._courses_by_name: dict[str, Course] = {}
+        self._digest = index.digest()
+
+    def get_course(self, course_name: str) -> Course:
+        key = course_name.lower()
+        if key not in self._courses_by_name:
+            entry = self._entries_by_name.get(key)
+            if entry is None:
+                raise _course_not_found_error(course_name, self._course_names())
+
+            self._courses_by_name[key] = materialize_course(entry)
+
+        return self._courses_by_name[key]
 
-        if num_unique_courses != num_courses:
-            duplicates = [course for course in unique_courses if course_names.count(course) > 1]
-            raise CourseProviderError(
-                f"Course names must be unique. Found the following duplicate course names: {duplicates}"
-            )
+    def digest(self) -> str:
+        return self._digest
+
+    def _course_names(self) -> list[str]:
+        return [entry.course_name for entry in self._entries_by_name.values()]
+
+
+def _course_not_found_error(course_name: str, available_course_names: list[str]) -> CourseProviderError:
+    return CourseProviderError(
+        f"Could not find any courses with the name {course_name}. "
+        f"Available courses:\n{'\n'.join(available_course_names)}"
+    )
+
+
+def _check_duplicate_course_names(course_names: list[str]) -> None:
+    # Names are compared case-insensitively since courses are looked up case-insensitively.
+    lower_course_names = [course_name.lower() for course_name in course_names]
+    num_courses = len(lower_course_names)
+
+    unique_courses = set(lower_course_names)
+    num_unique_courses = len(unique_courses)
+
+    if num_unique_courses != num_courses:
+        duplicates = [course for course in unique_courses if lower_course_names.count(course) > 1]
+        raise CourseProviderError(
+            f"Course names must be unique. Found the following duplicate course names: {duplicates}"
+        )
 
 
 def build_concrete_course_provider_from_folder(courses_dir: pathlib.Path) -> ConcreteCourseProvider:
-    courses: list[Course] = []
-    for course_file in courses_dir.glob("*.yaml"):
-        try:
-            course_ = load_course_file(course_file)
-            courses.append(course_)
-        except CourseError as exc:
-            raise CourseLoadError(
-                f"Unable to load database. Error encountere while processing file: {course_file}."
-            ) from exc
+    index = CourseIndex.load_or_build(courses_dir=courses_dir)
+    return ConcreteCourseProvider([materialize_course(entry) for entry in index.entries])
 
-    return ConcreteCourseProvider(courses)
+
+def build_indexed_course_provider(
+    courses_dir: pathlib.Path,
+    index_file: pathlib.Path | None = None,
+) -> IndexedCourseProvider:
+    """Course provider for a folder of course files, which reuses the compiled index file if it's up to date."""
+    return IndexedCourseProvider(CourseIndex.load_or_build(courses_dir=courses_dir, index_file=index_file))
 
 
 def build_default_concrete_course_provider() -> ConcreteCourseProvider:
     return build_concrete_course_provider_from_folder(courses_dir=DEFAULT_COURSE_DATA_PATH)
+
+
+def build_default_indexed_course_provider(index_file: pathlib.Path) -> IndexedCourseProvider:
+    """Course provider for the default course files, which reuses and updates the given index file."""
+    return build_indexed_course_provider(courses_dir=DEFAULT_COURSE_DATA_PATH, index_file=index_file)
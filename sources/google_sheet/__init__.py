@@ -2,11 +2,27 @@ from .controller import (
     ConcreteGoogleSheetController,
     GoogleSheetController,
 )
+from .instrumentation import (
+    ApiCall,
+    ApiCallRecorder,
+)
+from .local import (
+    LocalGoogleSheetController,
+    LocalWorkbookError,
+    save_local_workbook,
+)
+from .scheduler import (
+    RequestScheduler,
+    RequestSchedulerConfig,
+    SharedRateLimiter,
+    SharedRequestQuota,
+)
 from .worksheet import (
     CellFormat,
     CellValues,
     CellValueType,
     ColorRgb,
+    ConcreteGoogleWorksheet,
     GoogleWorksheet,
     RangeFormat,
     RangeValues,
@@ -3,7 +3,10 @@ from typing import Any, Mapping
 
 import gspread
 
-from google_sheet import worksheet
+from google_sheet import instrumentation, worksheet
+from google_sheet import scheduler as request_scheduler
+from google_sheet import utils as sheet_utils
+from google_sheet.worksheet import CellValues
 
 
 class GoogleSheetController(abc.ABC):
@@ -19,17 +22,177 @@ class GoogleSheetController(abc.ABC):
     def worksheet_titles(self) -> list[str]:
         pass
 
+    @abc.abstractmethod
+    def invalidate_metadata(self) -> None:
+        """Discard anything that's cached about the worksheets in the spreadsheet.
+
+        The next access fetches it again, so that worksheets which were added, removed or renamed are picked up.
+        """
+        pass
+
+    @abc.abstractmethod
+    def sheet_id(self) -> str:
+        pass
+
+    @abc.abstractmethod
+    def revision_token(self) -> str:
+        """A token that changes whenever the spreadsheet is modified.
+
+        This is intended to be much cheaper to fetch than the spreadsheet contents so that it can be used to tell
+        whether previously read contents are still current.
+        """
+        pass
+
+    @abc.abstractmethod
+    def batch_read(self, ranges: list[str]) -> dict[str, list[list[str]]]:
+        """Read values for multiple ranges in a single request.
+
+        Ranges must be qualified with their worksheet name in A1 notation, e.g. "'Sheet1'!A1:C6". Values are
+        returned as a mapping from each requested range to its values, padded as described in
+        `sheet_utils.fill_range_gaps`.
+        """
+        pass
+
+    @abc.abstractmethod
+    def batch_read_unformatted(self, ranges: list[str]) -> dict[str, CellValues]:
+        """Read the stored values of multiple ranges in a single request, without applying number formats.
+
+        Numbers are returned as numbers, so values that are displayed the same way by a rounding number format can
+        still be told apart. Trailing empty rows and cells are omitted, as they are by the Sheets API.
+        """
+        pass
+
+    @abc.abstractmethod
+    def begin_batch(self) -> None:
+        """Start buffering writes to all worksheets of the spreadsheet until `flush` is called."""
+        pass
+
+    @abc.abstractmethod
+    def flush(self) -> None:
+        """Write everything that was buffered since `begin_batch` was called."""
+        pass
+
 
 class ConcreteGoogleSheetController(GoogleSheetController):
-    def __init__(self, gspread_client: gspread.client.Client, sheet_id: str) -> None:
+    def __init__(
+        self,
+        gspread_client: gspread.client.Client,
+        sheet_id: str,
+        scheduler: request_scheduler.RequestScheduler | None = None,
+        recorder: instrumentation.ApiCallRecorder | None = None,
+    ) -> None:
+        if scheduler is not None or recorder is not None:
+            # Every request for the spreadsheet and its worksheets is made through the client's HTTP client. Recording
+            # requests without a scheduler uses a scheduler with the default quotas.
+            request_scheduler.schedule_gspread_client(
+                gspread_client,
+                scheduler=scheduler or request_scheduler.RequestScheduler(),
+                recorder=recorder,
+            )
+        self._recorder = recorder
+
         self._sheet: gspread.spreadsheet.Spreadsheet = gspread_client.open_by_key(sheet_id)
 
+        # A single write batch is shared with every worksheet so that writes to all of them can be buffered.
+        self._batch = worksheet.WriteBatch()
+
+        # Spreadsheet metadata is fetched once and reused until it's invalidated. Worksheet handles are built from the
+        # metadata, since gspread would otherwise fetch the metadata again for each worksheet.
+        self._metadata: Mapping[str, Any] | None = None
+        self._worksheet_properties: dict[str, dict[str, Any]] = {}
+        self._gspread_worksheets: dict[str, gspread.worksheet.Worksheet] = {}
+        # The last revision token that was seen. The cached metadata is discarded when the token changes, since the
+        # worksheets may have been renamed or recreated by someone else.
+        self._last_revision_token: str | None = None
+
     def worksheet(self, worksheet_name: str) -> worksheet.GoogleWorksheet:
-        return worksheet.GoogleWorksheet(worksheet=self._sheet.worksheet(worksheet_name))
+        return worksheet.ConcreteGoogleWorksheet(worksheet=self._gspread_worksheet(worksheet_name), batch=self._batch)
 
     def sheet_metadata(self) -> Mapping[str, Any]:
-        return self._sheet.fetch_sheet_metadata()
+        if self._metadata is None:
+            self._metadata = self._sheet.fetch_sheet_metadata()
+            self._worksheet_properties = {
+                sheet_meta["properties"]["title"]: sheet_meta["properties"] for sheet_meta in self._metadata["sheets"]
+            }
+            if self._recorder is not None:
+                self._recorder.register_worksheet_titles(
+                    {properties["sheetId"]: title for title, properties in self._worksheet_properties.items()}
+                )
+
+        return self._metadata
+
+    def invalidate_metadata(self) -> None:
+        self._metadata = None
+        self._worksheet_properties = {}
+        self._gspread_worksheets = {}
 
     def worksheet_titles(self) -> list[str]:
-        worksheets_metadata = self.sheet_metadata()["sheets"]
-        return [sheet_meta["properties"]["title"] for sheet_meta in worksheets_metadata]
+        self.sheet_metadata()
+        return list(self._worksheet_properties.keys())
+
+    def sheet_id(self) -> str:
+        return self._sheet.id
+
+    def revision_token(self) -> str:
+        # The Drive modified time of the spreadsheet file is updated by any edit to its values or formatting.
+        token = self._sheet.get_lastUpdateTime()
+        if self._last_revision_token is not None and token != self._last_revision_token:
+            self.invalidate_metadata()
+
+        self._last_revision_token = token
+        return token
+
+    def batch_read(self, ranges: list[str]) -> dict[str, list[list[str]]]:
+        response = self._sheet.values_batch_get(ranges=ranges)
+
+        # Value ranges are returned in the same order that they were requested. The range names in the response
+        # are normalized by the API, so they can't be used to match the requested ranges.
+        value_ranges = response.get("valueRanges", [])
+        return {
+            range_name: sheet_utils.fill_range_gaps(range_name, value_range.get("values", []))
+            for range_name, value_range in zip(ranges, value_ranges)
+        }
+
+    def batch_read_unformatted(self, ranges: list[str]) -> dict[str, CellValues]:
+        response = self._sheet.values_batch_get(ranges=ranges, params={"valueRenderOption": "UNFORMATTED_VALUE"})
+
+        value_ranges = response.get("valueRanges", [])
+        return {range_name: value_range.get("values", []) for range_name, value_range in zip(ranges, value_ranges)}
+
+    def begin_batch(self) -> None:
+        self._batch.open()
+
+    def flush(self) -> None:
+        contents = self._batch.close()
+
+        if len(contents.value_ranges) > 0:
+            self._sheet.values_batch_update(
+                body={
+                    "valueInputOption": "RAW",
+                    "data": [
+                        {"range": range_value.range, "values": range_value.values}
+                        for range_value in contents.value_ranges
+                    ],
+                }
+            )
+
+        # Sort and format requests for every worksheet are sent together after the values that they depend on.
+        if not contents.requests.is_empty():
+            self._sheet.batch_update(contents.requests.body())
+
+    def _gspread_worksheet(self, worksheet_name: str) -> gspread.worksheet.Worksheet:
+        if worksheet_name not in self._gspread_worksheets:
+            self.sheet_metadata()
+            try:
+                properties = self._worksheet_properties[worksheet_name]
+            except KeyError:
+                raise gspread.exceptions.WorksheetNotFound(worksheet_name)
+
+            self._gspread_worksheets[worksheet_name] = gspread.worksheet.Worksheet(
+                spreadsheet=self._sheet,
+                properties=properties,
+                spreadsheet_id=self._sheet.id,
+                client=self._sheet.client,
+            )
+
+        return self._gspread_worksheets[worksheet_name]
@@ -0,0 +1,131 @@
+from typing import Iterable, NamedTuple
+
+from google_sheet import utils as sheet_utils
+from google_sheet.worksheet import CellValues, CellValueType, RangeValues
+
+
+class CurrentValues:
+    """Values that are currently stored in a region of a worksheet.
+
+    The values must be the underlying values of the cells, as read with `GoogleSheetController.batch_read_unformatted`.
+    Displayed values can't be used, since a number format may display different values the same way, e.g. 72.4 as
+    "72".
+
+    The values are anchored at a start cell, e.g. the values of a "B6:AD" range are anchored at "B6". Cells outside of
+    the values are considered empty, which matches how the Sheets API omits trailing empty rows and cells.
+    """
+
+    def __init__(self, values: CellValues, start_cell: str) -> None:
+        self._values = values
+        (self._start_row, self._start_col) = sheet_utils.a1_to_rowcol(start_cell)
+
+    def cell_value(self, row: int, col: int) -> CellValueType:
+        """The value of a cell, by its 1-based worksheet row and column."""
+        row_idx = row - self._start_row
+        col_idx = col - self._start_col
+        if row_idx < 0 or col_idx < 0 or row_idx >= len(self._values):
+            return None
+
+        row_values = self._values[row_idx]
+        if col_idx >= len(row_values):
+            return None
+
+        return row_values[col_idx]
+
+
+class _ChangedRun(NamedTuple):
+    # First and last columns, relative to the start of the write range, of consecutive changed cells in a row.
+    start_col_idx: int
+    end_col_idx: int
+
+
+def is_value_unchanged(value: CellValueType, current: CellValueType) -> bool:
+    """Whether writing a value would leave the current value of a cell unchanged.
+
+    Values must be exactly equal, except that a written 4 matches a current 4.0, since the Sheets API stores every
+    number as a double, and that empty strings and missing values are both empty cells. A number never matches a
+    string, so a cell is never skipped unless it's known to already hold the value.
+    """
+    if value is None or value == "":
+        return current is None or current == ""
+
+    if isinstance(value, bool) or isinstance(current, bool):
+        return type(value) is type(current) and value == current
+
+    if isinstance(value, (int, float)):
+        return isinstance(current, (int, float)) and value == current
+
+    return isinstance(current, str) and value == current
+
+
+def changed_range_values(write_ranges: Iterable[RangeValues], current: CurrentValues) -> list[RangeValues]:
+    """Reduce ranges that would be written to the ranges containing cells whose values would change.
+
+    Contiguous changed cells in a row are grouped, and groups spanning the same columns in consecutive rows are
+    coalesced into a single rectangular range.
+    """
+    changed_ranges: list[RangeValues] = []
+    for write_range in write_ranges:
+        changed_ranges.extend(_changed_range_values(write_range, current))
+
+    return changed_ranges
+
+
+def _changed_range_values(write_range: RangeValues, current: CurrentValues) -> list[RangeValues]:
+    start_cell = write_range.range.split(":")[0]
+    (start_row, start_col) = sheet_utils.a1_to_rowcol(start_cell)
+
+    changed_ranges: list[RangeValues] = []
+    # Rectangles that are still being extended, keyed by their column span. Each holds the row offset of its first
+    # row and its values.
+    open_rectangles: dict[_ChangedRun, tuple[int, list[list[CellValueType]]]] = {}
+
+    for row_idx, row_values in enumerate(write_range.values):
+        row_runs = _changed_runs(row_values, current, row=start_row + row_idx, start_col=start_col)
+
+        # Rectangles that don't continue into this row are complete.
+        for run in list(open_rectangles.keys()):
+            if run not in row_runs:
+                (first_row_idx, values) = open_rectangles.pop(run)
+                changed_ranges.append(_rectangle(start_row + first_row_idx, start_col, run, values))
+
+        for run in row_runs:
+            run_values = row_values[run.start_col_idx : run.end_col_idx + 1]
+            if run in open_rectangles:
+                open_rectangles[run][1].append(run_values)
+            else:
+                open_rectangles[run] = (row_idx, [run_values])
+
+    for run, (first_row_idx, values) in open_rectangles.items():
+        changed_ranges.append(_rectangle(start_row + first_row_idx, start_col, run, values))
+
+    return changed_ranges
+
+
+def _changed_runs(
+    row_values: list[CellValueType],
+    current: CurrentValues,
+    row: int,
+    start_col: int,
+) -> list[_ChangedRun]:
+    runs: list[_ChangedRun] = []
+    run_start: int | None = None
+
+    for col_idx, value in enumerate(row_values):
+        is_changed = not is_value_unchanged(value, current.cell_value(row=row, col=start_col + col_idx))
+        if is_changed and run_start is None:
+            run_start = col_idx
+        elif not is_changed and run_start is not None:
+            runs.append(_ChangedRun(run_start, col_idx - 1))
+            run_start = None
+
+    if run_start is not None:
+        runs.append(_ChangedRun(run_start, len(row_values) - 1))
+
+    return runs
+
+
+def _rectangle(first_row: int, start_col: int, run: _ChangedRun, values: list[list[CellValueType]]) -> RangeValues:
+    first_cell = sheet_utils.rowcol_to_a1(row=first_row, col=start_col + run.start_col_idx)
+    last_cell = sheet_utils.rowcol_to_a1(row=first_row + len(values) - 1, col=start_col + run.end_col_idx)
+    return RangeValues(range=f"{first_cell}:{last_cell}", values=values)
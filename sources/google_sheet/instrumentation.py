@@ -0,0 +1,255 @@
+import json
+import pathlib
+import re
+import threading
+import time
+import urllib.parse
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Iterable, Mapping
+
+from google_sheet import utils as sheet_utils
+
+# Phase for requests that are made before the first phase is started, e.g. while opening the spreadsheet.
+SETUP_PHASE = "setup"
+
+_SPREADSHEET_ENDPOINT_RE = re.compile(r"/spreadsheets/[^/:]+(?P<resource>.*)$")
+_VALUES_RANGE_RE = re.compile(r"^/values/(?P<range>[^:]+)(?P<action>:\w+)?$")
+
+
+@dataclass(frozen=True)
+class ApiCall:
+    phase: str
+    # The HTTP method and the API endpoint, e.g. "GET values:batchGet".
+    method: str
+    # Titles of the worksheets that the request reads or writes, if they can be determined from the request.
+    worksheets: tuple[str, ...]
+    # Number of value ranges read or written, or number of requests in a spreadsheets.batchUpdate.
+    range_count: int
+    request_bytes: int
+    response_bytes: int
+    # Wall time from the first attempt to the final response, which includes throttling and backoff.
+    latency_seconds: float
+    retries: int
+    status_code: int | None
+
+
+@dataclass
+class ApiCallTotals:
+    calls: int = 0
+    range_count: int = 0
+    request_bytes: int = 0
+    response_bytes: int = 0
+    latency_seconds: float = 0.0
+    retries: int = 0
+
+    def add(self, call: ApiCall) -> None:
+        self.calls += 1
+        self.range_count += call.range_count
+        self.request_bytes += call.request_bytes
+        self.response_bytes += call.response_bytes
+        self.latency_seconds += call.latency_seconds
+        self.retries += call.retries
+
+    def summary(self) -> str:
+        return (
+            f"{self.calls} calls, {self.range_count} ranges, {self.latency_seconds:.2f}s, "
+            f"{self.request_bytes / 1024:.1f} KB sent, {self.response_bytes / 1024:.1f} KB received, "
+            f"{self.retries} retries"
+        )
+
+
+@dataclass
+class PhaseTiming:
+    phase: str
+    seconds: float = 0.0
+
+
+class ApiCallRecorder:
+    """Records every Sheets API request of a run, grouped into the phases of the run.
+
+    Phases are started in order with `start_phase`. Each phase ends when the next one starts or when `finish` is
+    called, so the recorder also reports the wall time of each phase, including phases without any requests. Requests
+    may be recorded from several threads.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter) -> None:
+        self.clock = clock
+        self._calls: list[ApiCall] = []
+        self._phases: list[PhaseTiming] = []
+
+        self._phase = SETUP_PHASE
+        self._phase_start: float | None = None
+        # Worksheet titles by worksheet ID, which identify the worksheets of spreadsheets.batchUpdate requests.
+        self._worksheet_titles: dict[int, str] = {}
+        # Guards the calls and phases, which are recorded by every thread that sends requests.
+        self._lock = threading.Lock()
+
+    @property
+    def calls(self) -> list[ApiCall]:
+        return self._calls
+
+    @property
+    def phases(self) -> list[PhaseTiming]:
+        return self._phases
+
+    def start_phase(self, phase: str) -> None:
+        with self._lock:
+            self._end_phase()
+            self._phase = phase
+            self._phase_start = self.clock()
+
+    def finish(self) -> None:
+        with self._lock:
+            self._end_phase()
+            self._phase = SETUP_PHASE
+
+    def reset(self) -> None:
+        """Discard the recorded calls and phases, e.g. once a run has been reported, to record the next run."""
+        with self._lock:
+            self._calls = []
+            self._phases = []
+            self._phase = SETUP_PHASE
+            self._phase_start = None
+
+    def register_worksheet_titles(self, worksheet_titles: Mapping[int, str]) -> None:
+        self._worksheet_titles.update(worksheet_titles)
+
+    def record_request(
+        self,
+        method: str,
+        url: str,
+        params: Mapping[str, Any] | None,
+        body: Mapping[str, Any] | None,
+        status_code: int | None,
+        response_bytes: int,
+        latency_seconds: float,
+        retries: int,
+    ) -> None:
+        (endpoint, url_ranges) = _endpoint_and_ranges(url)
+        (ranges, sheet_ids) = _request_ranges_and_sheet_ids(params, body)
+        ranges = url_ranges + ranges
+
+        worksheets = [sheet_utils.split_range_name(range_name)[0] for range_name in ranges]
+        worksheets += [self._worksheet_titles.get(sheet_id, f"#{sheet_id}") for sheet_id in sheet_ids]
+
+        range_count = len(ranges)
+        if body is not None and "requests" in body:
+            range_count = len(body["requests"])
+
+        with self._lock:
+            self._calls.append(
+                ApiCall(
+                    phase=self._phase,
+                    method=f"{method.upper()} {endpoint}",
+                    worksheets=tuple(dict.fromkeys(worksheets)),
+                    range_count=range_count,
+                    request_bytes=len(json.dumps(body).encode()) if body is not None else 0,
+                    response_bytes=response_bytes,
+                    latency_seconds=latency_seconds,
+                    retries=retries,
+                    status_code=status_code,
+                )
+            )
+
+    def totals_by(self, key: Callable[[ApiCall], Iterable[str]]) -> dict[str, ApiCallTotals]:
+        """Totals of the recorded calls grouped by a key. A call is counted in every group that it's keyed to."""
+        totals: dict[str, ApiCallTotals] = {}
+        for call in self.calls:
+            for group in key(call):
+                totals.setdefault(group, ApiCallTotals()).add(call)
+
+        return totals
+
+    def report(self) -> dict[str, Any]:
+        return {
+            "phases": [asdict(timing) for timing in self.phases],
+            "by_phase": _asdicts(self.totals_by(lambda call: [call.phase])),
+            "by_method": _asdicts(self.totals_by(lambda call: [call.method])),
+            "by_worksheet": _asdicts(self.totals_by(lambda call: call.worksheets)),
+            "calls": [asdict(call) for call in self.calls],
+        }
+
+    def write_json(self, path: pathlib.Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.report(), indent=2))
+
+    def summary(self) -> str:
+        totals_by_phase = self.totals_by(lambda call: [call.phase])
+        lines = ["Sheets API calls by phase:"]
+        for phase in dict.fromkeys([timing.phase for timing in self.phases] + list(totals_by_phase.keys())):
+            phase_seconds = sum(timing.seconds for timing in self.phases if timing.phase == phase)
+            phase_totals = totals_by_phase.get(phase, ApiCallTotals())
+            lines.append(f"  {phase} ({phase_seconds:.2f}s): {phase_totals.summary()}")
+
+        totals_by_worksheet = self.totals_by(lambda call: call.worksheets)
+        if len(totals_by_worksheet) > 0:
+            lines.append("Sheets API calls by worksheet, slowest first:")
+            for worksheet, totals in sorted(totals_by_worksheet.items(), key=lambda item: -item[1].latency_seconds):
+                lines.append(f"  {worksheet}: {totals.summary()}")
+
+        return "\n".join(lines)
+
+    def _end_phase(self) -> None:
+        if self._phase_start is not None:
+            self._phases.append(PhaseTiming(phase=self._phase, seconds=self.clock() - self._phase_start))
+            self._phase_start = None
+
+
+def _asdicts(totals: dict[str, ApiCallTotals]) -> dict[str, dict[str, Any]]:
+    return {group: asdict(group_totals) for group, group_totals in totals.items()}
+
+
+def _endpoint_and_ranges(url: str) -> tuple[str, list[str]]:
+    """The endpoint of a request URL with any IDs removed, and any range in the URL itself."""
+    path = urllib.parse.urlparse(url).path
+    match = _SPREADSHEET_ENDPOINT_RE.search(path)
+    if match is None:
+        # Drive API requests, e.g. for the spreadsheet's modified time.
+        return ("drive" if "/drive/" in path else path, [])
+
+    resource = match.group("resource")
+    if resource == "":
+        return ("spreadsheets", [])
+
+    if resource.startswith(":"):
+        return (f"spreadsheets{resource}", [])
+
+    values_match = _VALUES_RANGE_RE.match(resource)
+    if values_match is not None:
+        range_name = urllib.parse.unquote(values_match.group("range"))
+        return (f"values{values_match.group('action') or ''}", [range_name])
+
+    return (resource.lstrip("/"), [])
+
+
+def _request_ranges_and_sheet_ids(
+    params: Mapping[str, Any] | None,
+    body: Mapping[str, Any] | None,
+) -> tuple[list[str], list[int]]:
+    ranges: list[str] = []
+    sheet_ids: list[int] = []
+
+    if params is not None and "ranges" in params:
+        param_ranges = params["ranges"]
+        ranges.extend([param_ranges] if isinstance(param_ranges, str) else param_ranges)
+
+    if body is not None:
+        ranges.extend(value_range["range"] for value_range in body.get("data", []))
+        for request in body.get("requests", []):
+            sheet_ids.extend(_sheet_ids(request))
+
+    return (ranges, sheet_ids)
+
+
+def _sheet_ids(request: Any) -> list[int]:
+    """IDs of the worksheets that a spreadsheets.batchUpdate request applies to, from the grid ranges it holds."""
+    if isinstance(request, dict):
+        sheet_ids = [request["sheetId"]] if "sheetId" in request else []
+        for value in request.values():
+            sheet_ids.extend(_sheet_ids(value))
+        return sheet_ids
+
+    if isinstance(request, list):
+        return [sheet_id for item in request for sheet_id in _sheet_ids(item)]
+
+    return []
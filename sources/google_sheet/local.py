@@ -0,0 +1,477 @@
+"""A file-backed stand-in for a Google spreadsheet.
+
+A local workbook is a directory holding one JSON file per worksheet. Each file holds the worksheet's title, its
+values as a grid of rows and the background colors of any formatted cells:
+
+    {
+        "title": "Players",
+        "values": [["Golfer", "Gender"], ["John Doe", "Male"]],
+        "formats": {"C6": {"background_color": [217, 234, 211]}}
+    }
+
+Files are named by `worksheet_file_name`, since titles may not be valid file names. A file without a title, e.g. one
+written by hand, holds the worksheet titled by the file's name, e.g. "Players.json".
+
+Values are the worksheet's displayed values. Values that are written by the controller are stored as they were
+written (e.g. as numbers) and are read back the way the Sheets API would display them with the default number
+format. Formulas are not evaluated.
+"""
+
+import hashlib
+import json
+import pathlib
+import re
+from typing import Any, Callable, Iterable, Mapping, NamedTuple
+
+import gspread
+from gspread import utils as gspread_utils
+
+from google_sheet import controller, worksheet
+from google_sheet import utils as sheet_utils
+from google_sheet.worksheet import CellValues
+
+WORKSHEET_FILE_SUFFIX = ".json"
+# File names are kept well within the limits of every platform.
+MAX_WORKSHEET_FILE_SLUG_LENGTH = 64
+
+
+class LocalWorkbookError(Exception):
+    """Exception to be raised when a local workbook can't be loaded."""
+
+
+def worksheet_file_name(title: str) -> str:
+    """The name of the file that a worksheet is saved to in a local workbook.
+
+    Titles may contain characters that aren't allowed in file names or that change the path of the file, e.g. "/" or
+    "..", so the name is a slug of the title followed by a hash of the title, which keeps the names of worksheets
+    whose slugs match distinct.
+    """
+    slug = re.sub(r"[^A-Za-z0-9]+", "-", title).strip("-")[:MAX_WORKSHEET_FILE_SLUG_LENGTH] or "worksheet"
+    title_hash = hashlib.sha256(title.encode()).hexdigest()[:8]
+    return f"{slug}-{title_hash}{WORKSHEET_FILE_SUFFIX}"
+
+
+def worksheet_file_json(title: str, data: "LocalWorksheetData") -> str:
+    return json.dumps({"title": title, **data.to_json()}, indent=2)
+
+
+class GridBounds(NamedTuple):
+    # Zero-based row and column indices. The start indices are inclusive and the end indices are exclusive.
+    start_row_idx: int
+    end_row_idx: int
+    start_col_idx: int
+    end_col_idx: int
+
+
+def displayed_value(value: worksheet.CellValueType) -> str:
+    """The value that the Sheets API displays for a written value, using the default number format."""
+    if value is None:
+        return ""
+
+    if isinstance(value, bool):
+        return str(value).upper()
+
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+
+    return str(value)
+
+
+class LocalWorksheetData:
+    """Values and formats of a single worksheet, which are held in memory."""
+
+    def __init__(
+        self,
+        values: worksheet.CellValues | None = None,
+        formats: dict[tuple[int, int], worksheet.CellFormat] | None = None,
+    ) -> None:
+        self.values: worksheet.CellValues = values if values is not None else []
+        # Cell formats keyed by zero-based row and column indices.
+        self.formats: dict[tuple[int, int], worksheet.CellFormat] = formats if formats is not None else {}
+
+    @classmethod
+    def from_json(cls, data: Mapping[str, Any]) -> "LocalWorksheetData":
+        formats = {}
+        for cell, cell_format in data.get("formats", {}).items():
+            (row, col) = sheet_utils.a1_to_rowcol(cell)
+            background_color = cell_format.get("background_color")
+            formats[(row - 1, col - 1)] = worksheet.CellFormat(
+                background_color=worksheet.ColorRgb(*background_color) if background_color is not None else None,
+            )
+
+        return cls(values=[list(row) for row in data.get("values", [])], formats=formats)
+
+    def to_json(self) -> dict[str, Any]:
+        formats = {}
+        for (row_idx, col_idx), cell_format in sorted(self.formats.items()):
+            color = cell_format.background_color
+            formats[sheet_utils.rowcol_to_a1(row=row_idx + 1, col=col_idx + 1)] = {
+                "background_color": [color.red, color.green, color.blue] if color is not None else None,
+            }
+
+        return {"values": self.values, "formats": formats}
+
+    def num_rows(self) -> int:
+        return len(self.values)
+
+    def num_cols(self) -> int:
+        return max((len(row) for row in self.values), default=0)
+
+    def bounds(self, a1_range: str) -> GridBounds:
+        """Grid bounds of an A1 range. Open-ended ranges end at the last row or column holding values."""
+        if a1_range == "":
+            return GridBounds(0, self.num_rows(), 0, self.num_cols())
+
+        grid_range = gspread_utils.a1_range_to_grid_range(a1_range)
+        return GridBounds(
+            start_row_idx=grid_range.get("startRowIndex", 0),
+            end_row_idx=grid_range.get("endRowIndex", self.num_rows()),
+            start_col_idx=grid_range.get("startColumnIndex", 0),
+            end_col_idx=grid_range.get("endColumnIndex", self.num_cols()),
+        )
+
+    def cell_value(self, row_idx: int, col_idx: int) -> worksheet.CellValueType:
+        if row_idx >= len(self.values) or col_idx >= len(self.values[row_idx]):
+            return None
+
+        return self.values[row_idx][col_idx]
+
+    def read(self, a1_range: str) -> list[list[str]]:
+        """Displayed values of a range, without trailing empty rows and cells, as returned by the Sheets API."""
+        return [[displayed_value(value) for value in row] for row in self.read_unformatted(a1_range)]
+
+    def read_unformatted(self, a1_range: str) -> worksheet.CellValues:
+        """Stored values of a range, without trailing empty rows and cells, as returned by the Sheets API."""
+        bounds = self.bounds(a1_range)
+
+        rows: worksheet.CellValues = []
+        for row_idx in range(bounds.start_row_idx, min(bounds.end_row_idx, self.num_rows())):
+            row = [self.cell_value(row_idx, col_idx) for col_idx in range(bounds.start_col_idx, bounds.end_col_idx)]
+            while len(row) > 0 and row[-1] in (None, ""):
+                row.pop()
+            rows.append(row)
+
+        while len(rows) > 0 and len(rows[-1]) == 0:
+            rows.pop()
+
+        return rows
+
+    def write(self, range_value: worksheet.RangeValues) -> None:
+        (start_row, start_col) = sheet_utils.a1_to_rowcol(range_value.range.split(":")[0])
+
+        for row_offset, row_values in enumerate(range_value.values):
+            for col_offset, value in enumerate(row_values):
+                self._set_cell_value(start_row - 1 + row_offset, start_col - 1 + col_offset, value)
+
+    def sort(self, specs: Iterable[worksheet.SortSpec], range_name: str) -> None:
+        """Sort the rows of a range, moving their values and formats, the way the Sheets API does.
+
+        Numbers sort before text and empty cells are always sorted last. The sort is stable.
+        """
+        bounds = self.bounds(range_name)
+        row_indices = list(range(bounds.start_row_idx, bounds.end_row_idx))
+
+        # Sort by each spec from the last to the first, relying on the stability of the sort to order rows by the
+        # earlier specs first.
+        for spec in reversed(list(specs)):
+            col_idx = spec.column_idx() - 1
+            empty_rows = [row_idx for row_idx in row_indices if self.cell_value(row_idx, col_idx) in (None, "")]
+            filled_rows = [row_idx for row_idx in row_indices if self.cell_value(row_idx, col_idx) not in (None, "")]
+            filled_rows.sort(
+                key=lambda row_idx: _sort_key(self.cell_value(row_idx, col_idx)),
+                reverse=spec.order == worksheet.SortOrder.DESCENDING,
+            )
+            row_indices = filled_rows + empty_rows
+
+        cols = range(bounds.start_col_idx, bounds.end_col_idx)
+        sorted_values = [[self.cell_value(row_idx, col_idx) for col_idx in cols] for row_idx in row_indices]
+        sorted_formats = [[self.formats.get((row_idx, col_idx)) for col_idx in cols] for row_idx in row_indices]
+
+        for row_offset, row_idx in enumerate(range(bounds.start_row_idx, bounds.end_row_idx)):
+            for col_offset, col_idx in enumerate(cols):
+                self._set_cell_value(row_idx, col_idx, sorted_values[row_offset][col_offset])
+
+                cell_format = sorted_formats[row_offset][col_offset]
+                if cell_format is None:
+                    self.formats.pop((row_idx, col_idx), None)
+                else:
+                    self.formats[(row_idx, col_idx)] = cell_format
+
+    def format(self, range_format: worksheet.RangeFormat) -> None:
+        # Only the fields which are set in the format are applied, as with the repeatCell requests sent to the API.
+        if range_format.format.background_color is None:
+            return
+
+        bounds = self.bounds(range_format.range)
+        for row_idx in range(bounds.start_row_idx, bounds.end_row_idx):
+            for col_idx in range(bounds.start_col_idx, bounds.end_col_idx):
+                self.formats[(row_idx, col_idx)] = range_format.format
+
+    def effective_formats(self, a1_range: str) -> list[list[worksheet.CellFormat]]:
+        bounds = self.bounds(a1_range)
+        return [
+            [self._effective_format(row_idx, col_idx) for col_idx in range(bounds.start_col_idx, bounds.end_col_idx)]
+            for row_idx in range(bounds.start_row_idx, bounds.end_row_idx)
+        ]
+
+    def _effective_format(self, row_idx: int, col_idx: int) -> worksheet.CellFormat:
+        cell_format = self.formats.get((row_idx, col_idx))
+        if cell_format is None or cell_format.background_color is None:
+            return worksheet.CellFormat(background_color=worksheet.DEFAULT_BACKGROUND_COLOR)
+
+        return cell_format
+
+    def _set_cell_value(self, row_idx: int, col_idx: int, value: worksheet.CellValueType) -> None:
+        while len(self.values) <= row_idx:
+            self.values.append([])
+
+        row = self.values[row_idx]
+        while len(row) <= col_idx:
+            row.append(None)
+
+        row[col_idx] = value
+
+
+def _sort_key(value: worksheet.CellValueType) -> tuple[int, float | str]:
+    # Values are compared the way they are displayed, so that numbers which were entered as text sort as numbers.
+    number = gspread_utils.numericise(displayed_value(value))
+    if isinstance(number, (int, float)):
+        return (0, number)
+
+    return (1, str(value).lower())
+
+
+class LocalWriteBatch:
+    """The local counterpart of `worksheet.WriteBatch`.
+
+    Operations enqueued while the batch is open are applied in the order that the Sheets API applies a batch: every
+    value write is applied before any sort or format request.
+    """
+
+    def __init__(self) -> None:
+        self._is_open = False
+        self._value_operations: list[tuple[str, Callable[[], None]]] = []
+        self._request_operations: list[tuple[str, Callable[[], None]]] = []
+
+    @property
+    def is_open(self) -> bool:
+        return self._is_open
+
+    def open(self) -> None:
+        self._is_open = True
+        self._value_operations = []
+        self._request_operations = []
+
+    def add_value_operation(self, title: str, operation: Callable[[], None]) -> None:
+        self._value_operations.append((title, operation))
+
+    def add_request_operation(self, title: str, operation: Callable[[], None]) -> None:
+        self._request_operations.append((title, operation))
+
+    def close(self) -> list[tuple[str, Callable[[], None]]]:
+        """Close the batch and return its operations, with the worksheet title each operation modifies."""
+        operations = self._value_operations + self._request_operations
+
+        self._is_open = False
+        self._value_operations = []
+        self._request_operations = []
+
+        return operations
+
+
+class LocalGoogleWorksheet(worksheet.GoogleWorksheet):
+    def __init__(
+        self,
+        title: str,
+        data: LocalWorksheetData,
+        batch: LocalWriteBatch,
+        save: Callable[[str], None],
+    ) -> None:
+        self.title = title
+        self._data = data
+        self._batch = batch
+        self._save = save
+
+    def range_values(self, range: str) -> list[list[str]]:
+        return sheet_utils.fill_range_gaps(range, self._data.read(range))
+
+    def write_range(self, range_value: worksheet.RangeValues) -> None:
+        self.write_multiple_ranges([range_value])
+
+    def write_multiple_ranges(self, range_values: Iterable[worksheet.RangeValues]) -> None:
+        range_values = list(range_values)
+
+        def write() -> None:
+            for range_value in range_values:
+                self._data.write(range_value)
+
+        self._apply(write, is_value_operation=True)
+
+    def sort_range(self, specs: Iterable[worksheet.SortSpec], range_name: str) -> None:
+        if not sheet_utils.is_range_a1_notation(range_name):
+            raise ValueError(f"The 'range' argument must be a valid A1 range name, e.g. 'A1:C6'.\nFound: {range_name}.")
+
+        specs = list(specs)
+        self._apply(lambda: self._data.sort(specs, range_name), is_value_operation=False)
+
+    def format_multiple_ranges(self, range_formats: Iterable[worksheet.RangeFormat]) -> None:
+        range_formats = list(range_formats)
+
+        def apply_formats() -> None:
+            for range_format in range_formats:
+                self._data.format(range_format)
+
+        self._apply(apply_formats, is_value_operation=False)
+
+    def range_formats(self, range: str) -> list[list[worksheet.CellFormat]]:
+        return self._data.effective_formats(range)
+
+    def _apply(self, operation: Callable[[], None], is_value_operation: bool) -> None:
+        if not self._batch.is_open:
+            operation()
+            self._save(self.title)
+        elif is_value_operation:
+            self._batch.add_value_operation(self.title, operation)
+        else:
+            self._batch.add_request_operation(self.title, operation)
+
+
+class LocalGoogleSheetController(controller.GoogleSheetController):
+    """A GoogleSheetController for a local workbook, which can be used to run seasons offline.
+
+    Every worksheet is loaded into memory when the controller is created. Writes are saved to the worksheet files
+    immediately, or when the batch is flushed while writes are being batched.
+    """
+
+    def __init__(self, workbook_dir: pathlib.Path) -> None:
+        if not workbook_dir.is_dir():
+            raise LocalWorkbookError(f"Local workbook directory does not exist: {workbook_dir}")
+
+        self._workbook_dir = workbook_dir
+        self._worksheets: dict[str, LocalWorksheetData] = {}
+        # Each worksheet is saved to the file that it was loaded from.
+        self._worksheet_files: dict[str, pathlib.Path] = {}
+        self._load_worksheets()
+        self._batch = LocalWriteBatch()
+
+    def worksheet(self, worksheet_name: str) -> worksheet.GoogleWorksheet:
+        return LocalGoogleWorksheet(
+            title=worksheet_name,
+            data=self._worksheet_data(worksheet_name),
+            batch=self._batch,
+            save=self._save_worksheet,
+        )
+
+    def sheet_metadata(self) -> Mapping[str, Any]:
+        return {
+            "spreadsheetId": self.sheet_id(),
+            "properties": {"title": self._workbook_dir.name},
+            "sheets": [
+                {
+                    "properties": {
+                        "sheetId": idx,
+                        "title": title,
+                        "index": idx,
+                        "gridProperties": {"rowCount": data.num_rows(), "columnCount": data.num_cols()},
+                    }
+                }
+                for idx, (title, data) in enumerate(self._worksheets.items())
+            ],
+        }
+
+    def invalidate_metadata(self) -> None:
+        # The worksheets are loaded from their files again, since files may have been added, removed or renamed.
+        self._load_worksheets()
+
+    def worksheet_titles(self) -> list[str]:
+        return list(self._worksheets.keys())
+
+    def sheet_id(self) -> str:
+        return self._workbook_dir.name
+
+    def revision_token(self) -> str:
+        # The files are small, so hashing their contents is cheap and catches edits made outside of the controller.
+        digest = hashlib.sha256()
+        for title in self._worksheets:
+            digest.update(title.encode())
+            digest.update(self._worksheet_file(title).read_bytes())
+
+        return digest.hexdigest()
+
+    def batch_read(self, ranges: list[str]) -> dict[str, list[list[str]]]:
+        range_values = {}
+        for range_name in ranges:
+            (title, a1_range) = sheet_utils.split_range_name(range_name)
+            values = self._worksheet_data(title).read(a1_range)
+            range_values[range_name] = sheet_utils.fill_range_gaps(range_name, values)
+
+        return range_values
+
+    def batch_read_unformatted(self, ranges: list[str]) -> dict[str, CellValues]:
+        range_values = {}
+        for range_name in ranges:
+            (title, a1_range) = sheet_utils.split_range_name(range_name)
+            range_values[range_name] = self._worksheet_data(title).read_unformatted(a1_range)
+
+        return range_values
+
+    def begin_batch(self) -> None:
+        self._batch.open()
+
+    def flush(self) -> None:
+        modified_titles: list[str] = []
+        for title, operation in self._batch.close():
+            operation()
+            if title not in modified_titles:
+                modified_titles.append(title)
+
+        for title in modified_titles:
+            self._save_worksheet(title)
+
+    def _load_worksheets(self) -> None:
+        self._worksheets = {}
+        self._worksheet_files = {}
+        for worksheet_file in sorted(self._workbook_dir.glob(f"*{WORKSHEET_FILE_SUFFIX}")):
+            try:
+                worksheet_json = json.loads(worksheet_file.read_text())
+            except json.JSONDecodeError as exc:
+                raise LocalWorkbookError(f"Worksheet file is not valid JSON: {worksheet_file}") from exc
+
+            title = worksheet_json.get("title", worksheet_file.stem)
+            if not isinstance(title, str):
+                raise LocalWorkbookError(f"Worksheet title must be a string: {worksheet_file}")
+            if title in self._worksheets:
+                raise LocalWorkbookError(
+                    f"Worksheet {title} is in more than one file: {self._worksheet_files[title]}, {worksheet_file}"
+                )
+
+            self._worksheets[title] = LocalWorksheetData.from_json(worksheet_json)
+            self._worksheet_files[title] = worksheet_file
+
+    def _worksheet_data(self, title: str) -> LocalWorksheetData:
+        try:
+            return self._worksheets[title]
+        except KeyError:
+            raise gspread.exceptions.WorksheetNotFound(title)
+
+    def _worksheet_file(self, title: str) -> pathlib.Path:
+        return self._worksheet_files[title]
+
+    def _save_worksheet(self, title: str) -> None:
+        self._worksheet_file(title).write_text(worksheet_file_json(title, self._worksheets[title]))
+
+
+def save_local_workbook(source: controller.GoogleSheetController, workbook_dir: pathlib.Path) -> None:
+    """Save the displayed values of every worksheet of a spreadsheet as a local workbook.
+
+    Formats are not copied, so every cell of the local workbook has the default format.
+    """
+    workbook_dir.mkdir(parents=True, exist_ok=True)
+
+    titles = source.worksheet_titles()
+    range_values = source.batch_read([sheet_utils.absolute_range_name(title) for title in titles])
+
+    for title, values in zip(titles, range_values.values()):
+        local_values: worksheet.CellValues = [list(row) for row in values]
+        worksheet_json = worksheet_file_json(title, LocalWorksheetData(values=local_values))
+        (workbook_dir / worksheet_file_name(title)).write_text(worksheet_json)
@@ -0,0 +1,363 @@
+import enum
+import logging
+import multiprocessing
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from http import HTTPStatus
+from multiprocessing import context as mp_context
+from typing import Any, Callable, NamedTuple, Optional
+
+import gspread
+from google.auth.credentials import Credentials
+from requests import Response, Session  # type: ignore [import-untyped]
+
+from google_sheet import instrumentation
+
+logger = logging.getLogger(__name__)
+
+
+class QuotaClass(enum.Enum):
+    """Sheets API requests are subject to separate per-minute read and write quotas."""
+
+    READ = "read"
+    WRITE = "write"
+
+    @classmethod
+    def for_method(cls, method: str) -> "QuotaClass":
+        return cls.READ if method.upper() == "GET" else cls.WRITE
+
+
+class RequestSchedulerConfig(NamedTuple):
+    read_requests_per_minute: int = 60
+    write_requests_per_minute: int = 60
+    # Number of times a throttled or failed request is retried before the error is raised.
+    max_retries: int = 5
+    initial_backoff_seconds: float = 1.0
+    max_backoff_seconds: float = 64.0
+
+    def requests_per_minute(self, quota_class: QuotaClass) -> int:
+        match quota_class:
+            case QuotaClass.READ:
+                return self.read_requests_per_minute
+            case QuotaClass.WRITE:
+                return self.write_requests_per_minute
+            case _:
+                # This should not be reachable unless a new enum variant is added without
+                # adding it to this match statement.
+                raise ValueError(f"Unknown {quota_class.__class__.__name__} enum variant.")
+
+
+@dataclass
+class QuotaClassStats:
+    requests: int = 0
+    retries: int = 0
+    # Time spent waiting for the token bucket, i.e. waiting to stay within the quota.
+    throttled_seconds: float = 0.0
+    # Time spent waiting before retrying a request that failed.
+    backoff_seconds: float = 0.0
+
+
+@dataclass
+class RequestSchedulerStats:
+    by_quota_class: dict[QuotaClass, QuotaClassStats] = field(
+        default_factory=lambda: {quota_class: QuotaClassStats() for quota_class in QuotaClass}
+    )
+
+    def __getitem__(self, quota_class: QuotaClass) -> QuotaClassStats:
+        return self.by_quota_class[quota_class]
+
+    def summary(self) -> str:
+        return ", ".join(
+            f"{quota_class.value}: {stats.requests} requests, {stats.retries} retries, "
+            f"{stats.throttled_seconds:.1f}s throttled, {stats.backoff_seconds:.1f}s backing off"
+            for quota_class, stats in self.by_quota_class.items()
+        )
+
+
+class TokenBucket:
+    """A token bucket that holds up to a minute of requests and refills continuously."""
+
+    def __init__(self, requests_per_minute: int, clock: Callable[[], float]) -> None:
+        if requests_per_minute <= 0:
+            raise ValueError(f"requests_per_minute must be positive. Found: {requests_per_minute}")
+
+        self._capacity = float(requests_per_minute)
+        self._refill_per_second = requests_per_minute / 60.0
+        self._clock = clock
+
+        self._tokens = self._capacity
+        self._last_refill = clock()
+
+    def wait_time(self) -> float:
+        """Seconds to wait until a token is available."""
+        self._refill()
+        if self._tokens >= 1.0:
+            return 0.0
+
+        return (1.0 - self._tokens) / self._refill_per_second
+
+    def take(self) -> None:
+        self._refill()
+        self._tokens -= 1.0
+
+    def _refill(self) -> None:
+        now = self._clock()
+        elapsed = now - self._last_refill
+        self._tokens = min(self._capacity, self._tokens + elapsed * self._refill_per_second)
+        self._last_refill = now
+
+
+class SharedRateLimiter:
+    """A rate limiter that can be shared by processes, e.g. the workers of a process pool.
+
+    This uses the generic cell rate algorithm (GCRA), which is equivalent to a token bucket that holds up to a minute of
+    requests, but only needs a single value to be shared: the theoretical arrival time of the next request. The limiter
+    must be passed to worker processes when they're created, e.g. with the initializer of the pool. The clock must be
+    shared by the processes, which is the case for time.monotonic.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: int,
+        clock: Callable[[], float] = time.monotonic,
+        context: mp_context.BaseContext | None = None,
+    ) -> None:
+        if requests_per_minute <= 0:
+            raise ValueError(f"requests_per_minute must be positive. Found: {requests_per_minute}")
+
+        context = context or multiprocessing.get_context()
+        self._interval_seconds = 60.0 / requests_per_minute
+        self._burst_seconds = (requests_per_minute - 1) * self._interval_seconds
+        self._clock = clock
+        self._theoretical_arrival = context.Value("d", clock())
+
+    def reserve(self) -> float:
+        """Reserve the next request, returning the seconds to wait before it's sent."""
+        with self._theoretical_arrival.get_lock():
+            now = self._clock()
+            theoretical_arrival = max(self._theoretical_arrival.value, now)
+            self._theoretical_arrival.value = theoretical_arrival + self._interval_seconds
+
+        return max(theoretical_arrival - self._burst_seconds - now, 0.0)
+
+
+class SharedRequestQuota(NamedTuple):
+    """Read and write quotas that are shared by the schedulers of several processes."""
+
+    read: SharedRateLimiter
+    write: SharedRateLimiter
+
+    @classmethod
+    def from_config(
+        cls,
+        config: RequestSchedulerConfig,
+        context: mp_context.BaseContext | None = None,
+    ) -> "SharedRequestQuota":
+        return cls(
+            read=SharedRateLimiter(config.read_requests_per_minute, context=context),
+            write=SharedRateLimiter(config.write_requests_per_minute, context=context),
+        )
+
+    def limiter(self, quota_class: QuotaClass) -> SharedRateLimiter:
+        match quota_class:
+            case QuotaClass.READ:
+                return self.read
+            case QuotaClass.WRITE:
+                return self.write
+            case _:
+                # This should not be reachable unless a new enum variant is added without
+                # adding it to this match statement.
+                raise ValueError(f"Unknown {quota_class.__class__.__name__} enum variant.")
+
+
+class RequestScheduler:
+    """Paces requests to stay within the per-minute quotas and retries requests that are throttled or fail.
+
+    When a shared quota is given, requests are paced by it instead of by the quotas in the config, so that requests
+    from several processes stay within the quotas together. Requests may be sent from several threads, which are paced
+    one at a time. The clock, sleep and random functions can be injected so that scheduling can be tested without
+    waiting.
+    """
+
+    # Status codes for errors that are expected to be transient. Server errors (5xx) are retried too.
+    RETRYABLE_STATUS_CODES = {
+        HTTPStatus.REQUEST_TIMEOUT,
+        HTTPStatus.TOO_MANY_REQUESTS,
+    }
+
+    def __init__(
+        self,
+        config: RequestSchedulerConfig = RequestSchedulerConfig(),
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+        random_fraction: Callable[[], float] = random.random,
+        shared_quota: SharedRequestQuota | None = None,
+    ) -> None:
+        self._config = config
+        self._sleep = sleep
+        self._random_fraction = random_fraction
+        self._shared_quota = shared_quota
+
+        self._buckets = {
+            quota_class: TokenBucket(config.requests_per_minute(quota_class), clock=clock) for quota_class in QuotaClass
+        }
+        self._stats = RequestSchedulerStats()
+        # Guards the buckets and the stats, which are shared by every thread that sends requests.
+        self._lock = threading.Lock()
+
+    @property
+    def stats(self) -> RequestSchedulerStats:
+        return self._stats
+
+    def send(self, quota_class: QuotaClass, request: Callable[[], Response]) -> Response:
+        """Send a request once the quota allows it, retrying transient errors with exponential backoff."""
+        stats = self._stats[quota_class]
+        with self._lock:
+            stats.requests += 1
+
+        attempt = 0
+        while True:
+            self._acquire(quota_class)
+            try:
+                return request()
+            except gspread.exceptions.APIError as err:
+                if attempt >= self._config.max_retries or not self._is_retryable(err):
+                    raise
+
+                wait = self._backoff_seconds(attempt=attempt, err=err)
+                logger.warning(
+                    f"Sheets API {quota_class.value} request failed with status {err.code}. "
+                    f"Retrying in {wait:.1f}s ({attempt + 1}/{self._config.max_retries})."
+                )
+                with self._lock:
+                    stats.retries += 1
+                    stats.backoff_seconds += wait
+                self._sleep(wait)
+                attempt += 1
+
+    def _acquire(self, quota_class: QuotaClass) -> None:
+        # The lock is held while waiting for the quota, so that requests from other threads wait their turn.
+        with self._lock:
+            self._acquire_locked(quota_class)
+
+    def _acquire_locked(self, quota_class: QuotaClass) -> None:
+        if self._shared_quota is not None:
+            self._wait_for_quota(quota_class, self._shared_quota.limiter(quota_class).reserve())
+            return
+
+        bucket = self._buckets[quota_class]
+        self._wait_for_quota(quota_class, bucket.wait_time())
+        bucket.take()
+
+    def _wait_for_quota(self, quota_class: QuotaClass, wait: float) -> None:
+        if wait > 0:
+            self._stats[quota_class].throttled_seconds += wait
+            self._sleep(wait)
+
+    def _is_retryable(self, err: gspread.exceptions.APIError) -> bool:
+        if err.code in self.RETRYABLE_STATUS_CODES or err.code >= HTTPStatus.INTERNAL_SERVER_ERROR:
+            return True
+
+        # The Drive API reports exceeded quotas as 403 errors in the usage limits domain.
+        errors = err.error.get("errors", [])
+        return err.code == HTTPStatus.FORBIDDEN and any(error.get("domain") == "usageLimits" for error in errors)
+
+    def _backoff_seconds(self, attempt: int, err: gspread.exceptions.APIError) -> float:
+        retry_after = _retry_after_seconds(err.response)
+        if retry_after is not None:
+            return min(retry_after, self._config.max_backoff_seconds)
+
+        # Exponential backoff with up to a second of random jitter, so that concurrent runs don't retry in lockstep.
+        backoff = self._config.initial_backoff_seconds * 2**attempt + self._random_fraction()
+        return min(backoff, self._config.max_backoff_seconds)
+
+
+def _retry_after_seconds(response: Response) -> float | None:
+    retry_after = response.headers.get("Retry-After")
+    if retry_after is None:
+        return None
+
+    try:
+        return float(retry_after)
+    except ValueError:
+        # Retry-After may also be an HTTP date, which isn't used by the Google APIs.
+        return None
+
+
+class ScheduledHTTPClient(gspread.http_client.HTTPClient):
+    """A gspread HTTP client which sends every request through a RequestScheduler.
+
+    When a recorder is given, every request is recorded once it completes, along with the number of times it was
+    retried.
+    """
+
+    def __init__(
+        self,
+        auth: Credentials,
+        session: Optional[Session] = None,
+        scheduler: RequestScheduler | None = None,
+        recorder: instrumentation.ApiCallRecorder | None = None,
+    ) -> None:
+        super().__init__(auth=auth, session=session)
+        self.scheduler = scheduler or RequestScheduler()
+        self.recorder = recorder
+
+    @classmethod
+    def from_http_client(
+        cls,
+        http_client: gspread.http_client.HTTPClient,
+        scheduler: RequestScheduler,
+        recorder: instrumentation.ApiCallRecorder | None = None,
+    ) -> "ScheduledHTTPClient":
+        """Create a client that shares the state of an existing client, i.e. its authorized session and timeout."""
+        scheduled_http_client = cls.__new__(cls)
+        scheduled_http_client.__dict__.update(vars(http_client))
+        scheduled_http_client.scheduler = scheduler
+        scheduled_http_client.recorder = recorder
+
+        return scheduled_http_client
+
+    def request(self, method: str, endpoint: str, *args: Any, **kwargs: Any) -> Response:
+        attempts = 0
+
+        def send() -> Response:
+            nonlocal attempts
+            attempts += 1
+            return super(ScheduledHTTPClient, self).request(method, endpoint, *args, **kwargs)
+
+        if self.recorder is None:
+            return self.scheduler.send(quota_class=QuotaClass.for_method(method), request=send)
+
+        start = self.recorder.clock()
+        status_code: int | None = None
+        response_bytes = 0
+        try:
+            response = self.scheduler.send(quota_class=QuotaClass.for_method(method), request=send)
+            status_code = response.status_code
+            response_bytes = len(response.content)
+            return response
+        except gspread.exceptions.APIError as err:
+            status_code = err.code
+            raise
+        finally:
+            self.recorder.record_request(
+                method=method,
+                url=endpoint,
+                params=kwargs.get("params"),
+                body=kwargs.get("json"),
+                status_code=status_code,
+                response_bytes=response_bytes,
+                latency_seconds=self.recorder.clock() - start,
+                retries=max(attempts - 1, 0),
+            )
+
+
+def schedule_gspread_client(
+    gspread_client: gspread.client.Client,
+    scheduler: RequestScheduler,
+    recorder: instrumentation.ApiCallRecorder | None = None,
+) -> None:
+    """Send all requests that are made by a gspread client, and the spreadsheets it opens, through a scheduler."""
+    gspread_client.http_client = ScheduledHTTPClient.from_http_client(gspread_client.http_client, scheduler, recorder)
@@ -1,8 +1,17 @@
-import pandas as pd
+from collections import Counter
+from typing import TYPE_CHECKING
+
 from gspread import utils as gspread_utils
 
+# pandas is slow to import and is only needed to parse worksheet data, so it's imported where it's used. Runs that
+# reuse a read snapshot never import it.
+if TYPE_CHECKING:
+    import pandas as pd
+
 a1_to_rowcol = gspread_utils.a1_to_rowcol
 rowcol_to_a1 = gspread_utils.rowcol_to_a1
+absolute_range_name = gspread_utils.absolute_range_name
+fill_gaps = gspread_utils.fill_gaps
 
 
 def is_cell_a1_notation(cell_name: str) -> bool:
@@ -33,6 +42,23 @@ def is_range_a1_notation(range_name: str) -> bool:
     return is_a1_notation
 
 
+def split_range_name(range_name: str) -> tuple[str, str]:
+    """Split a worksheet-qualified range name into its worksheet title and A1 range.
+
+    Ex:
+      - "'Event 1'!B6:AD" -> ("Event 1", "B6:AD")
+      - "'Players'" -> ("Players", "")
+    """
+    (title, separator, a1_range) = range_name.rpartition("!")
+    if separator == "":
+        (title, a1_range) = (range_name, "")
+
+    if len(title) >= 2 and title.startswith("'") and title.endswith("'"):
+        title = title[1:-1].replace("''", "'")
+
+    return (title, a1_range)
+
+
 def column_idx_to_letter(col_idx: int) -> str:
     dummy_row_idx = 1
     cell_name = gspread_utils.rowcol_to_a1(row=dummy_row_idx, col=col_idx)
@@ -45,11 +71,92 @@ def column_letter_to_idx(col_letter: str) -> int:
     return gspread_utils.column_letter_to_index(col_letter)
 
 
-def numericise_all_values(data: pd.DataFrame) -> pd.DataFrame:
+def numericise_all_values(data: "pd.DataFrame") -> "pd.DataFrame":
     return data.map(gspread_utils.numericise)
 
 
-def replace_empty_strings_with_none(data: pd.DataFrame) -> pd.DataFrame:
+def numericise_grid(data: "pd.DataFrame") -> "pd.DataFrame":
+    """Parse a grid of displayed values into numbers, a column at a time.
+
+    This is a vectorized counterpart of `numericise_all_values` for grids that should only hold numbers. Empty cells
+    become NaN. Cells that can't be parsed as finite numbers keep their values, so that they can be located with
+    `first_cell_position` and reported.
+    """
+    import pandas as pd
+
+    if data.empty:
+        return data
+
+    # Commas separating thousands are removed, as by gspread's numericise.
+    cleaned = data.apply(lambda column: column.str.replace(",", "", regex=False))
+    numbers = cleaned.apply(pd.to_numeric, errors="coerce")
+
+    is_invalid = ~is_finite_number(numbers) & (data != "")
+    if not is_invalid.to_numpy().any():
+        return numbers
+
+    return numbers.astype(object).where(~is_invalid, data)
+
+
+def is_finite_number(data: "pd.DataFrame") -> "pd.DataFrame":
+    """A mask of the cells in a grid that hold finite numbers."""
+    import pandas as pd
+
+    numbers = data.apply(pd.to_numeric, errors="coerce")
+    return numbers.notna() & (numbers.abs() != float("inf"))
+
+
+def first_cell_position(mask: "pd.DataFrame") -> tuple[int, int] | None:
+    """Zero-based row and column positions of the first cell, in row-major order, that is set in a mask."""
+    (row_positions, col_positions) = mask.to_numpy().nonzero()
+    if len(row_positions) == 0:
+        return None
+
+    return (int(row_positions[0]), int(col_positions[0]))
+
+
+def replace_empty_strings_with_none(data: "pd.DataFrame") -> "pd.DataFrame":
     data_out = data.copy()
     data_out[data_out == ""] = None
     return data_out
+
+
+def fill_range_gaps(range_name: str, values: list[list[str]]) -> list[list[str]]:
+    """Pad the raw values returned for a range so that they form a rectangle.
+
+    The Sheets API drops trailing empty rows and cells. Bounded ranges (e.g. "'Sheet1'!A1:C6") are padded to the full
+    size of the range, which matches the `maintain_size` option of gspread's `get_values`. Open-ended ranges (e.g.
+    "'Sheet1'!A1:C" or "'Sheet1'") are padded to the width of their longest row.
+    """
+    if gspread_utils.is_full_a1_notation(range_name):
+        grid_range = gspread_utils.a1_range_to_grid_range(gspread_utils.get_a1_from_absolute_range(range_name))
+        rows = grid_range["endRowIndex"] - grid_range["startRowIndex"]
+        cols = grid_range["endColumnIndex"] - grid_range["startColumnIndex"]
+        return gspread_utils.fill_gaps(values, rows=rows, cols=cols)
+
+    if len(values) == 0:
+        return []
+
+    return gspread_utils.fill_gaps(values)
+
+
+def records_df(values: list[list[str]], header_row: int = 1) -> "pd.DataFrame":
+    """Build a dataframe of records from values that were already read from a worksheet.
+
+    This mirrors gspread's `Worksheet.get_all_records`: the header row provides the column labels and the values in
+    the rows below it are numericised.
+    """
+    import pandas as pd
+
+    if len(values) < header_row:
+        return pd.DataFrame()
+
+    padded_values = gspread_utils.fill_gaps(values)
+    headers = padded_values[header_row - 1]
+
+    duplicate_headers = [header for header, count in Counter(headers).items() if count > 1]
+    if len(duplicate_headers) > 0:
+        raise ValueError(f"The header row in the worksheet contains duplicates: {duplicate_headers}")
+
+    rows = [gspread_utils.numericise_all(row) for row in padded_values[header_row:]]
+    return pd.DataFrame.from_records(gspread_utils.to_records(headers, rows))
@@ -1,15 +1,19 @@
+import abc
 import enum
-from typing import Any, Iterable, Literal, NamedTuple, Optional, Self
+from typing import TYPE_CHECKING, Any, Iterable, Literal, NamedTuple, Optional, Self
 
 import gspread
-
-# gspread_formatting doesn't have type hints or stubs available
-import gspread_formatting  # type: ignore [import-untyped]
-import pandas as pd
 from gspread import utils as gspread_utils
 
 from google_sheet import utils as sheet_utils
 
+# Both are slow to import. gspread_formatting is only used in type hints, and pandas is only needed to convert
+# worksheet data to and from dataframes, so it's imported where it's used.
+if TYPE_CHECKING:
+    # gspread_formatting doesn't have type hints or stubs available
+    import gspread_formatting  # type: ignore [import-untyped]
+    import pandas as pd
+
 CellValueType = str | float | int | None
 CellValues = list[list[CellValueType]]
 
@@ -48,7 +52,16 @@ class ColorRgb:
         }
 
     @classmethod
-    def from_color(cls, color: gspread_formatting.Color) -> Self:
+    def from_google_api_dict(cls, color: dict[str, float]) -> Self:
+        """Create a ColorRgb from a Google API color. The API omits color components with a value of 0."""
+        return cls(
+            red=round(color.get("red", 0.0) * cls.max_rgb_int),
+            green=round(color.get("green", 0.0) * cls.max_rgb_int),
+            blue=round(color.get("blue", 0.0) * cls.max_rgb_int),
+        )
+
+    @classmethod
+    def from_color(cls, color: "gspread_formatting.Color") -> Self:
         """Create a ColorRgb from a Color object. Convert float RGB values to integer RGB values."""
         return cls(
             red=round(color.red * cls.max_rgb_int),
@@ -86,6 +99,52 @@ class CellFormat(NamedTuple):
         return api_json
 
 
+# The effective background color of cells that were never formatted.
+DEFAULT_BACKGROUND_COLOR = ColorRgb(red=255, green=255, blue=255)
+
+# Fields mask for reading effective formats, which keeps the spreadsheets.get response to the formats that CellFormat
+# represents.
+EFFECTIVE_FORMAT_FIELDS = "sheets.data.rowData.values.effectiveFormat.backgroundColor"
+
+
+def range_formats_from_grid_data(range_name: str, row_data: list[dict[str, Any]]) -> list[list[CellFormat]]:
+    """Build a 2-D array of effective cell formats from the grid data of a spreadsheets.get response.
+
+    The API omits trailing cells and rows without data. Bounded ranges are padded to the full size of the range and
+    open-ended ranges are padded to the width of their longest row. Cells without an effective format have the
+    default format.
+    """
+    grid_range = gspread_utils.a1_range_to_grid_range(range_name)
+    num_rows = grid_range["endRowIndex"] - grid_range["startRowIndex"] if "endRowIndex" in grid_range else len(row_data)
+    num_cols = (
+        grid_range["endColumnIndex"] - grid_range["startColumnIndex"]
+        if "endColumnIndex" in grid_range
+        else max((len(row.get("values", [])) for row in row_data), default=0)
+    )
+
+    formats: list[list[CellFormat]] = []
+    for row_idx in range(num_rows):
+        row_values = row_data[row_idx].get("values", []) if row_idx < len(row_data) else []
+        formats.append(
+            [
+                _cell_format_from_effective_format(row_values[col_idx].get("effectiveFormat", {}))
+                if col_idx < len(row_values)
+                else CellFormat(background_color=DEFAULT_BACKGROUND_COLOR)
+                for col_idx in range(num_cols)
+            ]
+        )
+
+    return formats
+
+
+def _cell_format_from_effective_format(effective_format: dict[str, Any]) -> CellFormat:
+    background_color = effective_format.get("backgroundColor")
+    if background_color is None:
+        return CellFormat(background_color=DEFAULT_BACKGROUND_COLOR)
+
+    return CellFormat(background_color=ColorRgb.from_google_api_dict(background_color))
+
+
 class RangeFormat(NamedTuple):
     # Range in A-1 range notation
     range: str
@@ -110,6 +169,17 @@ class SortOrder(enum.Enum):
                 # adding it to this match statement.
                 raise ValueError(f"Unknown {self.__class__.__name__} enum variant.")
 
+    def google_api_sort_order(self) -> Literal["ASCENDING", "DESCENDING"]:
+        match self:
+            case SortOrder.ASCENDING:
+                return "ASCENDING"
+            case SortOrder.DESCENDING:
+                return "DESCENDING"
+            case _:
+                # This should not be reachable unless a new enum variant is added without
+                # adding it to this match statement.
+                raise ValueError(f"Unknown {self.__class__.__name__} enum variant.")
+
 
 class SortSpec(NamedTuple):
     column: str
@@ -118,16 +188,167 @@ class SortSpec(NamedTuple):
     def column_idx(self) -> int:
         return gspread_utils.column_letter_to_index(self.column)
 
+    def as_google_api_dict(self) -> dict[str, Any]:
+        return {
+            # The dimension index is relative to the worksheet, not the sorted range.
+            "dimensionIndex": self.column_idx() - 1,
+            "sortOrder": self.order.google_api_sort_order(),
+        }
+
+
+class BatchUpdateRequestBuilder:
+    """Builds the requests for a single spreadsheets.batchUpdate call.
+
+    Sort and format requests for any number of worksheets can be collected in one builder. The API applies requests
+    in the order in which they were added, so a format request that is added after a sort request for the same
+    range is applied to the sorted rows.
+    """
+
+    def __init__(self) -> None:
+        self._requests: list[dict[str, Any]] = []
+
+    @property
+    def requests(self) -> list[dict[str, Any]]:
+        return self._requests
+
+    def is_empty(self) -> bool:
+        return len(self._requests) == 0
+
+    def body(self) -> dict[str, Any]:
+        return {"requests": self._requests}
+
+    def extend(self, other: "BatchUpdateRequestBuilder") -> None:
+        self._requests.extend(other.requests)
+
+    def add_sort_range(self, sheet_id: int, specs: Iterable[SortSpec], range_name: str) -> None:
+        self._requests.append(
+            {
+                "sortRange": {
+                    "range": gspread_utils.a1_range_to_grid_range(range_name, sheet_id),
+                    "sortSpecs": [spec.as_google_api_dict() for spec in specs],
+                }
+            }
+        )
+
+    def add_format_ranges(self, sheet_id: int, range_formats: Iterable[RangeFormat]) -> None:
+        for range_format in range_formats:
+            cell_format = range_format.format.as_google_api_dict()
+            self._requests.append(
+                {
+                    "repeatCell": {
+                        "range": gspread_utils.a1_range_to_grid_range(range_format.range, sheet_id),
+                        "cell": {"userEnteredFormat": cell_format},
+                        "fields": f"userEnteredFormat({','.join(cell_format.keys())})",
+                    }
+                }
+            )
+
+
+class WriteBatchContents(NamedTuple):
+    # Values to be written, with ranges qualified by their worksheet name.
+    value_ranges: list[RangeValues]
+    # Sort and format requests that must be applied after the values are written.
+    requests: BatchUpdateRequestBuilder
+
+
+class WriteBatch:
+    """Worksheet writes that are buffered so that they can be sent to the Sheets API together.
+
+    A batch is shared by a spreadsheet controller and all of the worksheets that it creates. While the batch is open,
+    values written to any worksheet are enqueued with worksheet-qualified A1 ranges and sort and format requests, which
+    depend on those values, are collected to be sent after the values have been written.
+    """
+
+    def __init__(self) -> None:
+        self._is_open = False
+        self._value_ranges: list[RangeValues] = []
+        self._requests = BatchUpdateRequestBuilder()
+
+    @property
+    def is_open(self) -> bool:
+        return self._is_open
+
+    def open(self) -> None:
+        """Open the batch. Anything left in a batch that was never closed is discarded."""
+        self._is_open = True
+        self._value_ranges = []
+        self._requests = BatchUpdateRequestBuilder()
+
+    def add_value_ranges(self, value_ranges: Iterable[RangeValues]) -> None:
+        self._value_ranges.extend(value_ranges)
+
+    def add_requests(self, requests: BatchUpdateRequestBuilder) -> None:
+        self._requests.extend(requests)
+
+    def close(self) -> WriteBatchContents:
+        """Close the batch and return everything that was enqueued while it was open."""
+        contents = WriteBatchContents(
+            value_ranges=self._value_ranges,
+            requests=self._requests,
+        )
+
+        self._is_open = False
+        self._value_ranges = []
+        self._requests = BatchUpdateRequestBuilder()
 
-class GoogleWorksheet:
-    def __init__(self, worksheet: gspread.worksheet.Worksheet) -> None:
+        return contents
+
+
+class GoogleWorksheet(abc.ABC):
+    @abc.abstractmethod
+    def range_values(self, range: str) -> list[list[str]]:
+        """Displayed values of a range, padded to the full size of the range."""
+        pass
+
+    def column_range_values(self, column: str, first_row: int, last_row: int) -> list[str]:
+        range = f"{column}{first_row}:{column}{last_row}"
+        range_values = self.range_values(range=range)
+
+        # range_values is a list of lists where the inner lists hold
+        # row values with a length of 1. Flatten the inner lists to
+        # produce a 1-D array.
+        return [row[0] for row in range_values]
+
+    @abc.abstractmethod
+    def write_range(self, range_value: RangeValues) -> None:
+        pass
+
+    @abc.abstractmethod
+    def write_multiple_ranges(self, range_values: Iterable[RangeValues]) -> None:
+        pass
+
+    @abc.abstractmethod
+    def sort_range(self, specs: Iterable[SortSpec], range_name: str) -> None:
+        pass
+
+    @abc.abstractmethod
+    def format_multiple_ranges(self, range_formats: Iterable[RangeFormat]) -> None:
+        pass
+
+    @abc.abstractmethod
+    def range_formats(self, range: str) -> list[list[CellFormat]]:
+        """Effective formats of every cell in a range, read in a single request."""
+        pass
+
+    def cell_format(self, cell: str) -> CellFormat:
+        if not sheet_utils.is_cell_a1_notation(cell):
+            raise ValueError(f"Cell must be in A1 notation: {cell}.")
+
+        return self.range_formats(cell)[0][0]
+
+
+class ConcreteGoogleWorksheet(GoogleWorksheet):
+    def __init__(self, worksheet: gspread.worksheet.Worksheet, batch: WriteBatch | None = None) -> None:
         self.worksheet = worksheet
+        self._batch = batch
 
     def to_df(
         self,
         header_row: int = 1,
         expected_headers: Any | None = None,
-    ) -> pd.DataFrame:
+    ) -> "pd.DataFrame":
+        import pandas as pd
+
         return pd.DataFrame.from_records(
             self.worksheet.get_all_records(head=header_row, expected_headers=expected_headers)
         )
@@ -138,20 +359,13 @@ class GoogleWorksheet:
     ) -> list[list[str]]:
         return self.worksheet.get_values(range_name=range, maintain_size=True)
 
-    def column_range_values(self, column: str, first_row: int, last_row: int) -> list[str]:
-        range = f"{column}{first_row}:{column}{last_row}"
-        range_values = self.range_values(range=range)
-
-        # range_values is a list of lists where the inner lists hold
-        # row values with a length of 1. Flatten the inner lists to
-        # produce a 1-D array.
-        return [row[0] for row in range_values]
-
     def range_to_df(
         self,
         range: str,
         has_header_row: bool = False,
-    ) -> pd.DataFrame:
+    ) -> "pd.DataFrame":
+        import pandas as pd
+
         values: list[list[str]] = self.worksheet.get_values(range_name=range, maintain_size=True)
 
         columns = None
@@ -161,7 +375,7 @@ class GoogleWorksheet:
 
         return pd.DataFrame.from_records(values, columns=columns)
 
-    def write_df(self, data: pd.DataFrame) -> None:
+    def write_df(self, data: "pd.DataFrame") -> None:
         """Writes a dataframe to a worksheet by name.
 
         Column labels are included in the first row for the sheet.
@@ -179,12 +393,27 @@ class GoogleWorksheet:
         self.worksheet.update([data.columns.values.tolist()] + data.values.tolist())
 
     def write_range(self, range_value: RangeValues) -> None:
+        if self._is_batching():
+            self.write_multiple_ranges([range_value])
+            return
+
         self.worksheet.update(
             values=range_value.values,
             range_name=range_value.range,
         )
 
     def write_multiple_ranges(self, range_values: Iterable[RangeValues]) -> None:
+        if self._is_batching():
+            assert self._batch is not None
+            self._batch.add_value_ranges(
+                RangeValues(
+                    range=sheet_utils.absolute_range_name(self.worksheet.title, range_value.range),
+                    values=range_value.values,
+                )
+                for range_value in range_values
+            )
+            return
+
         write_data = [{"range": range_value.range, "values": range_value.values} for range_value in range_values]
         self.worksheet.batch_update(data=write_data)
 
@@ -192,17 +421,40 @@ class GoogleWorksheet:
         if not sheet_utils.is_range_a1_notation(range_name):
             raise ValueError(f"The 'range' argument must be a valid A1 range name, e.g. 'A1:C6'.\nFound: {range_name}.")
 
-        gspread_specs = [(spec.column_idx(), spec.order.gspread_sort_order()) for spec in specs]
+        requests = BatchUpdateRequestBuilder()
+        requests.add_sort_range(sheet_id=self.worksheet.id, specs=specs, range_name=range_name)
 
-        self.worksheet.sort(*gspread_specs, range=range_name)
+        self._send_requests(requests)
 
     def format_multiple_ranges(self, range_formats: Iterable[RangeFormat]) -> None:
-        formats = [format.as_google_api_cell_format() for format in range_formats]
-        self.worksheet.batch_format(formats=formats)
+        requests = BatchUpdateRequestBuilder()
+        requests.add_format_ranges(sheet_id=self.worksheet.id, range_formats=range_formats)
+
+        self._send_requests(requests)
+
+    def range_formats(self, range: str) -> list[list[CellFormat]]:
+        response = self.worksheet.client.fetch_sheet_metadata(
+            self.worksheet.spreadsheet_id,
+            params={
+                "includeGridData": "true",
+                "ranges": sheet_utils.absolute_range_name(self.worksheet.title, range),
+                "fields": EFFECTIVE_FORMAT_FIELDS,
+            },
+        )
 
-    def cell_format(self, cell: str) -> CellFormat:
-        if not sheet_utils.is_cell_a1_notation(cell):
-            raise ValueError(f"Cell must be in A1 notation: {cell}.")
+        grid_data = response["sheets"][0]["data"][0]
+        return range_formats_from_grid_data(range, grid_data.get("rowData", []))
 
-        format_raw = gspread_formatting.get_effective_format(worksheet=self.worksheet, label=cell)
-        return CellFormat(background_color=ColorRgb.from_color(format_raw.backgroundColor))
+    def _is_batching(self) -> bool:
+        return self._batch is not None and self._batch.is_open
+
+    def _send_requests(self, requests: BatchUpdateRequestBuilder) -> None:
+        """Send sort and format requests, which may depend on previously written values.
+
+        When writes are being batched, the requests are added to the batch to be sent after the batched values.
+        """
+        if self._is_batching():
+            assert self._batch is not None
+            self._batch.add_requests(requests)
+        else:
+            self.worksheet.client.batch_update(self.worksheet.spreadsheet_id, requests.body())
@@ -1,8 +1,9 @@
 import abc
 import enum
-from typing import Any, Hashable, Literal, Union
+from typing import Any, Literal, Sequence, Union
 
-import pandas as pd
+import numpy as np
+import numpy.typing as npt
 from utils import class_utils
 
 
@@ -45,14 +46,50 @@ class RankManager:
         player_values: dict[str, int] | dict[str, float],
         rank_order: RankOrder,
     ) -> dict[str, "RankValue"]:
-        ranks_ser = pd.Series(player_values).rank(
-            ascending=rank_order.is_ascending(),
-            method=self._rank_tie_method.as_pandas_rank_method(),
-        )
-        players_ranks_raw: dict[Hashable, int] = ranks_ser.astype(int).to_dict()
-        players_ranks_processed: dict[str, int] = {str(k): v for k, v in players_ranks_raw.items()}
-
-        return {player: RankValue(rank) for player, rank in players_ranks_processed.items()}
+        ranks = self.ranks_from_values(values=list(player_values.values()), rank_order=rank_order)
+        return {player: RankValue(rank) for player, rank in zip(player_values.keys(), ranks.tolist())}
+
+    def ranks_from_values(self, values: Sequence[float] | npt.NDArray, rank_order: RankOrder) -> npt.NDArray[np.int64]:
+        """Ranks of the values, aligned with the values."""
+        return rank_values(values=values, rank_order=rank_order, tie_method=self._rank_tie_method)
+
+
+def rank_values(
+    values: Sequence[float] | npt.NDArray,
+    rank_order: RankOrder,
+    tie_method: RankTieMethod = RankTieMethod.MIN,
+) -> npt.NDArray[np.int64]:
+    """Rank values with a single sort. Ranks start at 1 and are aligned with the values.
+
+    Tied values share the lowest or highest rank of their group, depending on the tie method, and the ranks after a
+    group of ties skip the tied positions, e.g. 1, 2, 2, 4.
+    """
+    values_array = np.asarray(values)
+    num_values = len(values_array)
+    if num_values == 0:
+        return np.empty(0, dtype=np.int64)
+
+    sort_keys = values_array if rank_order.is_ascending() else -values_array
+    order = np.argsort(sort_keys, kind="stable")
+    sorted_keys = sort_keys[order]
+
+    # Positions in the sorted values that start or end a group of tied values.
+    is_group_start = np.ones(num_values, dtype=bool)
+    is_group_start[1:] = sorted_keys[1:] != sorted_keys[:-1]
+    positions = np.arange(1, num_values + 1, dtype=np.int64)
+
+    match tie_method:
+        case RankTieMethod.MIN:
+            sorted_ranks = np.maximum.accumulate(np.where(is_group_start, positions, 0))
+        case RankTieMethod.MAX:
+            is_group_end = np.ones(num_values, dtype=bool)
+            is_group_end[:-1] = is_group_start[1:]
+            group_end_positions = np.where(is_group_end, positions, num_values + 1)
+            sorted_ranks = np.minimum.accumulate(group_end_positions[::-1])[::-1]
+
+    ranks = np.empty(num_values, dtype=np.int64)
+    ranks[order] = sorted_ranks
+    return ranks
 
 
 class RankValueNotIntegerError(Exception):
@@ -1,8 +1,16 @@
 import abc
-from typing import Any
+import logging
+from typing import Any, Iterable, Mapping, Sequence
 
+import numpy as np
+import numpy.typing as npt
 from utils import class_utils
 
+NUM_HOLES = 18
+HOLE_NUMS = list(range(1, NUM_HOLES + 1))
+
+logger = logging.getLogger(__name__)
+
 
 class ScorecardError(Exception):
     pass
@@ -61,7 +69,7 @@ class CompleteScorecard(Scorecard):
         if not isinstance(other, CompleteScorecard):
             return NotImplemented
 
-        return self._scores == other._scores
+        return self.scores() == other.scores()
 
 
 class ScorecardValidationError(Exception):
@@ -97,8 +105,213 @@ class ScorecardValidator:
 
 def scorecard_factory(hole_scores: dict[int, int]) -> Scorecard:
     try:
-        ScorecardValidator(hole_scores).validate()
+        # CompleteScorecard validates the hole scores
         return CompleteScorecard(hole_scores)
 
     except ScorecardValidationError:
         return IncompleteScorecard()
+
+
+def _warn_invalid_scores(
+    player_names: Sequence[str],
+    scores: npt.NDArray[np.float64],
+    is_valid_score: npt.NDArray[np.bool_],
+) -> None:
+    # Missing scores are NaN and are expected while an event is being played.
+    is_invalid_score = ~is_valid_score & ~np.isnan(scores)
+    for row in np.flatnonzero(is_invalid_score.any(axis=1)).tolist():
+        invalid_scores = {
+            hole_num: score
+            for (hole_num, score, is_invalid) in zip(HOLE_NUMS, scores[row].tolist(), is_invalid_score[row])
+            if is_invalid
+        }
+        logger.warning(
+            f"Player {player_names[row]} has hole scores that aren't positive numbers of strokes, so their scorecard "
+            f"is incomplete. Scores by hole: {invalid_scores}"
+        )
+
+
+class EventScoreMatrixScorecard(CompleteScorecard):
+    """A complete scorecard that is a view of one row of an EventScoreMatrix.
+
+    The scores were validated by the matrix, so they aren't validated or copied again.
+    """
+
+    def __init__(self, matrix: "EventScoreMatrix", row: int) -> None:
+        self._matrix = matrix
+        self._row = row
+
+    @property
+    def hole_scores(self) -> npt.NDArray[np.int16]:
+        """Read-only array of the scores for holes 1 through 18."""
+        return self._matrix.hole_scores[self._row]
+
+    def scores(self) -> dict[int, int]:
+        return dict(zip(HOLE_NUMS, self.hole_scores.tolist()))
+
+    def hole_strokes(self, hole_num: int) -> int:
+        if hole_num not in HOLE_NUMS:
+            raise ScorecardError(f"Hole number {hole_num} does not exist in scorecard.")
+
+        return int(self._matrix.hole_scores[self._row, hole_num - 1])
+
+
+class EventScoreMatrix:
+    """Hole scores of all players in an event, held in a single players x 18 array.
+
+    Row `i` of `hole_scores` holds the scores of `player_names[i]` for holes 1 through 18. Players without a complete
+    scorecard are marked in the `is_complete` mask and their rows are zero. `scorecard` exposes each row through the
+    `Scorecard` interface without copying the scores.
+    """
+
+    # Hole scores are small positive integers, so a 16 bit integer holds any score.
+    SCORE_DTYPE = np.int16
+
+    def __init__(
+        self,
+        player_names: Sequence[str],
+        hole_scores: npt.ArrayLike,
+        is_complete: npt.ArrayLike,
+    ) -> None:
+        scores = np.asarray(hole_scores)
+        complete = np.asarray(is_complete, dtype=bool)
+        self._validate(player_names, scores, complete)
+
+        self._player_names = list(player_names)
+        self._row_by_player = {player: row for (row, player) in enumerate(self._player_names)}
+
+        self._hole_scores = np.where(complete[:, np.newaxis], scores, 0).astype(self.SCORE_DTYPE)
+        self._hole_scores.flags.writeable = False
+        self._is_complete = complete.copy()
+        self._is_complete.flags.writeable = False
+
+    @classmethod
+    def from_hole_scores(cls, player_names: Sequence[str], hole_scores: npt.ArrayLike) -> "EventScoreMatrix":
+        """Create a matrix from players x 18 hole scores in which missing scores are NaN.
+
+        Scores are truncated towards zero like `int()`, which is how scores were converted when scorecards were built
+        one at a time, so e.g. 4.5 is a score of 4. Like `scorecard_factory`, a row is then a complete scorecard only if
+        every score is a positive integer. A score that is entered but isn't valid, e.g. 0, is logged as a warning,
+        since it makes the player's scorecard incomplete.
+        """
+        scores = np.asarray(hole_scores, dtype=float)
+        if scores.shape != (len(player_names), NUM_HOLES):
+            raise ScorecardValidationError(
+                f"Hole scores must have one row per player and {NUM_HOLES} columns. Found shape: {scores.shape}"
+            )
+
+        max_score = np.iinfo(cls.SCORE_DTYPE).max
+        truncated_scores = np.trunc(scores)
+        with np.errstate(invalid="ignore"):
+            is_valid_score = (truncated_scores >= 1) & (truncated_scores <= max_score)
+        is_complete = is_valid_score.all(axis=1)
+        _warn_invalid_scores(player_names, scores, is_valid_score)
+
+        return cls(
+            player_names=player_names,
+            hole_scores=np.where(is_valid_score, truncated_scores, 0).astype(cls.SCORE_DTYPE),
+            is_complete=is_complete,
+        )
+
+    @classmethod
+    def from_scorecards(cls, player_scorecards: Mapping[str, Scorecard]) -> "EventScoreMatrix":
+        return cls.from_hole_scores(
+            player_names=list(player_scorecards.keys()),
+            hole_scores=stack_hole_scores(player_scorecards.values()),
+        )
+
+    @property
+    def player_names(self) -> list[str]:
+        return list(self._player_names)
+
+    @property
+    def hole_scores(self) -> npt.NDArray[np.int16]:
+        """Read-only players x 18 array of hole scores. Rows of incomplete scorecards are zero."""
+        return self._hole_scores
+
+    @property
+    def is_complete(self) -> npt.NDArray[np.bool_]:
+        """Read-only mask of the players with a complete scorecard."""
+        return self._is_complete
+
+    def row(self, player: str) -> int:
+        try:
+            return self._row_by_player[player]
+        except KeyError:
+            raise ScorecardError(f"Player {player} does not exist in the score matrix.")
+
+    def scorecard(self, player: str) -> Scorecard:
+        row = self.row(player)
+        if not self._is_complete[row]:
+            return IncompleteScorecard()
+
+        return EventScoreMatrixScorecard(matrix=self, row=row)
+
+    def scorecards(self) -> dict[str, Scorecard]:
+        return {player: self.scorecard(player) for player in self._player_names}
+
+    def with_incomplete(self, players: Iterable[str]) -> "EventScoreMatrix":
+        """A copy of this matrix in which the scorecards of the given players are incomplete."""
+        is_complete = self._is_complete.copy()
+        for player in players:
+            is_complete[self.row(player)] = False
+
+        return EventScoreMatrix(player_names=self._player_names, hole_scores=self._hole_scores, is_complete=is_complete)
+
+    def __len__(self) -> int:
+        return len(self._player_names)
+
+    def __contains__(self, player: object) -> bool:
+        return player in self._row_by_player
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, EventScoreMatrix):
+            return NotImplemented
+
+        return (
+            self._player_names == other._player_names
+            and np.array_equal(self._is_complete, other._is_complete)
+            and np.array_equal(self._hole_scores, other._hole_scores)
+        )
+
+    @staticmethod
+    def _validate(player_names: Sequence[str], hole_scores: np.ndarray, is_complete: np.ndarray) -> None:
+        num_players = len(player_names)
+        if len(set(player_names)) != num_players:
+            raise ScorecardValidationError(f"Player names in a score matrix must be unique. Found: {player_names}")
+
+        if hole_scores.shape != (num_players, NUM_HOLES) or is_complete.shape != (num_players,):
+            raise ScorecardValidationError(
+                f"A score matrix must have one row per player and {NUM_HOLES} columns. Found shapes: "
+                f"{hole_scores.shape} for hole scores and {is_complete.shape} for the completeness mask"
+            )
+
+        if not np.issubdtype(hole_scores.dtype, np.integer):
+            raise ScorecardValidationError(f"Hole scores must be integers. Found type: {hole_scores.dtype}")
+
+        complete_scores = hole_scores[is_complete]
+        max_score = np.iinfo(EventScoreMatrix.SCORE_DTYPE).max
+        if not np.all((complete_scores >= 1) & (complete_scores <= max_score)):
+            raise ScorecardValidationError(
+                f"Hole scores of complete scorecards must be positive integers no greater than {max_score}."
+            )
+
+
+def stack_hole_scores(scorecards: Iterable[Scorecard]) -> npt.NDArray[np.float64]:
+    """Hole scores of the scorecards as a scorecards x 18 array. Scores of incomplete scorecards are NaN.
+
+    Scores of score matrix views are copied from the matrix, without building a dict per scorecard.
+    """
+    rows: list[Any] = []
+    for scorecard in scorecards:
+        if isinstance(scorecard, EventScoreMatrixScorecard):
+            rows.append(scorecard.hole_scores)
+        elif scorecard.is_complete_score():
+            rows.append(list(scorecard.scores().values()))
+        else:
+            rows.append([np.nan] * NUM_HOLES)
+
+    if len(rows) == 0:
+        return np.empty((0, NUM_HOLES))
+
+    return np.array(rows, dtype=float)
@@ -3,6 +3,9 @@ from .config import (  # noqa: F401 - names exposed for public use
     EventTeeConfig,
     EventType,
     FinaleSheetConfig,
+    PointsScheduleConfig,
+    PointsSchedulesConfig,
     SeasonConfig,
+    SheetApiLimitsConfig,
     load_season_config,
 )
@@ -61,6 +61,80 @@ class FinaleSheetConfig(pydantic.BaseModel):
     tees: "EventTeeConfig"
 
 
+class SheetApiLimitsConfig(pydantic.BaseModel):
+    """Limits for requests to the Google Sheets API.
+
+    The defaults match the Sheets API per-user quotas.
+    """
+
+    model_config = pydantic.ConfigDict(frozen=True, extra="forbid", strict=True)
+
+    read_requests_per_minute: int = pydantic.Field(default=60, gt=0)
+    write_requests_per_minute: int = pydantic.Field(default=60, gt=0)
+    max_retries: int = pydantic.Field(default=5, ge=0)
+    max_backoff_seconds: float = pydantic.Field(default=64.0, gt=0)
+
+
+class PointsScheduleConfig(pydantic.BaseModel):
+    """Points that are awarded for each finishing rank in an event.
+
+    Ranks past the end of `points_by_rank` are awarded the points of the previous rank less `tail_step`, but no fewer
+    than `tail_min_points`, so the schedule covers a field of any size. All points are scaled by `multiplier`.
+    """
+
+    model_config = pydantic.ConfigDict(frozen=True, extra="forbid", strict=True)
+
+    points_by_rank: list[float] = pydantic.Field(min_length=1)
+    tail_step: float = pydantic.Field(default=0.0, ge=0)
+    tail_min_points: float = pydantic.Field(default=0.0, ge=0)
+    multiplier: float = pydantic.Field(default=1.0, gt=0)
+
+    @pydantic.field_validator("points_by_rank")
+    @classmethod
+    def _check_points_by_rank(cls, points_by_rank: list[float]) -> list[float]:
+        if any(points < 0 for points in points_by_rank):
+            raise ValueError(f"Points must not be negative. Found: {points_by_rank}")
+
+        if any(points < next_points for points, next_points in zip(points_by_rank, points_by_rank[1:])):
+            raise ValueError(f"Points must not increase with rank. Found: {points_by_rank}")
+
+        return points_by_rank
+
+    @pydantic.model_validator(mode="after")
+    def _check_tail_min_points(self) -> "PointsScheduleConfig":
+        # Points for the ranks past the table would otherwise increase with rank.
+        if self.tail_min_points > self.points_by_rank[-1]:
+            raise ValueError(
+                f"Tail minimum points must not exceed the points of the last rank in the table. Found: "
+                f"tail_min_points={self.tail_min_points}, points_by_rank={self.points_by_rank}"
+            )
+
+        return self
+
+
+# 50 points for a win down to 20 points for 6th place, then half a point less for each rank down to half a point.
+DEFAULT_STANDARD_POINTS_SCHEDULE = PointsScheduleConfig(
+    points_by_rank=[50.0, 45.0, 37.5, 30.0, 25.0, 20.0],
+    tail_step=0.5,
+    tail_min_points=0.5,
+)
+DEFAULT_MAJOR_POINTS_SCHEDULE = DEFAULT_STANDARD_POINTS_SCHEDULE.model_copy(update={"multiplier": 2.0})
+
+
+class PointsSchedulesConfig(pydantic.BaseModel):
+    model_config = pydantic.ConfigDict(frozen=True, extra="forbid", strict=True)
+
+    standard: PointsScheduleConfig = DEFAULT_STANDARD_POINTS_SCHEDULE
+    major: PointsScheduleConfig = DEFAULT_MAJOR_POINTS_SCHEDULE
+
+    def for_event_type(self, event_type: "EventType") -> PointsScheduleConfig:
+        match event_type:
+            case EventType.STANDARD:
+                return self.standard
+            case EventType.MAJOR:
+                return self.major
+
+
 class SeasonConfig(pydantic.BaseModel):
     model_config = pydantic.ConfigDict(frozen=True, extra="forbid", strict=True)
 
@@ -70,6 +144,8 @@ class SeasonConfig(pydantic.BaseModel):
     leaderboard_sheet_name: str
     finale_handicaps_sheet: FinaleSheetConfig
     events: dict[int, "EventConfig"]
+    sheet_api_limits: SheetApiLimitsConfig = SheetApiLimitsConfig()
+    points_schedules: PointsSchedulesConfig = PointsSchedulesConfig()
 
     def event_names(self) -> list[str]:
         return [event.event_name for event in self.events.values()]
@@ -1,3 +1,5 @@
 from season_controller.controller import (
     SeasonController,
+    SeasonRunPhase,
 )
+from season_controller.watch import SeasonWatcher
@@ -1,4 +1,6 @@
+import enum
 import logging
+from typing import Callable
 
 import courses
 import season_config
@@ -6,6 +8,7 @@ import season_finale
 import season_model
 import season_view
 from courses.provider import CourseProviderError
+from utils import tracing
 
 from season_controller import delegate
 from season_controller.read_data_normalizer import SeasonReadDataNormalizer
@@ -13,6 +16,12 @@ from season_controller.read_data_normalizer import SeasonReadDataNormalizer
 logger = logging.getLogger(__name__)
 
 
+class SeasonRunPhase(enum.Enum):
+    READ = "read"
+    COMPUTE = "compute"
+    WRITE = "write"
+
+
 class SeasonController:
     def __init__(
         self,
@@ -20,38 +29,56 @@ class SeasonController:
         view: season_view.SeasonView,
         config: season_config.SeasonConfig,
         course_provider: courses.CourseProvider,
+        phase_listener: Callable[[str], None] | None = None,
     ) -> None:
         self.model = model
         self.view = view
         self.config = config
         self.course_provider = course_provider
+        # Called with the name of each phase of a run as it starts, e.g. to attribute Sheets API requests to phases.
+        self.phase_listener = phase_listener
 
     def run_season(self) -> None:
+        with tracing.span("run_season", category="controller"):
+            self._run_season()
+
+    def _run_season(self) -> None:
         logger.info("📚 Reading season data")
-        view_read_data = self.view.read_season()
-        read_data_normalized = SeasonReadDataNormalizer(read_data=view_read_data).normalize()
+        self._start_phase(SeasonRunPhase.READ)
+        with tracing.span("read", category="controller"):
+            view_read_data = self.view.read_season()
+        if self.view.is_season_unchanged():
+            logger.info("✅ No changes since the last run, results are up to date")
+            return
 
-        model_input = delegate.SeasonViewToModelDelegate(
-            view_read_data=read_data_normalized,
-            course_provider=self.course_provider,
-            config=self.config,
-        ).generate_model_input()
+        self._start_phase(SeasonRunPhase.COMPUTE)
+        with tracing.span("normalize", category="controller"):
+            read_data_normalized = SeasonReadDataNormalizer(read_data=view_read_data).normalize()
+
+        with tracing.span("view to model", category="controller"):
+            model_input = delegate.SeasonViewToModelDelegate(
+                view_read_data=read_data_normalized,
+                course_provider=self.course_provider,
+                config=self.config,
+            ).generate_model_input()
 
         logger.info("🏌️‍♂️ Grinding")
-        model_results = self.model.calculate_results(model_input)
+        with tracing.span("model", category="controller"):
+            model_results = self.model.calculate_results(model_input)
 
         finale_data = None
         if self.config.is_finale_enabled():
             if view_read_data.are_finale_hcps_available:
                 finale_course = self.get_finale_course()
                 if finale_course is not None:
-                    finale_data = season_finale.FinaleDataGenerator(
-                        players=view_read_data.players,
-                        season_handicaps_by_player=model_results.season_handicaps_by_player(),
-                        finale_ghin_handicaps_by_player=view_read_data.finale_handicaps_by_player(),
-                        course=finale_course,
-                        tees=self.config.finale_tees,
-                    ).generate()
+                    with tracing.span("finale", category="controller"):
+                        finale_data = season_finale.FinaleDataGenerator(
+                            players=view_read_data.players,
+                            season_handicaps_by_player=model_results.season_handicaps_by_player(),
+                            finale_ghin_handicaps_by_player=view_read_data.finale_handicaps_by_player(),
+                            course=finale_course,
+                            tees=self.config.finale_tees,
+                        ).generate()
 
             else:
                 logger.warning(
@@ -59,10 +86,17 @@ class SeasonController:
                     "sheet. Calculations and sheet updates will be skipped."
                 )
 
-        view_write_data = delegate.SeasonModelToViewDelegate(model_results, finale_data).generate_view_write_data()
+        with tracing.span("model to view", category="controller"):
+            view_write_data = delegate.SeasonModelToViewDelegate(model_results, finale_data).generate_view_write_data()
 
         logger.info("👩🏾‍💻 Writing results")
-        self.view.write_season(view_write_data)
+        self._start_phase(SeasonRunPhase.WRITE)
+        with tracing.span("write", category="controller"):
+            self.view.write_season(view_write_data)
+
+    def refresh(self) -> None:
+        """Discard the view's cached sheet structure, so that the next run doesn't repeat a failure caused by it."""
+        self.view.refresh()
 
     def get_finale_course(self) -> courses.Course | None:
         finale_course_name = self.config.finale_course
@@ -76,3 +110,7 @@ class SeasonController:
                 "provider. Finale calculations will be skipped."
             )
             return None
+
+    def _start_phase(self, phase: SeasonRunPhase) -> None:
+        if self.phase_listener is not None:
+            self.phase_listener(phase.value)
@@ -37,6 +37,7 @@ class SeasonViewToModelDelegate(NamedTuple):
                 tees=self._event_tees(event_name),
                 event_type=self._event_type(event_name),
                 players=self._event_players(event_name),
+                points_schedule=self._event_points_schedule(event_name),
             )
             _events.append(_event)
 
@@ -57,6 +58,11 @@ class SeasonViewToModelDelegate(NamedTuple):
         config_event_type = self.config.get_event_config(event_name).type
         return season_model.SeasonModelEventType.from_config_event_type(config_event_type)
 
+    def _event_points_schedule(self, event_name: str) -> season_model.SeasonModelPointsSchedule:
+        config_event_type = self.config.get_event_config(event_name).type
+        schedule_config = self.config.points_schedules.for_event_type(config_event_type)
+        return season_model.SeasonModelPointsSchedule.from_config(schedule_config)
+
     def _event_players(self, event_name: str) -> list[season_model.SeasonModelEventPlayerInput]:
         _players: list[season_model.SeasonModelEventPlayerInput] = []
         for player_name in self._player_names():
@@ -1,9 +1,5 @@
 import logging
 
-from season_common.scorecard import (
-    IncompleteScorecard,
-    Scorecard,
-)
 from season_view import (
     SeasonViewReadData,
     SeasonViewReadEvent,
@@ -26,23 +22,21 @@ class SeasonReadDataNormalizer:
         return SeasonViewReadData(players=self._read_data.players, events=events)
 
     def normalize_event(self, event: SeasonViewReadEvent) -> SeasonViewReadEvent:
-        player_scorecards: dict[str, Scorecard] = {}
-        for player in event.player_names:
-            player_scorecards[player] = self.normalize_player_scorecard(player=player, event=event)
-
-        return SeasonViewReadEvent(
+        players_without_handicap = [
+            player for player in event.player_names if self._is_score_without_handicap(player=player, event=event)
+        ]
+        for player in players_without_handicap:
+            logger.warning(
+                f"⚠️ Found a complete scorecard for {player} in the {event.event_name} event, but no handicap was "
+                "found. This score will be skipped."
+            )
+
+        return SeasonViewReadEvent.from_score_matrix(
             event_name=event.event_name,
-            player_scorecards=player_scorecards,
+            score_matrix=event.score_matrix.with_incomplete(players_without_handicap),
         )
 
-    def normalize_player_scorecard(self, player: str, event: SeasonViewReadEvent) -> Scorecard:
-        scorecard = event.player_scorecard(player=player)
-        if scorecard.is_complete_score():
-            if not self._read_data.is_handicap_available(player_name=player, event_name=event.event_name):
-                logger.warning(
-                    f"⚠️ Found a complete scorecard for {player} in the {event.event_name} event, but no handicap was "
-                    "found. This score will be skipped."
-                )
-                return IncompleteScorecard()
-
-        return scorecard
+    def _is_score_without_handicap(self, player: str, event: SeasonViewReadEvent) -> bool:
+        return event.player_scorecard(player=player).is_complete_score() and not self._read_data.is_handicap_available(
+            player_name=player, event_name=event.event_name
+        )
@@ -0,0 +1,64 @@
+import logging
+import time
+from typing import Callable
+
+from season_controller.controller import SeasonController
+
+logger = logging.getLogger(__name__)
+
+
+class SeasonWatcher:
+    """Runs a season controller repeatedly in one process, so the season is rescored shortly after the sheet changes.
+
+    Each run starts by checking whether the sheet changed since the last run, which is cheap when it didn't. The
+    controller, and the clients and caches that it holds, stay warm between runs, so a run after a change only
+    recomputes the events that changed and only writes the values that changed.
+
+    A run that fails is logged and the season is watched anyway, so that e.g. a scorecard that is only partially entered
+    doesn't stop the watch. The controller is refreshed after a failed run, since the failure may have been caused by
+    cached worksheets that were since renamed or recreated. `after_run` is called after every run, including runs that
+    fail, e.g. to report and discard what was recorded during the run so it doesn't accumulate for as long as the season
+    is watched. The clock and sleep functions can be injected so that watching can be tested without waiting.
+    """
+
+    def __init__(
+        self,
+        controller: SeasonController,
+        interval_seconds: float,
+        after_run: Callable[[], None] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if interval_seconds <= 0:
+            raise ValueError(f"interval_seconds must be positive. Found: {interval_seconds}")
+
+        self._controller = controller
+        self._interval_seconds = interval_seconds
+        self._after_run = after_run
+        self._clock = clock
+        self._sleep = sleep
+
+    def watch(self, max_runs: int | None = None) -> None:
+        """Run the season every interval, measured from the start of each run, until interrupted or `max_runs`."""
+        logger.info(f"👀 Watching the season for changes every {self._interval_seconds:g}s")
+
+        num_runs = 0
+        while max_runs is None or num_runs < max_runs:
+            run_start = self._clock()
+            self._run_once()
+            num_runs += 1
+
+            if max_runs is not None and num_runs >= max_runs:
+                break
+
+            self._sleep(max(self._interval_seconds - (self._clock() - run_start), 0.0))
+
+    def _run_once(self) -> None:
+        try:
+            self._controller.run_season()
+        except Exception:
+            logger.exception("The season run failed. The season will be checked again at the next interval.")
+            self._controller.refresh()
+        finally:
+            if self._after_run is not None:
+                self._after_run()
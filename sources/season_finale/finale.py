@@ -5,6 +5,7 @@ from courses import Course
 from season_common import player
 from season_config import EventTeeConfig
 from season_view import SeasonViewReadPlayers
+from utils import index_utils
 
 
 class FinaleDataError(Exception):
@@ -22,13 +23,14 @@ class FinalePlayerDescriptor(NamedTuple):
 class FinaleData:
     def __init__(self, players: list[FinalePlayerDescriptor]) -> None:
         self._players = players
+        self._player_index = index_utils.NameIndex(player_.name for player_ in players)
 
     def get_player(self, player_name: str) -> FinalePlayerDescriptor:
-        for player_ in self._players:
-            if player_.name == player_name:
-                return player_
+        position = self._player_index.position(player_name)
+        if position is None:
+            raise KeyError(f"Player {player_name} cannot be found in finale data.")
 
-        raise KeyError(f"Player {player_name} cannot be found in finale data.")
+        return self._players[position]
 
     def players(self) -> list[str]:
         return [player.name for player in self._players]
@@ -5,6 +5,7 @@ from season_model.api.input import (
     SeasonModelEventTees,
     SeasonModelEventType,
     SeasonModelInput,
+    SeasonModelPointsSchedule,
 )
 from season_model.api.model import SeasonModel
 from season_model.api.result.event_result import (
@@ -25,4 +26,6 @@ from season_model.api.result.season_result import (
     SeasonModelPlayerOverallResult,
     SeasonModelResults,
 )
+from season_model.concrete_model.result_cache import EventResultCache
+from season_model.concrete_model.scoring_version import SCORING_VERSION
 from season_model.concrete_model.season import ConcreteSeasonModel
@@ -1,10 +1,14 @@
+import dataclasses
 import enum
 from typing import Any, Iterator, NamedTuple
 
 import courses
+import numpy as np
+import numpy.typing as npt
 import season_config
 from season_common.player import Player, PlayerGender
 from season_common.scorecard import Scorecard
+from utils import index_utils
 
 
 class CourseDataVerificationError(Exception):
@@ -32,6 +36,38 @@ class SeasonModelEventType(enum.Enum):
                 return SeasonModelEventType.MAJOR
 
 
+class SeasonModelPointsSchedule(NamedTuple):
+    """Points that are awarded for each finishing rank in an event. See `season_config.PointsScheduleConfig`."""
+
+    points_by_rank: tuple[float, ...]
+    tail_step: float = 0.0
+    tail_min_points: float = 0.0
+    multiplier: float = 1.0
+
+    @staticmethod
+    def from_config(config: season_config.PointsScheduleConfig) -> "SeasonModelPointsSchedule":
+        return SeasonModelPointsSchedule(
+            points_by_rank=tuple(config.points_by_rank),
+            tail_step=config.tail_step,
+            tail_min_points=config.tail_min_points,
+            multiplier=config.multiplier,
+        )
+
+    def points_table(self, num_ranks: int = 0) -> npt.NDArray[np.float64]:
+        """Dense array of points by rank, where index 0 holds rank 1.
+
+        The array covers at least `num_ranks` ranks and all of the tabulated ranks.
+        """
+        tabulated_points = np.array(self.points_by_rank, dtype=float)
+        num_tail_ranks = max(num_ranks - len(tabulated_points), 0)
+        tail_points = np.maximum(
+            tabulated_points[-1] - self.tail_step * np.arange(1, num_tail_ranks + 1),
+            self.tail_min_points,
+        )
+
+        return np.concatenate([tabulated_points, tail_points]) * self.multiplier
+
+
 class SeasonModelEventPlayerInput(NamedTuple):
     handicap_index: float
     scorecard: Scorecard
@@ -74,23 +110,31 @@ class SeasonModelEventTees(NamedTuple):
                 return self.some_womens_tee()
 
 
-class SeasonModelEventInput(NamedTuple):
+@dataclasses.dataclass(frozen=True)
+class SeasonModelEventInput:
     event_name: str
     course: courses.Course
     tees: SeasonModelEventTees
     event_type: SeasonModelEventType
     players: list[SeasonModelEventPlayerInput]
+    # The default points schedule for the event type is used if no schedule is given.
+    points_schedule: SeasonModelPointsSchedule | None = None
+
+    _player_index: index_utils.NameIndex = dataclasses.field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_player_index", index_utils.NameIndex(player.player_name for player in self.players))
 
     @property
     def player_names(self) -> list[str]:
         return [player.player_name for player in self.players]
 
     def player(self, player_name: str) -> SeasonModelEventPlayerInput:
-        for _player in self.players:
-            if _player.player_name == player_name:
-                return _player
+        position = self._player_index.position(player_name)
+        if position is None:
+            raise KeyError(f"Player `{player_name} cannot be found.")
 
-        raise KeyError(f"Player `{player_name} cannot be found.")
+        return self.players[position]
 
     def tee_for_player(self, gender: PlayerGender) -> str:
         try:
@@ -104,17 +148,18 @@ class SeasonModelEventInput(NamedTuple):
 class SeasonModelEventInputs:
     def __init__(self, events: list[SeasonModelEventInput]) -> None:
         self._events = events
+        self._event_index = index_utils.NameIndex(event.event_name for event in events)
 
     @property
     def event_names(self) -> list[str]:
         return [event.event_name for event in self._events]
 
     def event_input(self, event_name: str) -> SeasonModelEventInput:
-        for event in self._events:
-            if event.event_name == event_name:
-                return event
+        position = self._event_index.position(event_name)
+        if position is None:
+            raise SeasonModeInputError(f"Event {event_name} could not be found in season model input.")
 
-        raise SeasonModeInputError(f"Event {event_name} could not be found in season model input.")
+        return self._events[position]
 
     def __iter__(self) -> Iterator[SeasonModelEventInput]:
         for event in self._events:
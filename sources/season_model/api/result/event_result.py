@@ -1,8 +1,9 @@
 import abc
+import dataclasses
 from typing import Any, NamedTuple
 
 from season_common import rank
-from utils import class_utils
+from utils import class_utils, index_utils
 
 from season_model.api.result import notable_holes
 
@@ -318,22 +319,26 @@ class SeasonModelEventPlayerResult:
         return f"{self.__class__.__name__}({attributes_string})"
 
 
-class SeasonModelEventResult(NamedTuple):
+@dataclasses.dataclass(frozen=True)
+class SeasonModelEventResult:
     """Results for a single event in a season."""
 
     name: str
     players: list[SeasonModelEventPlayerResult]
 
+    _player_index: index_utils.NameIndex = dataclasses.field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_player_index", index_utils.NameIndex(player.name for player in self.players))
+
     def player_names(self) -> list[str]:
         return [player.name for player in self.players]
 
     def player_result(self, player_name: str) -> SeasonModelEventPlayerResult:
-        candidates = [player for player in self.players if player.name == player_name]
-
-        num_candidates = len(candidates)
-        if num_candidates == 0:
+        position = self._player_index.position(player_name)
+        if position is None:
             raise KeyError(f"Couldn't find and players with name {player_name}.")
-        if num_candidates > 1:
+        if self._player_index.is_duplicated(player_name):
             raise KeyError(f"Found more than 1 player with name {player_name}")
 
-        return candidates[0]
+        return self.players[position]
@@ -1,6 +1,8 @@
-from typing import Any, NamedTuple
+import dataclasses
+from typing import Any
 
 from season_common import rank
+from utils import index_utils
 
 from season_model.api.result import event_result
 
@@ -121,31 +123,41 @@ class SeasonModelPlayerOverallResult:
         return f"{self.__class__.__name__}({attributes_string})"
 
 
-class SeasonModelOverallResults(NamedTuple):
+@dataclasses.dataclass(frozen=True)
+class SeasonModelOverallResults:
     players: list[SeasonModelPlayerOverallResult]
 
+    _player_index: index_utils.NameIndex = dataclasses.field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_player_index", index_utils.NameIndex(player.name for player in self.players))
+
     def player_names(self) -> list[str]:
         return [player.name for player in self.players]
 
     def get_player(self, player_name: str) -> SeasonModelPlayerOverallResult:
-        candidates = [player for player in self.players if player.name == player_name]
-
-        num_candidates = len(candidates)
-        if num_candidates == 0:
+        position = self._player_index.position(player_name)
+        if position is None:
             raise KeyError(f"Couldn't find and players with name {player_name}.")
-        if num_candidates > 1:
+        if self._player_index.is_duplicated(player_name):
             raise KeyError(f"Found more than 1 player with name {player_name}")
 
-        return candidates[0]
+        return self.players[position]
 
     def sesaon_handicaps_by_player(self) -> dict[str, float]:
         return {player.name: player.season_handicap for player in self.players}
 
 
-class SeasonModelResults(NamedTuple):
+@dataclasses.dataclass(frozen=True)
+class SeasonModelResults:
     events: list[event_result.SeasonModelEventResult]
     overall: SeasonModelOverallResults
 
+    _event_index: index_utils.NameIndex = dataclasses.field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_event_index", index_utils.NameIndex(event.name for event in self.events))
+
     def player_names(self) -> list[str]:
         return self.overall.player_names()
 
@@ -163,15 +175,13 @@ class SeasonModelResults(NamedTuple):
         return [event.name for event in self.events]
 
     def event_result(self, event_name: str) -> event_result.SeasonModelEventResult:
-        candidates = [event for event in self.events if event.name == event_name]
-
-        num_candidates = len(candidates)
-        if num_candidates == 0:
+        position = self._event_index.position(event_name)
+        if position is None:
             raise KeyError(f"Couldn't find and events with name {event_name}.")
-        if num_candidates > 1:
+        if self._event_index.is_duplicated(event_name):
             raise KeyError(f"Found more than 1 event with name {event_name}")
 
-        return candidates[0]
+        return self.events[position]
 
     def season_handicaps_by_player(self) -> dict[str, float]:
         return self.overall.sesaon_handicaps_by_player()
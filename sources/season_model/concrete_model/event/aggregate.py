@@ -2,7 +2,7 @@ from typing import TypeVar
 
 from season_common.rank import NoRankValue, Rank, RankManager, RankOrder, RankValue
 
-from season_model.api.input import SeasonModelEventType
+from season_model.api.input import SeasonModelEventType, SeasonModelPointsSchedule
 from season_model.api.result import (
     SeasonModelCompleteEventPlayerIndividualResult,
     SeasonModelEventPlayerAggregateResult,
@@ -23,6 +23,7 @@ class EventAggregateResultsGenerator:
         self,
         individual_results: dict[str, SeasonModelEventPlayerIndividualResult],
         event_type: SeasonModelEventType,
+        points_schedule: SeasonModelPointsSchedule | None = None,
     ) -> None:
         self._complete_results = self._filter_results_with_class_type(
             player_results=individual_results,
@@ -36,7 +37,7 @@ class EventAggregateResultsGenerator:
         self._verify_grouping_of_results(player_names=list(individual_results.keys()))
 
         self._rank_manager = RankManager()
-        self._points_manager = Points(event_type)
+        self._points_manager = Points(event_type, schedule=points_schedule, num_ranks=len(individual_results))
 
     def _filter_results_with_class_type(
         self,
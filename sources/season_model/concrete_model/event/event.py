@@ -6,7 +6,13 @@ from season_model.api.result import (
     SeasonModelEventResult,
 )
 from season_model.concrete_model.event.aggregate import EventAggregateResultsGenerator
-from season_model.concrete_model.event.individual import PlayerIndividualResultGenerator
+from season_model.concrete_model.event.individual import (
+    EventIndividualResultsGenerator,
+    PlayerIndividualResultGenerator,
+)
+
+# Compute the individual results of all players at once with array operations, rather than player by player.
+FTR_BATCH_INDIVIDUAL_RESULTS_ENABLED = True
 
 
 class EventResultGenerator:
@@ -36,6 +42,9 @@ class EventResultGenerator:
         )
 
     def _individual_results(self) -> dict[str, SeasonModelEventPlayerIndividualResult]:
+        if FTR_BATCH_INDIVIDUAL_RESULTS_ENABLED:
+            return self._batch_individual_results()
+
         individual_results: dict[str, SeasonModelEventPlayerIndividualResult] = {}
         for player in self._input.player_names:
             player_input = self._input.player(player)
@@ -49,6 +58,13 @@ class EventResultGenerator:
 
         return individual_results
 
+    def _batch_individual_results(self) -> dict[str, SeasonModelEventPlayerIndividualResult]:
+        return EventIndividualResultsGenerator(
+            inputs=self._input.players,
+            course=self._input.course,
+            tees=[self._input.tee_for_player(gender=player_input.gender) for player_input in self._input.players],
+        ).generate()
+
     def _aggregate_results(
         self,
         individual_results: dict[str, SeasonModelEventPlayerIndividualResult],
@@ -56,4 +72,5 @@ class EventResultGenerator:
         return EventAggregateResultsGenerator(
             individual_results=individual_results,
             event_type=self._input.event_type,
+            points_schedule=self._input.points_schedule,
         ).generate()
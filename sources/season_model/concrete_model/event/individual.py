@@ -1,4 +1,7 @@
-from courses import Course
+import numpy as np
+from courses import Course, TeeTable
+from season_common import scorecard
+from season_common.player import PlayerGender
 from season_common.scorecard import CompleteScorecard, Scorecard
 
 from season_model.api.input import SeasonModelEventPlayerInput
@@ -116,3 +119,116 @@ class PlayerIndividualResultGenerator:
                     self._notable_holes.set_hole(hole_num=hole, hole_type=NotableHoleType.EAGLE)
                 case 3:
                     self._notable_holes.set_hole(hole_num=hole, hole_type=NotableHoleType.ALBATROSS)
+
+
+class EventIndividualResultsGenerator:
+    """Individual results of all players in an event, computed with array operations over their hole scores.
+
+    The results are identical to those of `PlayerIndividualResultGenerator` for each player. Rounding is done with
+    Python's `round` rather than NumPy's, which rounds to decimals differently.
+    """
+
+    # Notable hole types by the codes in the notable hole grid. Code 0 is a hole that isn't notable.
+    _NOTABLE_HOLE_TYPES = (
+        NotableHoleType.NONE,
+        NotableHoleType.OVER_MAX,
+        NotableHoleType.BIRDIE,
+        NotableHoleType.EAGLE,
+        NotableHoleType.ALBATROSS,
+    )
+
+    def __init__(
+        self,
+        inputs: list[SeasonModelEventPlayerInput],
+        course: Course,
+        tees: list[str],
+    ) -> None:
+        if len(inputs) != len(tees):
+            raise PlayerResultError(f"Expected one tee per player. Found {len(tees)} tees for {len(inputs)} players.")
+
+        self._inputs = inputs
+        self._course = course
+        self._tees = tees
+
+    def generate(self) -> dict[str, SeasonModelEventPlayerIndividualResult]:
+        results: dict[str, SeasonModelEventPlayerIndividualResult] = {
+            input.player_name: SeasonModelIncompleteEventPlayerInividualResult() for input in self._inputs
+        }
+
+        complete_idxs = [idx for (idx, input) in enumerate(self._inputs) if input.is_complete_score]
+        if len(complete_idxs) == 0:
+            return results
+
+        complete_inputs = [self._inputs[idx] for idx in complete_idxs]
+        (tee_tables, tee_table_idxs) = self._tee_tables(complete_idxs)
+        handicap_indices = np.array([input.handicap_index for input in complete_inputs], dtype=float)
+        hole_scores = scorecard.stack_hole_scores(input.scorecard for input in complete_inputs).astype(np.int64)
+
+        pars = np.stack([tee_table.hole_pars for tee_table in tee_tables])[tee_table_idxs]
+        max_strokes = np.stack([tee_table.max_hole_strokes for tee_table in tee_tables])[tee_table_idxs]
+        is_over_max = hole_scores > max_strokes
+        adjusted_scores = np.minimum(hole_scores, max_strokes)
+
+        front_9_gross = adjusted_scores[:, :9].sum(axis=1)
+        back_9_gross = adjusted_scores[:, 9:].sum(axis=1)
+        gross = front_9_gross + back_9_gross
+
+        course_handicaps = np.zeros(len(complete_inputs), dtype=np.int64)
+        score_differentials = np.zeros(len(complete_inputs), dtype=float)
+        for tee_table_idx, tee_table in enumerate(tee_tables):
+            rows = tee_table_idxs == tee_table_idx
+            course_handicaps[rows] = tee_table.course_handicaps(handicap_indices[rows])
+            score_differentials[rows] = tee_table.scoring_differentials(gross[rows])
+
+        notable_holes = self._notable_holes(is_over_max=is_over_max, strokes_below_par=pars - adjusted_scores)
+
+        course_handicaps_list = course_handicaps.tolist()
+        score_differentials_list = score_differentials.tolist()
+        for row, input in enumerate(complete_inputs):
+            total_gross = int(gross[row])
+            results[input.player_name] = SeasonModelCompleteEventPlayerIndividualResult(
+                course_handicap=course_handicaps_list[row],
+                front_9_gross=int(front_9_gross[row]),
+                back_9_gross=int(back_9_gross[row]),
+                total_gross=total_gross,
+                total_net=total_gross - course_handicaps_list[row],
+                notable_holes=notable_holes[row],
+                score_differential=score_differentials_list[row],
+            )
+
+        return results
+
+    def _tee_tables(self, idxs: list[int]) -> tuple[list[TeeTable], np.ndarray]:
+        """Distinct tee tables of the players, and the index of each player's tee table in them."""
+        tee_tables: list[TeeTable] = []
+        tee_table_idxs_by_tee: dict[tuple[PlayerGender, str], int] = {}
+        tee_table_idxs: list[int] = []
+        for idx in idxs:
+            input = self._inputs[idx]
+            tee = (input.gender, self._tees[idx])
+            if tee not in tee_table_idxs_by_tee:
+                try:
+                    tee_tables.append(self._course.tee_table(tee_name=tee[1], player_gender=tee[0]))
+                except Exception as err:
+                    raise PlayerResultError(f"Error while processing result for player {input.player.name}") from err
+                tee_table_idxs_by_tee[tee] = len(tee_tables) - 1
+
+            tee_table_idxs.append(tee_table_idxs_by_tee[tee])
+
+        return (tee_tables, np.array(tee_table_idxs, dtype=np.intp))
+
+    def _notable_holes(self, is_over_max: np.ndarray, strokes_below_par: np.ndarray) -> list[NotableHoles]:
+        hole_type_codes = np.select(
+            [is_over_max, strokes_below_par == 1, strokes_below_par == 2, strokes_below_par == 3],
+            [1, 2, 3, 4],
+            default=0,
+        )
+
+        notable_holes = [NotableHoles() for _ in range(hole_type_codes.shape[0])]
+        for row, col in zip(*np.nonzero(hole_type_codes)):
+            notable_holes[row].set_hole(
+                hole_num=int(col) + 1,
+                hole_type=self._NOTABLE_HOLE_TYPES[hole_type_codes[row, col]],
+            )
+
+        return notable_holes
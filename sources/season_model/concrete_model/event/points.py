@@ -1,60 +1,33 @@
-from season_model.api.input import SeasonModelEventType
-
-STANDARD_EVENT_POINTS_BY_RANK = {
-    1: 50.0,
-    2: 45.0,
-    3: 37.5,
-    4: 30.0,
-    5: 25.0,
-    6: 20.0,
-    7: 19.5,
-    8: 19.0,
-    9: 18.5,
-    10: 18.0,
-    11: 17.5,
-    12: 17.0,
-    13: 16.5,
-    14: 16.0,
-    15: 15.5,
-    16: 15.0,
-    17: 14.5,
-    18: 14.0,
-    19: 13.5,
-    20: 13.0,
-    21: 12.5,
-    22: 12.0,
-    23: 11.5,
-    24: 11.0,
-    25: 10.5,
-    26: 10.0,
-    27: 9.5,
-    28: 9.0,
-    29: 8.5,
-    30: 8.0,
-    31: 7.5,
-    32: 7.0,
-    33: 6.5,
-    34: 6.0,
-    35: 5.5,
-    36: 5.0,
-    37: 4.5,
-    38: 4.0,
-    39: 3.5,
-    40: 3.0,
-    41: 2.5,
-    42: 2.0,
-    43: 1.5,
-    44: 1.0,
-    45: 0.5,
-    46: 0.5,
-    47: 0.5,
-    48: 0.5,
-    49: 0.5,
-    50: 0.5,
-    51: 0.5,
-}
-
-MAJOR_EVENT_POINTS_BY_RANK = {rank: points * 2 for rank, points in STANDARD_EVENT_POINTS_BY_RANK.items()}
+import itertools
+
+import numpy as np
+import numpy.typing as npt
+import season_config
+
+from season_model.api.input import SeasonModelEventType, SeasonModelPointsSchedule
+
+# The default points schedules are defined by the season config, so that a season config without points schedules
+# scores events the same way as the model's defaults.
+DEFAULT_POINTS_SCHEDULES = season_config.PointsSchedulesConfig()
+
+# The points of the default schedules for the ranks of a full field.
+DEFAULT_POINTS_TABLE_NUM_RANKS = 51
+STANDARD_EVENT_POINTS_BY_RANK = dict(
+    enumerate(
+        SeasonModelPointsSchedule.from_config(DEFAULT_POINTS_SCHEDULES.standard)
+        .points_table(num_ranks=DEFAULT_POINTS_TABLE_NUM_RANKS)
+        .tolist(),
+        start=1,
+    )
+)
+MAJOR_EVENT_POINTS_BY_RANK = dict(
+    enumerate(
+        SeasonModelPointsSchedule.from_config(DEFAULT_POINTS_SCHEDULES.major)
+        .points_table(num_ranks=DEFAULT_POINTS_TABLE_NUM_RANKS)
+        .tolist(),
+        start=1,
+    )
+)
 
 
 class UnknownEventTypeError(Exception):
@@ -66,16 +39,36 @@ class InvalidPlayerRanksError(Exception):
 
 
 class Points:
-    def __init__(self, event_type: SeasonModelEventType) -> None:
-        self._points_by_rank = self._get_points_by_rank(event_type)
-
-    def _get_points_by_rank(self, event_type: SeasonModelEventType):
+    def __init__(
+        self,
+        event_type: SeasonModelEventType,
+        schedule: SeasonModelPointsSchedule | None = None,
+        num_ranks: int = 0,
+    ) -> None:
+        """Points for the ranks of an event.
+
+        Args:
+            event_type: The event type, whose default points schedule is used if no schedule is given.
+            schedule: The points schedule of the event.
+            num_ranks: The number of ranks to award points for, which is usually the number of players. The
+                schedule's tabulated ranks are always covered.
+        """
+        if schedule is None:
+            schedule = self._default_schedule(event_type)
+
+        # Points by rank, where index 0 holds rank 1, and the cumulative points of the ranks before each rank, so
+        # that the points for a group of tied ranks are summed in constant time.
+        self._points_table = schedule.points_table(num_ranks=num_ranks)
+        self._cumulative_points = np.array(list(itertools.accumulate(self._points_table, initial=0.0)))
+        self._points_by_rank = {rank: points for rank, points in enumerate(self._points_table.tolist(), start=1)}
+
+    def _default_schedule(self, event_type: SeasonModelEventType) -> SeasonModelPointsSchedule:
         match event_type:
             case SeasonModelEventType.STANDARD:
-                return STANDARD_EVENT_POINTS_BY_RANK
+                return SeasonModelPointsSchedule(points_by_rank=tuple(STANDARD_EVENT_POINTS_BY_RANK.values()))
 
             case SeasonModelEventType.MAJOR:
-                return MAJOR_EVENT_POINTS_BY_RANK
+                return SeasonModelPointsSchedule(points_by_rank=tuple(MAJOR_EVENT_POINTS_BY_RANK.values()))
 
             case _:
                 # Should not be reachable unless new event types are introduced.
@@ -86,9 +79,9 @@ class Points:
             return {}
 
         self._verify_player_ranks(player_ranks)
-        players_at_each_rank = self._players_at_each_rank(player_ranks)
+        points = self.points_from_ranks(list(player_ranks.values()))
 
-        return self._player_points(players_at_each_rank)
+        return dict(zip(player_ranks.keys(), points.tolist()))
 
     def _are_player_ranks_empty(self, player_ranks: dict[str, int]) -> bool:
         return len(player_ranks) == 0
@@ -103,42 +96,31 @@ class Points:
                     f"Rank must be in the range [{min(allowed_ranks), max(allowed_ranks)}]."
                 )
 
-    def _allowed_ranks(self) -> tuple[int, ...]:
-        return tuple(rank for rank in self._points_by_rank.keys())
-
-    def _players_at_each_rank(self, player_ranks: dict[str, int]) -> dict[int, list[str]]:
-        """Pivot the player ranks dictionary into one that has ranks as keys and sets of player names at each rank as values."""  # noqa: E501
-        min_player_rank = min(player_ranks.values())
-        max_player_rank = max(player_ranks.values())
-
-        players_at_each_rank: dict[int, list[str]] = {}
-        for rank in range(min_player_rank, max_player_rank + 1):
-            players_at_each_rank[rank] = self._find_players_at_rank(rank, player_ranks)
-
-        return players_at_each_rank
-
-    def _find_players_at_rank(self, rank: int, player_ranks: dict[str, int]) -> list[str]:
-        return [player_name for player_name, player_rank in player_ranks.items() if player_rank == rank]
-
-    def _player_points(self, players_at_each_rank: dict[int, list[str]]) -> dict[str, float]:
-        player_points: dict[str, float] = {}
-        for rank, players in players_at_each_rank.items():
-            num_players = len(players)
-            if num_players == 0:
-                continue
-
-            points = self._points_for_players_at_rank(rank=rank, num_players=num_players)
-            for player in players:
-                player_points[player] = points
-
-        return player_points
-
-    def _points_for_players_at_rank(self, rank: int, num_players: int) -> float:
-        if num_players == 1:
-            return self._points_by_rank[rank]
-        else:
-            tied_ranks_range = range(rank, rank + num_players)
-            tied_ranks_points = [self._points_by_rank[rank_] for rank_ in tied_ranks_range]
-            points_for_tie = sum(tied_ranks_points) / num_players
-
-            return points_for_tie
+    def _allowed_ranks(self) -> range:
+        return range(1, len(self._points_table) + 1)
+
+    def points_from_ranks(self, ranks: npt.ArrayLike) -> npt.NDArray[np.float64]:
+        """Points for an array of ranks, aligned with the ranks.
+
+        Players that share a rank split the points of the ranks they're tied for, e.g. two players at rank 3 each get
+        the average of the points for ranks 3 and 4.
+        """
+        ranks_array = np.asarray(ranks, dtype=np.int64)
+        if len(ranks_array) == 0:
+            return np.empty(0, dtype=float)
+
+        max_rank = len(self._points_table)
+        if ranks_array.min() < 1 or ranks_array.max() > max_rank:
+            raise InvalidPlayerRanksError(f"Ranks must be in the range [1, {max_rank}]. Found: {ranks_array.tolist()}")
+
+        num_players_at_rank = np.bincount(ranks_array, minlength=max_rank + 1)[ranks_array]
+        last_tied_rank = ranks_array + num_players_at_rank - 1
+        if last_tied_rank.max() > max_rank:
+            raise InvalidPlayerRanksError(f"Tied ranks extend past the lowest rank with points ({max_rank}).")
+
+        tied_ranks_points = self._cumulative_points[last_tied_rank] - self._cumulative_points[ranks_array - 1]
+        return np.where(
+            num_players_at_rank == 1,
+            self._points_table[ranks_array - 1],
+            tied_ranks_points / num_players_at_rank,
+        )
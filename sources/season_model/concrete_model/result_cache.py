@@ -0,0 +1,136 @@
+import hashlib
+import logging
+import os
+import pathlib
+import pickle
+from typing import NamedTuple
+
+import numpy as np
+from season_common import scorecard
+
+from season_model.api.input import SeasonModelEventInput
+from season_model.api.result import SeasonModelEventResult
+from season_model.concrete_model import scoring_version
+
+logger = logging.getLogger(__name__)
+
+# Increment this when the structure of the cached event results changes so that results cached by older code are
+# ignored. Changes to the way that results are calculated increment `scoring_version.SCORING_VERSION` instead.
+RESULT_CACHE_FORMAT_VERSION = 1
+
+
+class CachedEventResult(NamedTuple):
+    format_version: int
+    input_digest: str
+    result: SeasonModelEventResult
+
+
+def event_input_digest(event_input: SeasonModelEventInput) -> str:
+    """Stable digest of everything in an event's input that affects its results.
+
+    The digest covers the course, tees, event type and points schedule of the event, as well as the name, gender,
+    handicap index and hole scores of every player, in order. It also covers the scoring version, so results that
+    were calculated by older scoring code are recalculated.
+    """
+    digest = hashlib.sha256()
+    for part in (
+        str(RESULT_CACHE_FORMAT_VERSION),
+        str(scoring_version.SCORING_VERSION),
+        event_input.event_name,
+        event_input.course.model_dump_json(by_alias=True),
+        repr(tuple(event_input.tees)),
+        event_input.event_type.name,
+        repr(event_input.points_schedule),
+        repr([(player.player_name, player.gender.name) for player in event_input.players]),
+    ):
+        digest.update(part.encode())
+        # Separate the parts so that ("ab", "c") and ("a", "bc") produce different digests.
+        digest.update(b"\0")
+
+    handicap_indices = np.array([player.handicap_index for player in event_input.players], dtype=np.float64)
+    digest.update(handicap_indices.tobytes())
+    # Incomplete scorecards are NaN rows, which are distinct from every complete scorecard.
+    hole_scores = scorecard.stack_hole_scores(player.scorecard for player in event_input.players)
+    digest.update(hole_scores.tobytes())
+
+    return digest.hexdigest()
+
+
+class EventResultCache:
+    """Local disk cache of the results of each event, keyed by a digest of the event's input.
+
+    One result is kept per event. A result is only returned when the digest of the event's current input matches the
+    digest of the input that it was calculated from, so events are recalculated as soon as any of their input changes.
+    Results are also kept in memory once they're loaded or stored, so a long-running process only reads each result
+    from disk once.
+    """
+
+    def __init__(self, cache_dir: pathlib.Path) -> None:
+        self._cache_dir = cache_dir
+        self._cached_results: dict[str, CachedEventResult] = {}
+
+    def load(self, event_name: str, input_digest: str) -> SeasonModelEventResult | None:
+        cached_result = self._cached_results.get(event_name)
+        if cached_result is None:
+            cached_result = self._load_result_file(event_name)
+            if cached_result is None:
+                return None
+
+            self._cached_results[event_name] = cached_result
+
+        if cached_result.input_digest != input_digest:
+            return None
+
+        return cached_result.result
+
+    def _load_result_file(self, event_name: str) -> CachedEventResult | None:
+        result_file = self._result_file(event_name)
+        if not result_file.is_file():
+            return None
+
+        try:
+            with result_file.open("rb") as file:
+                cached_result = pickle.load(file)
+        except Exception:
+            # A result that can't be loaded is treated the same as a missing one. It will be replaced after the event
+            # is recalculated.
+            logger.warning(f"Unable to load cached event result from {result_file}. It will be ignored.", exc_info=True)
+            return None
+
+        if (
+            not isinstance(cached_result, CachedEventResult)
+            or cached_result.format_version != RESULT_CACHE_FORMAT_VERSION
+        ):
+            return None
+
+        return cached_result
+
+    def store(self, input_digest: str, result: SeasonModelEventResult) -> None:
+        cached_result = CachedEventResult(
+            format_version=RESULT_CACHE_FORMAT_VERSION,
+            input_digest=input_digest,
+            result=result,
+        )
+        self._cached_results[result.name] = cached_result
+
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+        result_file = self._result_file(result.name)
+
+        # Write to a temporary file first so that a result is never left partially written.
+        temp_file = result_file.with_suffix(".tmp")
+        with temp_file.open("wb") as file:
+            pickle.dump(cached_result, file)
+        os.replace(temp_file, result_file)
+
+    def clear(self) -> None:
+        self._cached_results.clear()
+        if not self._cache_dir.is_dir():
+            return
+
+        for result_file in self._cache_dir.glob("*.pickle"):
+            result_file.unlink(missing_ok=True)
+
+    def _result_file(self, event_name: str) -> pathlib.Path:
+        # Event names may contain characters that aren't allowed in file names.
+        event_name_digest = hashlib.sha256(event_name.encode()).hexdigest()[:16]
+        return self._cache_dir / f"{event_name_digest}.pickle"
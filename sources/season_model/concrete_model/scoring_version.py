@@ -0,0 +1,4 @@
+# Increment this whenever a change to the scoring code changes the results for the same input, so that anything that
+# was up to date with the results of older code is recalculated. It's part of the digest of each cached event result
+# and of the salt of each read snapshot.
+SCORING_VERSION = 1
@@ -1,6 +1,9 @@
+import logging
+
 from season_common.rank import RankManager, RankOrder, RankValue
+from utils import tracing
 
-from season_model.api.input import SeasonModelInput
+from season_model.api.input import SeasonModelEventInput, SeasonModelInput
 from season_model.api.model import SeasonModel
 from season_model.api.result import (
     SeasonModelEventResult,
@@ -9,9 +12,21 @@ from season_model.api.result import (
     SeasonModelResults,
 )
 from season_model.concrete_model.event import EventResultGenerator
+from season_model.concrete_model.result_cache import EventResultCache, event_input_digest
+
+logger = logging.getLogger(__name__)
 
 
 class ConcreteSeasonModel(SeasonModel):
+    """Season model which calculates the results of every event and then the overall season results.
+
+    When a result cache is given, only events whose input changed since their results were cached are recalculated.
+    The overall season results are always recalculated from the results of every event.
+    """
+
+    def __init__(self, result_cache: EventResultCache | None = None) -> None:
+        self._result_cache = result_cache
+
     def calculate_results(self, input: SeasonModelInput) -> SeasonModelResults:
         player_names = input.player_names
         event_names = input.event_names
@@ -19,18 +34,37 @@ class ConcreteSeasonModel(SeasonModel):
         event_results: dict[str, SeasonModelEventResult] = {}
         for event in event_names:
             event_input = input.event_input(event_name=event)
-            event_results[event] = EventResultGenerator(input=event_input).generate()
+            event_results[event] = self._event_result(event_input)
 
-        overall_results = SeasonOverallResultsGenerator(
-            player_names=player_names,
-            event_results=event_results,
-        ).generate()
+        with tracing.span("overall results", category="model"):
+            overall_results = SeasonOverallResultsGenerator(
+                player_names=player_names,
+                event_results=event_results,
+            ).generate()
 
         return SeasonModelResults(
             events=list(event_results.values()),
             overall=overall_results,
         )
 
+    def _event_result(self, event_input: SeasonModelEventInput) -> SeasonModelEventResult:
+        with tracing.span("event results", category="model", event=event_input.event_name):
+            return self._cached_event_result(event_input)
+
+    def _cached_event_result(self, event_input: SeasonModelEventInput) -> SeasonModelEventResult:
+        if self._result_cache is None:
+            return EventResultGenerator(input=event_input).generate()
+
+        input_digest = event_input_digest(event_input)
+        cached_result = self._result_cache.load(event_name=event_input.event_name, input_digest=input_digest)
+        if cached_result is not None:
+            logger.debug(f"Using cached results for event {event_input.event_name}")
+            return cached_result
+
+        event_result = EventResultGenerator(input=event_input).generate()
+        self._result_cache.store(input_digest=input_digest, result=event_result)
+        return event_result
+
 
 class SeasonOverallResultsGenerator:
     def __init__(
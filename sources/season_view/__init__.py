@@ -22,4 +22,5 @@ from season_view.google_sheet_view import (
     GoogleSheetSeasonViewConfig,
     GoogleSheetSeasonViewEventConfig,
     GoogleSheetSeasonViewFinaleConfig,
+    ReadSnapshotCache,
 )
@@ -112,6 +112,21 @@ class SeasonViewReadEvent:
     def __init__(self, event_name: str, player_scorecards: dict[str, scorecard.Scorecard]) -> None:
         self.event_name = event_name
         self._player_scorecards = player_scorecards
+        self._score_matrix: scorecard.EventScoreMatrix | None = None
+
+    @classmethod
+    def from_score_matrix(cls, event_name: str, score_matrix: scorecard.EventScoreMatrix) -> "SeasonViewReadEvent":
+        """Create an event whose player scorecards are views of the rows of a score matrix."""
+        event = cls(event_name=event_name, player_scorecards=score_matrix.scorecards())
+        event._score_matrix = score_matrix
+        return event
+
+    @property
+    def score_matrix(self) -> scorecard.EventScoreMatrix:
+        if self._score_matrix is None:
+            self._score_matrix = scorecard.EventScoreMatrix.from_scorecards(self._player_scorecards)
+
+        return self._score_matrix
 
     @property
     def player_names(self) -> list[str]:
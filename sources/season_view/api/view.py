@@ -11,3 +11,18 @@ class SeasonView(abc.ABC):
     @abc.abstractmethod
     def write_season(self, data: write_data.SeasonViewWriteData) -> None:
         pass
+
+    def is_season_unchanged(self) -> bool:
+        """Whether the season that was last read is unchanged since the view was last written.
+
+        When this is true, the results in the view are already up to date with the season that was read.
+        """
+        return False
+
+    def refresh(self) -> None:
+        """Discard anything that the view caches about the structure of the sheet, e.g. after a run fails.
+
+        The next read fetches it again, so that worksheets which were renamed or recreated since they were cached are
+        picked up.
+        """
+        pass
@@ -1,6 +1,9 @@
 import abc
+import dataclasses
 from typing import Any, NamedTuple
 
+from utils import index_utils
+
 
 class SeasonViewWriteLeaderboardPlayer(NamedTuple):
     name: str
@@ -350,16 +353,22 @@ class SeasonViewWritePlayerCompleteEvent(SeasonViewWritePlayerEvent):
         )
 
 
-class SeasonViewWriteEvent(NamedTuple):
+@dataclasses.dataclass(frozen=True)
+class SeasonViewWriteEvent:
     name: str
     players: list[SeasonViewWritePlayerEvent]
 
+    _player_index: index_utils.NameIndex = dataclasses.field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_player_index", index_utils.NameIndex(player.name for player in self.players))
+
     def get_player(self, player_name: str) -> SeasonViewWritePlayerEvent:
-        for player in self.players:
-            if player.name == player_name:
-                return player
+        position = self._player_index.position(player_name)
+        if position is None:
+            raise KeyError(f"Player {player_name} cannot be found in write data for event {self.name}.")
 
-        raise KeyError(f"Player {player_name} cannot be found in write data for event {self.name}.")
+        return self.players[position]
 
 
 class SeasonViewWriteFinalePlayer(NamedTuple):
@@ -370,27 +379,38 @@ class SeasonViewWriteFinalePlayer(NamedTuple):
     finale_course_handicap: int | None
 
 
-class SeasonViewWriteFinaleData(NamedTuple):
+@dataclasses.dataclass(frozen=True)
+class SeasonViewWriteFinaleData:
     players: list[SeasonViewWriteFinalePlayer]
 
-    def get_player(self, name: str) -> SeasonViewWriteFinalePlayer:
-        candidates = [player for player in self.players if player.name == name]
+    _player_index: index_utils.NameIndex = dataclasses.field(init=False, repr=False, compare=False)
 
-        if len(candidates) == 0:
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_player_index", index_utils.NameIndex(player.name for player in self.players))
+
+    def get_player(self, name: str) -> SeasonViewWriteFinalePlayer:
+        position = self._player_index.position(name)
+        if position is None:
             raise IndexError(f"No player named {name} in SeasonViewWriteFinaleData")
 
         ## TODO: Raise a different error if more than 1 player gets found
-        return candidates[0]
+        return self.players[position]
 
 
-class SeasonViewWriteData(NamedTuple):
+@dataclasses.dataclass(frozen=True)
+class SeasonViewWriteData:
     leaderboard: SeasonViewWriteLeaderboard
     events: list[SeasonViewWriteEvent]
     finale: SeasonViewWriteFinaleData | None
 
+    _event_index: index_utils.NameIndex = dataclasses.field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_event_index", index_utils.NameIndex(event.name for event in self.events))
+
     def get_event(self, event_name: str) -> SeasonViewWriteEvent:
-        for event in self.events:
-            if event.name == event_name:
-                return event
+        position = self._event_index.position(event_name)
+        if position is None:
+            raise KeyError(f"Event {event_name} cannot be found in season write data.")
 
-        raise KeyError(f"Event {event_name} cannot be found in season write data.")
+        return self.events[position]
@@ -4,3 +4,4 @@ from .core import (
     GoogleSheetSeasonViewEventConfig,
     GoogleSheetSeasonViewFinaleConfig,
 )
+from .snapshot import ReadSnapshotCache
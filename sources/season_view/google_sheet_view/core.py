@@ -1,10 +1,16 @@
+import concurrent.futures
+import logging
 from dataclasses import dataclass
 from typing import NamedTuple
 
 import google_sheet
+from google_sheet import utils as sheet_utils
+from utils import tracing
 
 from season_view.api import read_data, view, write_data
-from season_view.google_sheet_view import worksheets
+from season_view.google_sheet_view import snapshot, worksheets
+
+logger = logging.getLogger(__name__)
 
 
 class GoogleSheetSeasonViewEventConfig(NamedTuple):
@@ -97,29 +103,91 @@ class GoogleSheetSeasonView(view.SeasonView):
         self,
         config: GoogleSheetSeasonViewConfig,
         sheet_controller: google_sheet.GoogleSheetController,
+        snapshot_cache: snapshot.ReadSnapshotCache | None = None,
     ) -> None:
         self._config = config
         self._sheet_controller = sheet_controller
+        self._snapshot_cache = snapshot_cache
         self._verify_available_worksheets()
 
-        # The event worksheet state needs to be held between read and write events.
-        # These will be instantiated after the players sheet is read.
+        # The event and finale worksheet state needs to be held between read and write events.
+        # These will be instantiated when the season is read.
         self._event_worksheets: dict[str, worksheets.EventWorksheet] = {}
+        self._finale_worksheet: worksheets.FinaleWorksheet | None = None
+        # The leaderboard values that are stored when the season is read, so that only changes are written.
+        self._leaderboard_values: google_sheet.CellValues | None = None
 
-    def read_season(self) -> read_data.SeasonViewReadData:
-        players_data = self._read_players_worksheet()
+        # Snapshot state, which is only used when a snapshot cache is provided.
+        self._read_snapshot_key: snapshot.ReadSnapshotKey | None = None
+        self._read_data: read_data.SeasonViewReadData | None = None
+        # The values of every range that was read, which are compared to the sheet before a snapshot is stored.
+        self._read_range_values: dict[str, list[list[str]]] = {}
+        self._is_read_from_snapshot = False
 
-        self._event_worksheets = self._generate_event_worksheets(players_data.player_names)
-        events_data = self._read_event_worksheets()
+        # Values and formats that are needed to write the season, which are fetched in the background after a read.
+        self._write_prefetch: concurrent.futures.Future[None] | None = None
+
+    def read_season(self) -> read_data.SeasonViewReadData:
+        self._is_read_from_snapshot = False
+
+        if self._snapshot_cache is not None:
+            self._read_snapshot_key = self._snapshot_key(self._snapshot_cache)
+            snapshot_data = self._snapshot_cache.load(self._read_snapshot_key)
+
+            if snapshot_data is not None:
+                # The sheet has not been modified since the snapshot was stored after the last write, so the
+                # worksheets don't need to be read and there is nothing new to write.
+                self._event_worksheets = {}
+                self._finale_worksheet = None
+                self._is_read_from_snapshot = True
+                return snapshot_data
+
+        self._read_data = self._read_season_from_sheet()
+        return self._read_data
+
+    def is_season_unchanged(self) -> bool:
+        return self._is_read_from_snapshot
+
+    def refresh(self) -> None:
+        self._sheet_controller.invalidate_metadata()
+        self._event_worksheets = {}
+        self._finale_worksheet = None
+        self._leaderboard_values = None
+
+    def _read_season_from_sheet(self) -> read_data.SeasonViewReadData:
+        self._event_worksheets = self._generate_event_worksheets()
+        self._finale_worksheet = self._generate_finale_worksheet()
+
+        # All worksheets in the season are read with a single request.
+        with tracing.span("batch read", category="view"):
+            range_values = self._sheet_controller.batch_read(self._read_ranges())
+        self._read_range_values = range_values
+
+        with tracing.span("read worksheet", category="view", worksheet=self._config.players_worksheet_name):
+            players_data = self._read_players_worksheet(range_values[self._players_read_range()])
+        events_data = self._read_event_worksheets(players=players_data.player_names, range_values=range_values)
+
+        if self._finale_worksheet is not None:
+            assert self._config.finale_config is not None
+            with tracing.span("read worksheet", category="view", worksheet=self._config.finale_config.workshet_name):
+                self._finale_worksheet.read(range_values[self._finale_read_range(self._finale_worksheet)])
 
         _verify_season_read_data(players=players_data, events=events_data)
 
+        self._write_prefetch = self._prefetch_for_write_in_background()
+
         return read_data.SeasonViewReadData(
             players=players_data,
             events=events_data,
         )
 
     def write_season(self, data: write_data.SeasonViewWriteData) -> None:
+        if self._is_read_from_snapshot:
+            raise GoogleSheetSeasonViewError(
+                "The season was read from a snapshot because the sheet is unchanged since it was last written. "
+                "There is nothing new to write."
+            )
+
         if len(self._event_worksheets) == 0:
             raise GoogleSheetSeasonViewError(
                 f"An unexpected error has occurred. This error suggests that a {self.__class__.__name__} "
@@ -127,28 +195,146 @@ class GoogleSheetSeasonView(view.SeasonView):
                 "a read event occurs before a write event."
             )
 
+        if self._write_prefetch is not None:
+            # Wait for the values and formats that were fetched while the results were computed. Any error in fetching
+            # them is raised before anything is written.
+            self._write_prefetch.result()
+            self._write_prefetch = None
+
+        self._buffer_writes(data)
+
+        # A snapshot is only valid if nobody else modified the sheet between the read and this write, so the sheet is
+        # checked just before the buffered writes are sent.
+        is_snapshot_valid = self._is_sheet_unmodified_since_read()
+
+        # The writes to all worksheets are sent when the batch is flushed.
+        with tracing.span("flush", category="view"):
+            self._sheet_controller.flush()
+
+        if is_snapshot_valid:
+            self._store_snapshot()
+
+    def _buffer_writes(self, data: write_data.SeasonViewWriteData) -> None:
+        # Writes to all worksheets are buffered and sent together when the batch is flushed.
+        self._sheet_controller.begin_batch()
+
         for event in self._config.event_names:
             worksheet = self._event_worksheets[event]
             event_data = data.get_event(event_name=event)
 
-            worksheet.write(data=event_data)
-
-        leaderboard_worksheet_controller = self._sheet_controller.worksheet(self._config.leaderboard_worksheet_name)
-        worksheets.LeaderboardWorksheet(
-            data=data.leaderboard,
-            worksheet_controller=leaderboard_worksheet_controller,
-            ordered_event_names=self._config.ordered_event_names,
-        ).write()
-
-        if (self._config.finale_config is not None) and (data.finale is not None):
-            finale_worksheet_controller = self._sheet_controller.worksheet(self._config.finale_config.workshet_name)
-            worksheets.FinaleWorksheet(
-                worksheet_controller=finale_worksheet_controller,
-                player_names_range=self._config.finale_config.player_names_range,
-                course_handicap_column=self._config.finale_config.course_handicap_column,
-                finale_handicap_index_column=self._config.finale_config.finale_handicap_index_column,
-                season_handicap_column=self._config.finale_config.season_handicap_column,
-            ).write(data=data.finale)
+            worksheet_name = self._config.event_config(event_name=event).worksheet_name
+            with tracing.span("write worksheet", category="view", worksheet=worksheet_name):
+                worksheet.write(data=event_data)
+
+        leaderboard_worksheet_name = self._config.leaderboard_worksheet_name
+        with tracing.span("write worksheet", category="view", worksheet=leaderboard_worksheet_name):
+            leaderboard_worksheet_controller = self._sheet_controller.worksheet(leaderboard_worksheet_name)
+            worksheets.LeaderboardWorksheet(
+                data=data.leaderboard,
+                worksheet_controller=leaderboard_worksheet_controller,
+                ordered_event_names=self._config.ordered_event_names,
+                current_values=self._leaderboard_values,
+            ).write()
+
+        if (self._finale_worksheet is not None) and (data.finale is not None):
+            assert self._config.finale_config is not None
+            with tracing.span("write worksheet", category="view", worksheet=self._config.finale_config.workshet_name):
+                self._finale_worksheet.write(data=data.finale)
+
+    def _prefetch_for_write_in_background(self) -> concurrent.futures.Future[None]:
+        """Start fetching the values and formats that are needed to write the season.
+
+        The values of the written ranges are read unformatted, so that a write is only skipped for cells that already
+        hold exactly the written value. Each event worksheet's format is a request of its own. None of these requests
+        depend on the results, so they're made on a background thread while the results are computed. No other
+        requests are made until the season is written, which waits for the prefetch first.
+        """
+        event_worksheets = dict(self._event_worksheets)
+        event_read_ranges = {event: self._event_read_range(event) for event in event_worksheets}
+        leaderboard_read_range = self._leaderboard_read_range()
+
+        def prefetch_for_write() -> None:
+            with tracing.span("fetch written values", category="view"):
+                range_values = self._sheet_controller.batch_read_unformatted(
+                    [*event_read_ranges.values(), leaderboard_read_range]
+                )
+            for event, event_worksheet in event_worksheets.items():
+                event_worksheet.set_current_values(range_values[event_read_ranges[event]])
+            self._leaderboard_values = range_values[leaderboard_read_range]
+
+            if worksheets.event.FTR_WRITER_FORMATTING_ENABLED:
+                with tracing.span("fetch formats", category="view"):
+                    for event_worksheet in event_worksheets.values():
+                        event_worksheet.fetch_background_format()
+
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        write_prefetch = executor.submit(prefetch_for_write)
+        # The executor's thread exits once the prefetch is done.
+        executor.shutdown(wait=False)
+
+        return write_prefetch
+
+    def _snapshot_key(self, snapshot_cache: snapshot.ReadSnapshotCache) -> snapshot.ReadSnapshotKey:
+        return snapshot_cache.key(
+            sheet_id=self._sheet_controller.sheet_id(),
+            revision_token=self._sheet_controller.revision_token(),
+            view_config=repr(self._config),
+        )
+
+    def _is_sheet_unmodified_since_read(self) -> bool:
+        if self._snapshot_cache is None or self._read_snapshot_key is None:
+            return False
+
+        return self._sheet_controller.revision_token() == self._read_snapshot_key.revision_token
+
+    def _store_snapshot(self) -> None:
+        """Store the data that was read, keyed by the revision of the sheet after it was written.
+
+        Writing only updates computed results, so the data that was read before the write is still what would be
+        read from the sheet after the write, unless someone else modified the sheet between the check before the
+        write and fetching the revision after it. Their edit would be part of that revision, so the season is read
+        again after the revision is fetched, and the snapshot is only stored if the season's inputs are unchanged.
+        This costs one read request for each run that writes, whereas a stale snapshot would hide the edit from every
+        later run until the sheet is modified again.
+        """
+        assert self._snapshot_cache is not None
+        assert self._read_data is not None
+
+        key = self._snapshot_key(self._snapshot_cache)
+        if not self._are_inputs_unchanged_since_read():
+            logger.info("The sheet was modified while the season was written, so the read snapshot isn't stored")
+            return
+
+        self._snapshot_cache.store(key=key, data=self._read_data)
+
+    def _are_inputs_unchanged_since_read(self) -> bool:
+        """Read the season again and compare its inputs with the data that was read before the write.
+
+        The players and finale worksheets aren't written, so their values are compared directly. The event worksheets
+        are compared as they're read, since the result cells that were written aren't part of the read data.
+        """
+        assert self._read_data is not None
+
+        with tracing.span("verify read", category="view"):
+            range_values = self._sheet_controller.batch_read(self._read_ranges())
+
+        unwritten_ranges = [self._players_read_range()]
+        if self._finale_worksheet is not None:
+            unwritten_ranges.append(self._finale_read_range(self._finale_worksheet))
+        if any(range_values[name] != self._read_range_values.get(name) for name in unwritten_ranges):
+            return False
+
+        try:
+            events_data = self._read_event_worksheets(
+                players=self._read_data.player_names,
+                range_values=range_values,
+                event_worksheets=self._generate_event_worksheets(),
+            )
+        except worksheets.event.EventWorksheetError:
+            # Scores that can't be read can't be the scores that were read before.
+            return False
+
+        return events_data == self._read_data.events
 
     def _verify_available_worksheets(self) -> None:
         required_worksheets = set(self._config.worksheet_names())
@@ -161,15 +347,41 @@ class GoogleSheetSeasonView(view.SeasonView):
                 f"Some required worksheets are not available. Missing worksheets: {missing_worksheets}"
             )
 
-    def _read_players_worksheet(self) -> read_data.SeasonViewReadPlayers:
-        players_worksheet_controller = self._sheet_controller.worksheet(self._config.players_worksheet_name)
+    def _read_ranges(self) -> list[str]:
+        """Worksheet-qualified ranges for all data that is read from the season."""
+        ranges = [self._players_read_range()]
+        ranges.extend(self._event_read_range(event) for event in self._config.event_names)
+
+        if self._finale_worksheet is not None:
+            ranges.append(self._finale_read_range(self._finale_worksheet))
+
+        return ranges
+
+    def _players_read_range(self) -> str:
+        # The entire players worksheet is read.
+        return sheet_utils.absolute_range_name(self._config.players_worksheet_name)
+
+    def _event_read_range(self, event: str) -> str:
+        worksheet_name = self._config.event_config(event_name=event).worksheet_name
+        return sheet_utils.absolute_range_name(worksheet_name, self._event_worksheets[event].read_range())
 
+    def _leaderboard_read_range(self) -> str:
+        return sheet_utils.absolute_range_name(
+            self._config.leaderboard_worksheet_name,
+            worksheets.leaderboard.read_range(self._config.ordered_event_names),
+        )
+
+    def _finale_read_range(self, finale_worksheet: worksheets.FinaleWorksheet) -> str:
+        # The finale worksheet is only generated when there is a finale configuration.
+        assert self._config.finale_config is not None
+        return sheet_utils.absolute_range_name(self._config.finale_config.workshet_name, finale_worksheet.read_range())
+
+    def _read_players_worksheet(self, values: list[list[str]]) -> read_data.SeasonViewReadPlayers:
         return worksheets.PlayersWorksheet(
-            worksheet_controller=players_worksheet_controller,
             events=self._config.event_names,
-        ).read()
+        ).read(values)
 
-    def _generate_event_worksheets(self, players: list[str]) -> dict[str, worksheets.EventWorksheet]:
+    def _generate_event_worksheets(self) -> dict[str, worksheets.EventWorksheet]:
         event_worksheets: dict[str, worksheets.EventWorksheet] = {}
         for event in self._config.event_names:
             event_config = self._config.event_config(event_name=event)
@@ -178,15 +390,38 @@ class GoogleSheetSeasonView(view.SeasonView):
                 event_name=event,
                 worksheet_controller=event_worksheet_controller,
                 scorecard_start_cell=event_config.scorecard_start_cell,
-                players=players,
             )
 
         return event_worksheets
 
-    def _read_event_worksheets(self) -> read_data.SeasonViewReadEvents:
+    def _generate_finale_worksheet(self) -> worksheets.FinaleWorksheet | None:
+        if self._config.finale_config is None:
+            return None
+
+        finale_worksheet_controller = self._sheet_controller.worksheet(self._config.finale_config.workshet_name)
+        return worksheets.FinaleWorksheet(
+            worksheet_controller=finale_worksheet_controller,
+            player_names_range=self._config.finale_config.player_names_range,
+            course_handicap_column=self._config.finale_config.course_handicap_column,
+            finale_handicap_index_column=self._config.finale_config.finale_handicap_index_column,
+            season_handicap_column=self._config.finale_config.season_handicap_column,
+        )
+
+    def _read_event_worksheets(
+        self,
+        players: list[str],
+        range_values: dict[str, list[list[str]]],
+        event_worksheets: dict[str, worksheets.EventWorksheet] | None = None,
+    ) -> read_data.SeasonViewReadEvents:
+        if event_worksheets is None:
+            event_worksheets = self._event_worksheets
+
         events_data: dict[str, read_data.SeasonViewReadEvent] = {}
         for event in self._config.event_names:
-            events_data[event] = self._event_worksheets[event].read()
+            values = range_values[self._event_read_range(event)]
+            worksheet_name = self._config.event_config(event_name=event).worksheet_name
+            with tracing.span("read worksheet", category="view", worksheet=worksheet_name):
+                events_data[event] = event_worksheets[event].read(values=values, players=players)
 
         return read_data.SeasonViewReadEvents(events_data)
 
@@ -0,0 +1,111 @@
+import hashlib
+import logging
+import os
+import pathlib
+import pickle
+from typing import NamedTuple
+
+from season_view.api import read_data
+
+logger = logging.getLogger(__name__)
+
+# Increment this when the structure of the read data changes so that snapshots written by older code are ignored.
+SNAPSHOT_FORMAT_VERSION = 2
+
+
+class ReadSnapshotKey(NamedTuple):
+    sheet_id: str
+    revision_token: str
+    # Digest of any local configuration that affects how the sheet is read or how the read data is used.
+    config_digest: str
+
+
+class ReadSnapshot(NamedTuple):
+    format_version: int
+    key: ReadSnapshotKey
+    read_data: read_data.SeasonViewReadData
+
+
+def config_digest(*config_parts: str) -> str:
+    digest = hashlib.sha256()
+    for part in config_parts:
+        digest.update(part.encode())
+        # Separate the parts so that ("ab", "c") and ("a", "bc") produce different digests.
+        digest.update(b"\0")
+
+    return digest.hexdigest()
+
+
+class ReadSnapshotCache:
+    """Local disk cache of the data that was last read from a season sheet.
+
+    One snapshot is kept per sheet. A snapshot is only returned when its key matches the requested key exactly, so a
+    snapshot becomes stale as soon as the sheet is modified or the local configuration changes. Snapshots are also
+    kept in memory once they're loaded or stored, so a long-running process only reads each snapshot from disk once.
+    """
+
+    def __init__(self, cache_dir: pathlib.Path, config_salt: str = "") -> None:
+        self._cache_dir = cache_dir
+        # Additional configuration, owned by the caller, that invalidates snapshots when it changes.
+        self._config_salt = config_salt
+        self._snapshots: dict[str, ReadSnapshot] = {}
+
+    def key(self, sheet_id: str, revision_token: str, view_config: str) -> ReadSnapshotKey:
+        return ReadSnapshotKey(
+            sheet_id=sheet_id,
+            revision_token=revision_token,
+            config_digest=config_digest(view_config, self._config_salt),
+        )
+
+    def load(self, key: ReadSnapshotKey) -> read_data.SeasonViewReadData | None:
+        snapshot = self._snapshots.get(key.sheet_id)
+        if snapshot is None:
+            snapshot = self._load_snapshot_file(key.sheet_id)
+            if snapshot is None:
+                return None
+
+            self._snapshots[key.sheet_id] = snapshot
+
+        if snapshot.key != key:
+            return None
+
+        return snapshot.read_data
+
+    def _load_snapshot_file(self, sheet_id: str) -> ReadSnapshot | None:
+        snapshot_file = self._snapshot_file(sheet_id)
+        if not snapshot_file.is_file():
+            return None
+
+        try:
+            with snapshot_file.open("rb") as file:
+                snapshot = pickle.load(file)
+        except Exception:
+            # A snapshot that can't be loaded is treated the same as a missing one. It will be replaced after the
+            # next full read.
+            logger.warning(f"Unable to load read snapshot from {snapshot_file}. It will be ignored.", exc_info=True)
+            return None
+
+        if not isinstance(snapshot, ReadSnapshot) or snapshot.format_version != SNAPSHOT_FORMAT_VERSION:
+            return None
+
+        return snapshot
+
+    def store(self, key: ReadSnapshotKey, data: read_data.SeasonViewReadData) -> None:
+        snapshot = ReadSnapshot(format_version=SNAPSHOT_FORMAT_VERSION, key=key, read_data=data)
+        self._snapshots[key.sheet_id] = snapshot
+
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+        snapshot_file = self._snapshot_file(key.sheet_id)
+
+        # Write to a temporary file first so that a snapshot is never left partially written.
+        temp_file = snapshot_file.with_suffix(".tmp")
+        with temp_file.open("wb") as file:
+            pickle.dump(snapshot, file)
+        os.replace(temp_file, snapshot_file)
+
+    def clear(self, sheet_id: str) -> None:
+        self._snapshots.pop(sheet_id, None)
+        self._snapshot_file(sheet_id).unlink(missing_ok=True)
+
+    def _snapshot_file(self, sheet_id: str) -> pathlib.Path:
+        return self._cache_dir / f"{sheet_id}.pickle"
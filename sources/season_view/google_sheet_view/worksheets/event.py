@@ -1,9 +1,10 @@
 import enum
 import logging
-from typing import Any
+from typing import TYPE_CHECKING
 
 import google_sheet
-import pandas as pd
+import numpy as np
+from google_sheet import diff as sheet_diff
 from google_sheet import utils as sheet_utils
 from season_common import scorecard
 
@@ -11,6 +12,11 @@ from season_view.api import read_data, write_data
 from season_view.api.write_data import SeasonViewWritePlayerIncompleteEvent
 from season_view.google_sheet_view.worksheets import name_utils
 
+# pandas is slow to import and is only needed to parse worksheet data, so it's imported where it's used. Runs that
+# reuse a read snapshot never import it.
+if TYPE_CHECKING:
+    import pandas as pd
+
 logger = logging.getLogger(__name__)
 
 FTR_WRITER_FORMATTING_ENABLED = True
@@ -73,6 +79,11 @@ READ_DATA_LAST_COLUMN = "HOLE_18"
 READ_DATA_FIRST_COL_INDEX = EVENT_WORKSHEET_COLUMN_NAMES.index(READ_DATA_FIRST_COLUMN)
 READ_DATA_LAST_COL_INDEX = EVENT_WORKSHEET_COLUMN_NAMES.index(READ_DATA_LAST_COLUMN)
 
+# The read range extends past the scorecard data through the computed columns, so that the values that are currently
+# displayed can be compared with the values that are written.
+READ_RANGE_LAST_COLUMN = "EVENT_RANK"
+READ_RANGE_LAST_COL_INDEX = EVENT_WORKSHEET_COLUMN_NAMES.index(READ_RANGE_LAST_COLUMN)
+
 
 class EventWorksheetError(Exception):
     pass
@@ -84,35 +95,56 @@ class EventWorksheet:
         event_name: str,
         worksheet_controller: google_sheet.GoogleWorksheet,
         scorecard_start_cell: str,
-        players: list[str],
     ) -> None:
         self._event_name = event_name
         self._worksheet_controller = worksheet_controller
         self._scorecard_start_cell = scorecard_start_cell
-        self._players = players
 
         self._verify_start_cell()
 
         # The player order must be stored between read and write events to ensure
         # that results are placed in the correct locations.
         self._players_ordered_at_read_time: list[str] = []
+        # The current values of the worksheet, when they're known, so that only cells whose values change are written.
+        self._current_values: sheet_diff.CurrentValues | None = None
+        # The background format of the scorecard cells, when it's fetched ahead of the write.
+        self._background_format: google_sheet.CellFormat | None = None
 
     def _verify_start_cell(self) -> None:
         if not sheet_utils.is_cell_a1_notation(self._scorecard_start_cell):
             raise EventWorksheetError(f"Scorecard start cell must be in A1 notation: {self._scorecard_start_cell}")
 
-    def read(self) -> read_data.SeasonViewReadEvent:
+    def read_range(self) -> str:
+        """The range, in A1 notation, whose values must be passed to the `read` method."""
+        return read_range(self._scorecard_start_cell)
+
+    def read(self, values: list[list[str]], players: list[str]) -> read_data.SeasonViewReadEvent:
         reader = EventWorksheetReader(
             event_name=self._event_name,
-            worksheet_controller=self._worksheet_controller,
             scorecard_start_cell=self._scorecard_start_cell,
-            players=self._players,
+            players=players,
         )
-        data = reader.read()
+        data = reader.read(values)
         self._players_ordered_at_read_time = reader.players_ordered_at_read_time
 
         return data
 
+    def set_current_values(self, values: google_sheet.CellValues) -> None:
+        """Set the unformatted values of the `read_range`, so that only cells whose values change are written.
+
+        The values that are passed to `read` can't be used, since they're formatted for display and a rounding number
+        format would hide changes to the results.
+        """
+        self._current_values = sheet_diff.CurrentValues(values=values, start_cell=self._scorecard_start_cell)
+
+    def fetch_background_format(self) -> None:
+        """Fetch the background format of the scorecard cells, which is used to format the worksheet when it's written.
+
+        Fetching the format is a request of its own which doesn't depend on the written data, so it can be made ahead
+        of the write, e.g. while the results are computed. Otherwise, it's fetched when the worksheet is written.
+        """
+        self._background_format = self._worksheet_controller.cell_format(self._scorecard_start_cell)
+
     def write(self, data: write_data.SeasonViewWriteEvent) -> None:
         if len(self._players_ordered_at_read_time) == 0:
             raise EventWorksheetError(
@@ -126,55 +158,67 @@ class EventWorksheet:
             worksheet_controller=self._worksheet_controller,
             scorecard_start_cell=self._scorecard_start_cell,
             players_ordered_at_read_time=self._players_ordered_at_read_time,
+            current_values=self._current_values,
+            background_format=self._background_format,
         ).write()
 
 
+def read_range(scorecard_start_cell: str) -> str:
+    """The range of event worksheet data to read for a given scorecard start cell.
+
+    The range is open-ended (e.g. "B6:AD") because the number of players isn't known until the players worksheet has
+    been read. This allows the event worksheets to be read in the same request as the players worksheet.
+    """
+    (_, start_col) = sheet_utils.a1_to_rowcol(scorecard_start_cell)
+    end_col = start_col + READ_RANGE_LAST_COL_INDEX - READ_DATA_FIRST_COL_INDEX
+    return f"{scorecard_start_cell}:{sheet_utils.column_idx_to_letter(end_col)}"
+
+
 class EventWorksheetReader:
     def __init__(
         self,
         event_name: str,
-        worksheet_controller: google_sheet.GoogleWorksheet,
         scorecard_start_cell: str,
         players: list[str],
     ) -> None:
         self._event_name = event_name
-        self._worksheet_controller = worksheet_controller
         self._scorecard_start_cell = scorecard_start_cell
         self._players = players
 
         self._players_ordered_at_read_time: list[str] = []
 
-    def read(self) -> read_data.SeasonViewReadEvent:
-        raw_data = self._raw_worksheet_data()
+    def read(self, values: list[list[str]]) -> read_data.SeasonViewReadEvent:
+        """Read the event from the values of the range returned by `read_range`."""
+        raw_data = self._raw_worksheet_data(values)
         data = self._process_raw_worksheet_data(raw_data)
         self._check_worksheet_data(data)
 
         self._set_players_ordered_at_read_time(data.index)
 
-        data_mod = sheet_utils.replace_empty_strings_with_none(data)
-
-        # TODO: This cycolmatic complexity stinks.
-        scorecards: dict[str, scorecard.Scorecard] = {}
-        for player in self._players:
-            if player in data_mod.index:
-                player_data = data_mod.loc[player]
-                if player_data.empty or any(player_data.isna()):
-                    scorecards[player] = scorecard.IncompleteScorecard()
-                else:
-                    hole_scores = {
-                        int(hole_name.replace("HOLE_", "")): int(hole_score)  # type: ignore
-                        for hole_name, hole_score in dict(player_data).items()
-                    }
-                    scorecards[player] = scorecard.scorecard_factory(hole_scores=hole_scores)
-            else:
-                scorecards[player] = scorecard.IncompleteScorecard()
-
-        return read_data.SeasonViewReadEvent(
+        return read_data.SeasonViewReadEvent.from_score_matrix(
             event_name=self._event_name,
-            player_scorecards=scorecards,
+            score_matrix=self._score_matrix(data),
         )
 
-    def _set_players_ordered_at_read_time(self, read_index: pd.Index) -> None:
+    def _score_matrix(self, worksheet_data: "pd.DataFrame") -> scorecard.EventScoreMatrix:
+        """Hole scores of the event's players, validated for the whole grid at once.
+
+        Empty cells are NaN in the processed data, so rows with any empty cell are incomplete scorecards. Players that
+        aren't in the worksheet have incomplete scorecards.
+        """
+        import pandas as pd
+
+        complete_scores = worksheet_data[worksheet_data.notna().all(axis=1)]
+        # If a player is listed more than once, the first complete scorecard is used.
+        complete_scores = complete_scores[~complete_scores.index.duplicated()]
+        player_scores = complete_scores.reindex(pd.Index(self._players))
+
+        return scorecard.EventScoreMatrix.from_hole_scores(
+            player_names=self._players,
+            hole_scores=player_scores.to_numpy(dtype=float, na_value=np.nan),
+        )
+
+    def _set_players_ordered_at_read_time(self, read_index: "pd.Index") -> None:
         # Drop empty player names. These indicate missing players in the worksheet.
         read_index_no_empties = read_index.delete(read_index == "")  # type: ignore
         read_players_ordered = list(read_index_no_empties)
@@ -191,21 +235,18 @@ class EventWorksheetReader:
             raise EventWorksheetError("The `read` method must be called before this property is accessed.")
         return self._players_ordered_at_read_time
 
-    def _raw_worksheet_data(self) -> pd.DataFrame:
-        return self._worksheet_controller.range_to_df(range=self._read_range())
-
-    def _read_range(self) -> str:
-        return f"{self._scorecard_start_cell}:{self._read_range_end_cell()}"
+    def _raw_worksheet_data(self, values: list[list[str]]) -> "pd.DataFrame":
+        import pandas as pd
 
-    def _read_range_end_cell(self) -> str:
-        (start_row, start_col) = sheet_utils.a1_to_rowcol(self._scorecard_start_cell)
+        # The read range is open-ended, so it may hold more or fewer rows than there are players. Trim or pad the
+        # values so that there is exactly one row per player, like a bounded range read of the player rows. Columns
+        # past the scorecard data are only read to compare with the values that are written.
+        num_rows = self._num_players()
+        num_cols = self._read_range_col_offset() + 1
+        scorecard_rows = [row[:num_cols] for row in values[:num_rows]]
+        player_rows = sheet_utils.fill_gaps(scorecard_rows, rows=num_rows, cols=num_cols)
 
-        end_row = start_row + self._read_range_row_offset()
-        end_col = start_col + self._read_range_col_offset()
-        return sheet_utils.rowcol_to_a1(row=end_row, col=end_col)
-
-    def _read_range_row_offset(self) -> int:
-        return self._num_players() - 1
+        return pd.DataFrame.from_records(player_rows)
 
     def _num_players(self) -> int:
         return len(self._players)
@@ -215,7 +256,9 @@ class EventWorksheetReader:
         last_col = READ_DATA_LAST_COL_INDEX
         return last_col - first_col
 
-    def _process_raw_worksheet_data(self, worksheet_data_raw: pd.DataFrame) -> pd.DataFrame:
+    def _process_raw_worksheet_data(self, worksheet_data_raw: "pd.DataFrame") -> "pd.DataFrame":
+        import pandas as pd
+
         worksheet_data = worksheet_data_raw.copy()
 
         # Set column labels from configuration
@@ -229,13 +272,13 @@ class EventWorksheetReader:
         worksheet_data.set_index(keys="PLAYER", inplace=True)
         worksheet_data.index = worksheet_data.index.map(name_utils.process_raw_player_name)
 
-        return sheet_utils.numericise_all_values(worksheet_data)
+        return sheet_utils.numericise_grid(worksheet_data)
 
-    def _check_worksheet_data(self, worksheet_data: pd.DataFrame) -> None:
+    def _check_worksheet_data(self, worksheet_data: "pd.DataFrame") -> None:
         self._check_column_headers(worksheet_data)
         self._check_data_values(worksheet_data)
 
-    def _check_column_headers(self, worksheet_data: pd.DataFrame) -> None:
+    def _check_column_headers(self, worksheet_data: "pd.DataFrame") -> None:
         expected_columns = [f"HOLE_{str(hole_num)}" for hole_num in range(1, 19)]
         if not list(worksheet_data.columns) == expected_columns:
             raise EventWorksheetError(
@@ -243,19 +286,17 @@ class EventWorksheetReader:
                 f"\nExpected: {expected_columns}, \nFound:{worksheet_data.columns}"
             )
 
-    def _check_data_values(self, worksheet_data: pd.DataFrame) -> None:
-        for row_name, row in worksheet_data.iterrows():
-            for col_name, value in row.items():
-                self._check_data_value(value=value, row_name=str(row_name), col_name=str(col_name))
+    def _check_data_values(self, worksheet_data: "pd.DataFrame") -> None:
+        # Empty cells are NaN in the processed data. Anything else must be a finite number.
+        is_invalid = ~sheet_utils.is_finite_number(worksheet_data) & worksheet_data.notna()
 
-    def _check_data_value(self, value: Any, row_name: str, col_name: str) -> None:
-        is_numeric = isinstance(value, (int, float))
-        is_empty = value == ""
-        is_numeric_or_empty = is_numeric or is_empty
-        if not is_numeric_or_empty:
+        invalid_position = sheet_utils.first_cell_position(is_invalid)
+        if invalid_position is not None:
+            (row_pos, col_pos) = invalid_position
             raise EventWorksheetError(
                 "Cell values in the event worksheet must be numeric values or empty."
-                f"The value at row: {row_name}, col: {col_name} is invalid. Found: {value}"
+                f"The value at row: {worksheet_data.index[row_pos]}, col: {worksheet_data.columns[col_pos]} is "
+                f"invalid. Found: {worksheet_data.iat[row_pos, col_pos]}"
             )
 
 
@@ -266,28 +307,47 @@ class EventWorksheetWriter:
         worksheet_controller: google_sheet.GoogleWorksheet,
         scorecard_start_cell: str,
         players_ordered_at_read_time: list[str],
+        current_values: sheet_diff.CurrentValues | None = None,
+        background_format: google_sheet.CellFormat | None = None,
     ) -> None:
         self._data = data
         self._worksheet_controller = worksheet_controller
         self._scorecard_start_cell = scorecard_start_cell
         self._players_ordered_at_read_time = players_ordered_at_read_time
+        # When the current values are known, only the cells whose values change are written.
+        self._current_values = current_values
+        # The background format of the scorecard cells is fetched when formatting unless it was fetched already.
+        self._background_format = background_format
+        # Players that are missing from the write data are written with the worst event rank.
+        self._worst_event_rank = max((player.event_rank for player in data.players), default=0)
 
     def write(self) -> None:
         self._write_data()
-        self._sort()
 
+        # The rows are formatted where they're written, before they're sorted. Sorting moves each row's formats with
+        # it, so the formats stay with their players without predicting the order that the sort puts tied players in.
         if FTR_WRITER_FORMATTING_ENABLED:
             self._format()
 
+        self._sort()
+
     def _write_data(self) -> None:
         write_ranges = [
             self._player_names_write_range(),
             self._front_nine_write_range(data=self._data),
             self._back_nine_and_event_results_write_range(data=self._data),
         ]
-        self._worksheet_controller.write_multiple_ranges(write_ranges)
+        if self._current_values is not None:
+            write_ranges = sheet_diff.changed_range_values(write_ranges, self._current_values)
+
+        if len(write_ranges) > 0:
+            self._worksheet_controller.write_multiple_ranges(write_ranges)
 
     def _sort(self) -> None:
+        if self._is_sorted_as_written():
+            # Sorting rows that are already in order would not move anything.
+            return
+
         # Sort the full range of data that we manage in the sheet.
         sort_range = self._range_for_columns(
             start_col_offset=EventWorksheetColumnOffsets.PLAYER,
@@ -302,7 +362,7 @@ class EventWorksheetWriter:
         self._worksheet_controller.sort_range(specs=[sort_spec], range_name=sort_range)
 
     def _format(self) -> None:
-        player_rows = self._player_name_to_ws_row_map()
+        player_rows = self._player_name_to_written_row_map()
 
         formats = self._hole_cell_background_reset_formats()
         formats.extend(self._birdie_cell_background_formats(player_rows))
@@ -351,7 +411,7 @@ class EventWorksheetWriter:
                 )
                 player_data = SeasonViewWritePlayerIncompleteEvent(
                     name=player_name,
-                    event_rank=max([d.event_rank for d in data.players]),
+                    event_rank=self._worst_event_rank,
                     event_points=0,
                     gross_points=0,
                     net_points=0,
@@ -387,7 +447,7 @@ class EventWorksheetWriter:
                 # Intentionally not logging a warning here since it's done above
                 player_data = SeasonViewWritePlayerIncompleteEvent(
                     name=player_name,
-                    event_rank=max([d.event_rank for d in data.players]),
+                    event_rank=self._worst_event_rank,
                     event_points=0,
                     gross_points=0,
                     net_points=0,
@@ -433,9 +493,6 @@ class EventWorksheetWriter:
         (row, _) = self._first_player_row_col()
         return row
 
-    def _last_player_row(self) -> int:
-        return self._first_player_row() + self._num_players() - 1
-
     def _column_letter_for_offset(self, col_offset: EventWorksheetColumnOffsets) -> str:
         (_, first_player_col) = self._first_player_row_col()
         col_idx = first_player_col + col_offset.value
@@ -444,19 +501,26 @@ class EventWorksheetWriter:
     def _num_players(self) -> int:
         return len(self._players_ordered_at_read_time)
 
-    def _player_name_to_ws_row_map(self) -> dict[str, int]:
-        """A dictionary mapping player names to worksheet rows as they are currently in the worksheet."""
-        column = self._column_letter_for_offset(EventWorksheetColumnOffsets.PLAYER)
+    def _player_name_to_written_row_map(self) -> dict[str, int]:
+        """A dictionary mapping player names to the worksheet rows that they're written to, before the sort.
+
+        Rows are derived from the data being written instead of being read back from the worksheet, since the
+        written values may still be buffered when formatting is requested.
+        """
         first_row = self._first_player_row()
-        last_row = self._last_player_row()
-        player_names = self._worksheet_controller.column_range_values(
-            column=column,
-            first_row=first_row,
-            last_row=last_row,
-        )
+        return {player_name: first_row + idx for idx, player_name in enumerate(self._players_ordered_at_read_time)}
+
+    def _is_sorted_as_written(self) -> bool:
+        """Whether the players are written in the order that the worksheet is sorted in."""
+        ranks = [self._player_event_rank(player_name) for player_name in self._players_ordered_at_read_time]
+        return all(rank <= next_rank for rank, next_rank in zip(ranks, ranks[1:]))
 
-        name_row_map = {player_name: first_row + idx for idx, player_name in enumerate(player_names)}
-        return name_row_map
+    def _player_event_rank(self, player_name: str) -> int:
+        """The event rank written for a player, which is the sort key for the worksheet."""
+        try:
+            return self._data.get_player(player_name).event_rank
+        except KeyError:
+            return self._worst_event_rank
 
     def _hole_cell_background_reset_formats(self) -> list[google_sheet.RangeFormat]:
         """A list of RangeFormat objects which will reset all player hole scores to the standars background color."""
@@ -470,7 +534,9 @@ class EventWorksheetWriter:
         )
 
         # Reference the scorecard start cell as the default background format for scorecard cells
-        background_format = self._worksheet_controller.cell_format(self._scorecard_start_cell)
+        background_format = self._background_format
+        if background_format is None:
+            background_format = self._worksheet_controller.cell_format(self._scorecard_start_cell)
 
         return [
             google_sheet.RangeFormat(range=holes_range, format=background_format)
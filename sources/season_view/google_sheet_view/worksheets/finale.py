@@ -28,16 +28,33 @@ class FinaleWorksheet:
         self.finale_handicap_index_column = finale_handicap_index_column
         self.course_handicap_column = course_handicap_column
 
+        # The players in the finale handicaps section must be stored between read and write events
+        # to ensure that results are placed in the correct locations.
+        self._players: list[str] = []
+
     def _verify_configuration(self) -> None:
         if not sheet_utils.is_range_a1_notation(self.player_names_range):
             raise FinaleWorksheetError(f"Player names range must be in A1:B2 notation: {self.player_names_range}")
 
         ## TODO: Add more checks that configured columns are columns labels
 
+    def read_range(self) -> str:
+        """The range, in A1 notation, whose values must be passed to the `read` method."""
+        return self.player_names_range
+
+    def read(self, values: list[list[str]]) -> None:
+        """Read the players that are in the handicaps section."""
+        # The player names range is a single column, so take the first value of each row.
+        self._players = [row[0] for row in values]
+
     def write(self, data: write_data.SeasonViewWriteFinaleData) -> None:
-        # Before writing, read the players that are in the handicaps section
-        # Since range_to_df returns a dataframe, we have to use `[0]` to turn it into a series
-        players = self._worksheet_controller.range_to_df(range=self.player_names_range)[0].to_list()
+        if len(self._players) == 0:
+            raise FinaleWorksheetError(
+                f"An unexpected error has occurred. This error suggests that a {self.__class__.__name__} "
+                "instance was not read before it was written to. Check your implementation to ensure that "
+                "a read event occurs before a write event."
+            )
+        players = self._players
 
         season_handicaps: list[float] = []
         finale_handicap_indices: list[float] = []
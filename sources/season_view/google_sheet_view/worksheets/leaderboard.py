@@ -1,6 +1,7 @@
 import enum
 
 import google_sheet
+from google_sheet import diff as sheet_diff
 from google_sheet import utils as sheet_utils
 
 from season_view.api.write_data import SeasonViewWriteLeaderboard, SeasonViewWriteLeaderboardPlayer
@@ -54,6 +55,20 @@ class LeaderboardColumns(enum.Enum):
 FIRST_PLAYER_ROW = 4
 
 
+def read_range(ordered_event_names: list[str]) -> str:
+    """The range of leaderboard values to read so that only changed values are written.
+
+    The range spans all of the written columns and is open-ended (e.g. "B4:U") because the number of players isn't
+    known until the players worksheet has been read.
+    """
+    first_event_col_idx = sheet_utils.column_letter_to_idx(str(LeaderboardColumns.FIRST_EVENT))
+    last_event_col_idx = first_event_col_idx + len(ordered_event_names) - 1
+    last_column_col_idx = max(sheet_utils.column_letter_to_idx(str(column)) for column in LeaderboardColumns)
+    last_col = sheet_utils.column_idx_to_letter(max(last_event_col_idx, last_column_col_idx))
+
+    return f"{LeaderboardColumns.SEASON_RANK}{FIRST_PLAYER_ROW}:{last_col}"
+
+
 class LeadberboardWorksheetError(Exception):
     pass
 
@@ -64,11 +79,18 @@ class LeaderboardWorksheet:
         data: SeasonViewWriteLeaderboard,
         worksheet_controller: google_sheet.GoogleWorksheet,
         ordered_event_names: list[str],
+        current_values: google_sheet.CellValues | None = None,
     ) -> None:
         self._data = data
         self._worksheet_controller = worksheet_controller
         self._ordered_event_names = ordered_event_names
 
+        # The unformatted values of the `read_range`, when known, are used to only write values that change.
+        self._current_values: sheet_diff.CurrentValues | None = None
+        if current_values is not None:
+            start_cell = read_range(ordered_event_names).split(":")[0]
+            self._current_values = sheet_diff.CurrentValues(values=current_values, start_cell=start_cell)
+
     def write(self) -> None:
         sorted_player_data = self._data.players_rank_sorted()
 
@@ -79,7 +101,11 @@ class LeaderboardWorksheet:
             self._net_strokes_finishes_write_range(sorted_player_data),
             self._notable_holes_write_range(sorted_player_data),
         ]
-        self._worksheet_controller.write_multiple_ranges(write_ranges)
+        if self._current_values is not None:
+            write_ranges = sheet_diff.changed_range_values(write_ranges, self._current_values)
+
+        if len(write_ranges) > 0:
+            self._worksheet_controller.write_multiple_ranges(write_ranges)
 
     def _standings_write_range(
         self,
@@ -1,10 +1,16 @@
-import google_sheet
-import pandas as pd
+from typing import TYPE_CHECKING
+
+from google_sheet import utils as sheet_utils
 from season_common import player
 
 from season_view.api import read_data
 from season_view.google_sheet_view.worksheets import name_utils
 
+# pandas is slow to import and is only needed to parse worksheet data, so it's imported where it's used. Runs that
+# reuse a read snapshot never import it.
+if TYPE_CHECKING:
+    import pandas as pd
+
 HEADER_ROW = 2
 
 PLAYER_COLUMN = "Golfer"
@@ -19,14 +25,13 @@ class PlayersWorksheetError(Exception):
 class PlayersWorksheet:
     def __init__(
         self,
-        worksheet_controller: google_sheet.GoogleWorksheet,
         events: list[str],
     ) -> None:
-        self.worksheet_controller = worksheet_controller
         self.events = events
 
-    def read(self) -> read_data.SeasonViewReadPlayers:
-        raw_data = self.worksheet_controller.to_df(header_row=HEADER_ROW)
+    def read(self, values: list[list[str]]) -> read_data.SeasonViewReadPlayers:
+        """Read players from the values of the entire players worksheet."""
+        raw_data = sheet_utils.records_df(values, header_row=HEADER_ROW)
 
         data = PlayersWorksheetData(raw_data=raw_data, events=self.events)
 
@@ -37,7 +42,7 @@ class PlayersWorksheet:
 
 
 class PlayersWorksheetData:
-    def __init__(self, raw_data: pd.DataFrame, events: list[str]) -> None:
+    def __init__(self, raw_data: "pd.DataFrame", events: list[str]) -> None:
         self._raw_data = raw_data
         self._events = events
 
@@ -64,6 +69,8 @@ class PlayersWorksheetData:
             raise PlayersWorksheetError(f"Players worksheet is missing required columns: {missing_columns}")
 
     def _cleanse_raw_data(self) -> None:
+        import pandas as pd
+
         self._raw_data.columns = pd.Index(self._available_columns_lower)
         self._raw_data.set_index(keys=PLAYER_COLUMN.lower(), inplace=True)
 
@@ -90,7 +97,9 @@ class PlayersWorksheetData:
 
         return _players
 
-    def player_handicaps(self, player_data_raw: pd.Series) -> read_data.SeasonViewEventHandicapIndices:
+    def player_handicaps(self, player_data_raw: "pd.Series") -> read_data.SeasonViewEventHandicapIndices:
+        import pandas as pd
+
         events_lower = [event.lower() for event in self._events]
 
         # Extract the event handicap columns from the raw player data
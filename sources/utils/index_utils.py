@@ -0,0 +1,31 @@
+from typing import Iterable
+
+
+class NameIndex:
+    """Positions of named items in a sequence, so that items can be looked up by name in constant time.
+
+    The index is built once, so the sequence of items must not change after the index is created.
+    """
+
+    def __init__(self, names: Iterable[str]) -> None:
+        self._positions: dict[str, int] = {}
+        self._duplicate_names: set[str] = set()
+
+        for position, name in enumerate(names):
+            if name in self._positions:
+                self._duplicate_names.add(name)
+            else:
+                self._positions[name] = position
+
+    def position(self, name: str) -> int | None:
+        """Position of the first item with the name, or None if there are no items with the name."""
+        return self._positions.get(name)
+
+    def is_duplicated(self, name: str) -> bool:
+        return name in self._duplicate_names
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._positions
+
+    def __len__(self) -> int:
+        return len(self._positions)
@@ -0,0 +1,123 @@
+import contextlib
+import json
+import os
+import pathlib
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, ContextManager, Iterator
+
+
+@dataclass(frozen=True)
+class Span:
+    name: str
+    category: str
+    # Seconds since the tracer was created.
+    start_seconds: float
+    duration_seconds: float
+    thread_id: int
+    args: dict[str, Any] = field(default_factory=dict)
+
+
+class Tracer:
+    """Records timed spans of a run, which can be written as a Chrome trace.
+
+    Spans may be nested and may be recorded from multiple threads. The trace can be viewed in chrome://tracing or
+    https://ui.perfetto.dev.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter) -> None:
+        self.clock = clock
+        self._origin = clock()
+        self._spans: list[Span] = []
+        self._lock = threading.Lock()
+
+    @property
+    def spans(self) -> list[Span]:
+        return self._spans
+
+    @contextlib.contextmanager
+    def span(self, name: str, category: str = "run", **args: Any) -> Iterator[None]:
+        start = self.clock()
+        try:
+            yield
+        finally:
+            end = self.clock()
+            span = Span(
+                name=name,
+                category=category,
+                start_seconds=start - self._origin,
+                duration_seconds=end - start,
+                thread_id=threading.get_ident(),
+                args=args,
+            )
+            with self._lock:
+                self._spans.append(span)
+
+    def chrome_trace(self) -> dict[str, Any]:
+        """The spans as complete events in the Chrome trace event format."""
+        process_id = os.getpid()
+        trace_events = [
+            {
+                "name": span.name,
+                "cat": span.category,
+                "ph": "X",
+                "ts": span.start_seconds * 1e6,
+                "dur": span.duration_seconds * 1e6,
+                "pid": process_id,
+                "tid": span.thread_id,
+                "args": {key: _trace_arg(value) for key, value in span.args.items()},
+            }
+            for span in sorted(self._spans, key=lambda span: span.start_seconds)
+        ]
+
+        return {"traceEvents": trace_events, "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(self, path: pathlib.Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.chrome_trace()))
+
+    def summary(self) -> str:
+        """Total time and number of spans by name, slowest first."""
+        totals: dict[str, tuple[float, int]] = {}
+        for span in self._spans:
+            (seconds, count) = totals.get(span.name, (0.0, 0))
+            totals[span.name] = (seconds + span.duration_seconds, count + 1)
+
+        lines = ["Time by span, slowest first:"]
+        for name, (seconds, count) in sorted(totals.items(), key=lambda item: -item[1][0]):
+            lines.append(f"  {name}: {seconds:.3f}s ({count} spans)")
+
+        return "\n".join(lines)
+
+
+# The tracer that spans are recorded by. Spans aren't recorded when no tracer is active.
+_active_tracer: Tracer | None = None
+
+
+@contextlib.contextmanager
+def activate(tracer: Tracer) -> Iterator[Tracer]:
+    """Record all spans that are started while the context is active with a tracer."""
+    global _active_tracer
+    previous_tracer = _active_tracer
+    _active_tracer = tracer
+    try:
+        yield tracer
+    finally:
+        _active_tracer = previous_tracer
+
+
+def span(name: str, category: str = "run", **args: Any) -> ContextManager[None]:
+    """Time a block of code with the active tracer. This does nothing when no tracer is active."""
+    tracer = _active_tracer
+    if tracer is None:
+        return contextlib.nullcontext()
+
+    return tracer.span(name, category, **args)
+
+
+def _trace_arg(value: Any) -> Any:
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+
+    return str(value)
@@ -1,5 +1,12 @@
+import json
+import pathlib
+import pstats
+from unittest import mock
+
+import season_config
 from app import run_sfsgt_scoring
 from click import testing as click_testing
+from utils import tracing
 
 
 def test_cli_missing_season_fails() -> None:
@@ -31,3 +38,97 @@ def check_cli_fail(result: click_testing.Result, expected_output: str | None = N
     assert result.exit_code != 0, "CLI call succeeded, but was expected to fail."
     if expected_output is not None:
         assert expected_output in result.output
+
+
+def test_profile_run_writes_trace_and_stats(tmp_path: pathlib.Path) -> None:
+    trace_file = tmp_path / "profile" / "trace.json"
+    stats_file = tmp_path / "profile" / "run.pstats"
+
+    with run_sfsgt_scoring.profile_run(trace_file=trace_file, stats_file=stats_file):
+        with tracing.span("read", category="controller"):
+            sum(range(1000))
+
+    trace = json.loads(trace_file.read_text())
+    assert [event["name"] for event in trace["traceEvents"]] == ["read"]
+    assert len(pstats.Stats(str(stats_file)).get_stats_profile().func_profiles) > 0
+
+
+def test_profile_run_without_files_does_not_trace(tmp_path: pathlib.Path) -> None:
+    with run_sfsgt_scoring.profile_run():
+        with tracing.span("read", category="controller"):
+            pass
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_cli_watch_with_dev_mode_fails() -> None:
+    result = invoke_cli(["--season", "2025", "--dev-mode", "--watch"])
+    check_cli_fail(result, expected_output="--watch can't be used with --dev-mode")
+
+
+def test_cli_watch_with_profile_fails(tmp_path: pathlib.Path) -> None:
+    result = invoke_cli(["--season", "2025", "--watch", "--profile", str(tmp_path / "trace.json")])
+    check_cli_fail(result, expected_output="--profile can't be used with --watch")
+
+    result = invoke_cli(["--season", "2025", "--watch", "--profile-stats", str(tmp_path / "run.pstats")])
+    check_cli_fail(result, expected_output="--profile-stats can't be used with --watch")
+
+
+def test_cli_runs_several_seasons_as_batch() -> None:
+    results = [
+        run_sfsgt_scoring.BatchSeasonResult("2024", elapsed_seconds=1.0),
+        run_sfsgt_scoring.BatchSeasonResult("2025", elapsed_seconds=1.0),
+    ]
+    with (
+        mock.patch.object(run_sfsgt_scoring, "setup_logging"),
+        mock.patch.object(run_sfsgt_scoring, "run_batch_mode_app", return_value=results) as run_batch_mode_app,
+    ):
+        result = invoke_cli(["--season", "2024", "--season", "2025", "--force", "--workers", "2"])
+
+    check_cli_pass(result)
+    run_batch_mode_app.assert_called_once_with(season_names=["2024", "2025"], is_forced=True, max_workers=2)
+
+
+def test_cli_batch_fails_when_a_season_fails() -> None:
+    results = [
+        run_sfsgt_scoring.BatchSeasonResult("2024", elapsed_seconds=1.0),
+        run_sfsgt_scoring.BatchSeasonResult("2025", elapsed_seconds=1.0, error="ValueError: Invalid hole score"),
+    ]
+    with (
+        mock.patch.object(run_sfsgt_scoring, "setup_logging"),
+        mock.patch.object(run_sfsgt_scoring, "run_batch_mode_app", return_value=results),
+    ):
+        result = invoke_cli(["--season", "2024", "--season", "2025"])
+
+    check_cli_fail(result, expected_output="Seasons failed: 2025")
+
+
+def test_cli_duplicate_season_fails() -> None:
+    result = invoke_cli(["--season", "2025", "--season", "2025"])
+    check_cli_fail(result, expected_output="Each season can only be given once")
+
+
+def test_cli_batch_with_watch_fails() -> None:
+    result = invoke_cli(["--season", "2024", "--season", "2025", "--watch"])
+    check_cli_fail(result, expected_output="--watch can't be used with more than one season")
+
+
+def test_batch_scheduler_config_uses_strictest_limits() -> None:
+    season_cfg = season_config.load_season_config("2025")
+    strict_season_cfg = season_cfg.model_copy(
+        update={
+            "sheet_api_limits": season_config.SheetApiLimitsConfig(
+                read_requests_per_minute=30,
+                write_requests_per_minute=600,
+                max_retries=2,
+                max_backoff_seconds=128.0,
+            )
+        }
+    )
+
+    scheduler_config = run_sfsgt_scoring.batch_scheduler_config([season_cfg, strict_season_cfg])
+
+    assert scheduler_config.read_requests_per_minute == 30
+    assert scheduler_config.write_requests_per_minute == season_cfg.sheet_api_limits.write_requests_per_minute
+    assert scheduler_config.max_retries == 2
+    assert scheduler_config.max_backoff_seconds == season_cfg.sheet_api_limits.max_backoff_seconds
@@ -0,0 +1,56 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+# Startup budget for importing the CLI module. Importing it with all of the season packages took about 700ms, and
+# importing it with only click takes about 35ms, so the budget catches any heavy import without being flaky.
+CLI_IMPORT_BUDGET_SECONDS = 0.25
+
+# Modules that must not be imported until a season is run.
+HEAVY_MODULES = ["pandas", "numpy", "gspread", "gspread_formatting", "pydantic", "google_sheet", "season_model"]
+
+
+def import_times(module: str) -> dict[str, float]:
+    """Cumulative import time in seconds of every module imported by importing a module in a fresh interpreter."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    times: dict[str, float] = {}
+    for line in result.stderr.splitlines():
+        # Lines look like: "import time:       self [us] |  cumulative | imported package"
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+
+        (_, cumulative_us, name) = line.split("|")
+        times[name.strip()] = int(cumulative_us) / 1e6
+
+    return times
+
+
+@pytest.fixture(scope="module")
+def cli_import_times() -> dict[str, float]:
+    return import_times("app.run_sfsgt_scoring")
+
+
+def test_cli_import_does_not_import_heavy_modules(cli_import_times: dict[str, float]) -> None:
+    assert [module for module in HEAVY_MODULES if module in cli_import_times] == []
+
+
+def test_cli_import_is_within_budget(cli_import_times: dict[str, float]) -> None:
+    assert cli_import_times["app.run_sfsgt_scoring"] < CLI_IMPORT_BUDGET_SECONDS
+
+
+def test_season_packages_do_not_import_pandas() -> None:
+    # pandas is only needed to parse worksheet data, which isn't needed when a read snapshot is reused.
+    season_import_times = import_times("season_controller")
+
+    assert "season_controller" in season_import_times
+    assert "pandas" not in season_import_times
+    assert "gspread_formatting" not in season_import_times
@@ -0,0 +1,91 @@
+"""Scaling benchmarks for the season pipeline, which are deselected by default.
+
+Run them with: pytest tests/benchmarks -k benchmark --no-cov
+"""
+
+import random
+import time
+
+import numpy as np
+import pytest
+import season_model
+from courses import Course, TeeInfo
+from season_common import player, scorecard
+from season_controller.delegate.model_to_view import SeasonModelToViewDelegate
+
+NUM_EVENTS = 5
+PLAYER_COUNTS = [20, 100, 500, 1000, 5000]
+
+BENCHMARK_COURSE = Course(
+    name="Benchmark",
+    hole_pars=[4, 5, 4, 3, 4, 4, 3, 4, 5, 5, 4, 4, 3, 4, 3, 4, 4, 5],
+    mens_tees={"blue": TeeInfo(rating=71.3, slope=133)},
+    womens_tees={"red": TeeInfo(rating=69.5, slope=129)},
+)
+
+
+def build_season_input(num_players: int, seed: int = 0) -> season_model.SeasonModelInput:
+    rng = np.random.default_rng(seed)
+    player_names = [f"Player {idx}" for idx in range(num_players)]
+    players = [
+        player.Player(name=name, gender=random.Random(idx).choice(list(player.PlayerGender)))
+        for idx, name in enumerate(player_names)
+    ]
+    pars = np.array(BENCHMARK_COURSE.hole_pars_)
+
+    events: list[season_model.SeasonModelEventInput] = []
+    for event_num in range(NUM_EVENTS):
+        hole_scores = (pars + rng.integers(-1, 4, size=(num_players, 18))).astype(float)
+        # About one in ten players misses each event.
+        hole_scores[rng.random(num_players) < 0.1, 0] = np.nan
+        score_matrix = scorecard.EventScoreMatrix.from_hole_scores(player_names=player_names, hole_scores=hole_scores)
+        handicap_indices = rng.integers(0, 300, size=num_players) / 10
+
+        events.append(
+            season_model.SeasonModelEventInput(
+                event_name=f"Event {event_num}",
+                course=BENCHMARK_COURSE,
+                tees=season_model.SeasonModelEventTees(mens_tee="blue", womens_tee="red"),
+                event_type=season_model.SeasonModelEventType.STANDARD,
+                players=[
+                    season_model.SeasonModelEventPlayerInput(
+                        handicap_index=float(handicap_index),
+                        scorecard=score_matrix.scorecard(player_.name),
+                        player=player_,
+                    )
+                    for player_, handicap_index in zip(players, handicap_indices)
+                ],
+            )
+        )
+
+    return season_model.SeasonModelInput(
+        player_names=player_names,
+        events=season_model.SeasonModelEventInputs(events=events),
+    )
+
+
+def run_pipeline(season_input: season_model.SeasonModelInput) -> float:
+    """Seconds to calculate the season results and convert them to view write data."""
+    start = time.perf_counter()
+    results = season_model.ConcreteSeasonModel().calculate_results(season_input)
+    write_data = SeasonModelToViewDelegate(model_results=results, finale_data=None).generate_view_write_data()
+    for event_name in results.event_names():
+        event_write_data = write_data.get_event(event_name)
+        for player_name in results.player_names():
+            event_write_data.get_player(player_name)
+
+    return time.perf_counter() - start
+
+
+@pytest.mark.benchmark
+def test_pipeline_scales_linearly_with_players() -> None:
+    seconds_per_player: dict[int, float] = {}
+    for num_players in PLAYER_COUNTS:
+        season_input = build_season_input(num_players)
+        seconds = min(run_pipeline(season_input) for _ in range(2))
+        seconds_per_player[num_players] = seconds / num_players
+        print(f"{num_players:>5} players: {seconds:.3f}s, {1e6 * seconds / num_players:.0f}us per player")
+
+    # The time per player stays flat when the pipeline is linear. Allow for noise and fixed costs, but not for the
+    # 250x growth in the time per player that a quadratic pipeline would have from 20 to 5,000 players.
+    assert seconds_per_player[PLAYER_COUNTS[-1]] < 3 * seconds_per_player[PLAYER_COUNTS[1]]
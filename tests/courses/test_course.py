@@ -146,6 +146,57 @@ def test_hole_par() -> None:
         assert course_obj.hole_par(16) == 4
 
 
+def test_tee_table() -> None:
+    with temp_course_yaml_file() as course_file:
+        course_obj = course.load_course_file(course_file)
+        tee_table = course_obj.tee_table(tee_name="white", player_gender=player.PlayerGender.FEMALE)
+
+        assert tee_table.rating == 71.9
+        assert tee_table.slope == 122
+        assert tee_table.par == 72
+        assert tee_table.hole_pars.tolist() == course_obj.hole_pars_
+        assert tee_table.max_hole_strokes.tolist() == [2 * par + 2 for par in course_obj.hole_pars_]
+        assert course_obj.tee_table(tee_name="white", player_gender=player.PlayerGender.FEMALE) is tee_table
+
+
+def test_tee_table_cant_find_tee_name_raises_error() -> None:
+    with temp_course_yaml_file() as course_file:
+        course_obj = course.load_course_file(course_file)
+        with pytest.raises(KeyError):
+            course_obj.tee_table(tee_name="green", player_gender=player.PlayerGender.MALE)
+
+
+@pytest.mark.parametrize(
+    "player_gender, tee", [(player.PlayerGender.MALE, "blue"), (player.PlayerGender.FEMALE, "green")]
+)
+def test_tee_table_arrays_match_scalar_methods(player_gender: player.PlayerGender, tee: str) -> None:
+    with temp_course_yaml_file() as course_file:
+        course_obj = course.load_course_file(course_file)
+        tee_table = course_obj.tee_table(tee_name=tee, player_gender=player_gender)
+        # Handicap indices in tenths, which include values whose course handicaps are exactly halfway.
+        handicap_indices = [idx / 10 for idx in range(-50, 541)]
+        gross_strokes = list(range(60, 140))
+
+        assert tee_table.course_handicaps(handicap_indices).tolist() == [
+            course_obj.course_handicap(tee=tee, player_hcp_index=hcp_index, player_gender=player_gender)
+            for hcp_index in handicap_indices
+        ]
+        assert tee_table.scoring_differentials(gross_strokes) == [
+            course_obj.scoring_differential(tee=tee, gross_strokes=strokes, player_gender=player_gender)
+            for strokes in gross_strokes
+        ]
+
+
+def test_courses_with_cached_tee_tables_are_equal() -> None:
+    with temp_course_yaml_file() as course_file:
+        course_obj = course.load_course_file(course_file)
+        other_course_obj = course.load_course_file(course_file)
+        course_obj.tee_table(tee_name="blue")
+        other_course_obj.tee_table(tee_name="blue")
+
+        assert course_obj == other_course_obj
+
+
 NOMINAL_TEE_RATING = (course.MIN_TEE_RATING + course.MAX_TEE_RATING) / 2
 NOMINAL_TEE_SLOPE = int((course.MIN_TEE_SLOPE + course.MAX_TEE_SLOPE) / 2)
 
@@ -0,0 +1,128 @@
+import os
+import pathlib
+from unittest import mock
+
+import pytest
+from courses import index, provider
+
+from tests.courses.test_course_provider import BAYLANDS_COURSE_DATA_YAML, PRESIDIO_COURSE_DATA_YAML
+
+
+@pytest.fixture
+def courses_dir(tmp_path: pathlib.Path) -> pathlib.Path:
+    courses_dir = tmp_path / "courses"
+    courses_dir.mkdir()
+    (courses_dir / "baylands.yaml").write_text(BAYLANDS_COURSE_DATA_YAML)
+    (courses_dir / "presidio.yaml").write_text(PRESIDIO_COURSE_DATA_YAML)
+    return courses_dir
+
+
+@pytest.fixture
+def index_file(tmp_path: pathlib.Path) -> pathlib.Path:
+    return tmp_path / "cache" / "course_index.json"
+
+
+def load_or_build_counting_parses(courses_dir: pathlib.Path, index_file: pathlib.Path) -> tuple[index.CourseIndex, int]:
+    with mock.patch.object(index, "load_course_file", wraps=index.load_course_file) as load_course_file:
+        course_index = index.CourseIndex.load_or_build(courses_dir=courses_dir, index_file=index_file)
+
+    return (course_index, load_course_file.call_count)
+
+
+def test_build_index_and_reuse_it(courses_dir: pathlib.Path, index_file: pathlib.Path) -> None:
+    (course_index, num_parses) = load_or_build_counting_parses(courses_dir, index_file)
+    assert num_parses == 2
+    assert [entry.course_name for entry in course_index.entries] == ["baylands", "presidio"]
+    assert index_file.is_file()
+
+    (reused_index, num_parses) = load_or_build_counting_parses(courses_dir, index_file)
+    assert num_parses == 0
+    assert reused_index.entries == course_index.entries
+
+
+def test_touched_file_with_unchanged_content_is_not_parsed(
+    courses_dir: pathlib.Path,
+    index_file: pathlib.Path,
+) -> None:
+    (course_index, _) = load_or_build_counting_parses(courses_dir, index_file)
+    baylands_file = courses_dir / "baylands.yaml"
+    stat = baylands_file.stat()
+    os.utime(baylands_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    (touched_index, num_parses) = load_or_build_counting_parses(courses_dir, index_file)
+
+    assert num_parses == 0
+    assert touched_index.entries[0].mtime_ns == stat.st_mtime_ns + 1_000_000_000
+    assert touched_index.entries[0].course_json == course_index.entries[0].course_json
+
+
+def test_modified_and_removed_files_update_the_index(courses_dir: pathlib.Path, index_file: pathlib.Path) -> None:
+    load_or_build_counting_parses(courses_dir, index_file)
+    (courses_dir / "baylands.yaml").write_text(BAYLANDS_COURSE_DATA_YAML.replace("baylands", "baylands golf links"))
+    (courses_dir / "presidio.yaml").unlink()
+
+    (course_index, num_parses) = load_or_build_counting_parses(courses_dir, index_file)
+
+    assert num_parses == 1
+    assert [entry.course_name for entry in course_index.entries] == ["baylands golf links"]
+
+
+def test_corrupt_index_is_rebuilt(courses_dir: pathlib.Path, index_file: pathlib.Path) -> None:
+    index_file.parent.mkdir(parents=True)
+    index_file.write_text("not json")
+
+    (course_index, num_parses) = load_or_build_counting_parses(courses_dir, index_file)
+
+    assert num_parses == 2
+    assert len(course_index.entries) == 2
+
+
+def test_invalid_course_file_raises_error(courses_dir: pathlib.Path, index_file: pathlib.Path) -> None:
+    (courses_dir / "invalid.yaml").write_text("{name: invalid, hole_pars: [4]}")
+
+    with pytest.raises(index.CourseLoadError):
+        index.CourseIndex.load_or_build(courses_dir=courses_dir, index_file=index_file)
+
+
+def test_indexed_provider_only_materializes_requested_courses(
+    courses_dir: pathlib.Path,
+    index_file: pathlib.Path,
+) -> None:
+    course_provider = provider.build_indexed_course_provider(courses_dir=courses_dir, index_file=index_file)
+
+    with mock.patch.object(provider, "materialize_course", wraps=provider.materialize_course) as materialize_course:
+        course = course_provider.get_course("Baylands")
+        assert course_provider.get_course("BAYLANDS") is course
+
+    materialize_course.assert_called_once()
+    assert course.name == "baylands"
+    assert course.hole_pars[1] == 5
+
+
+def test_indexed_provider_course_not_found_raises_error(courses_dir: pathlib.Path) -> None:
+    course_provider = provider.build_indexed_course_provider(courses_dir=courses_dir)
+
+    with pytest.raises(provider.CourseProviderError):
+        course_provider.get_course("not a known course")
+
+
+def test_indexed_provider_with_duplicate_course_names_raises_error(courses_dir: pathlib.Path) -> None:
+    (courses_dir / "baylands_upper.yaml").write_text(BAYLANDS_COURSE_DATA_YAML.replace("baylands", "Baylands"))
+
+    with pytest.raises(provider.CourseProviderError):
+        provider.build_indexed_course_provider(courses_dir=courses_dir)
+
+
+def test_digest_only_changes_when_course_content_changes(courses_dir: pathlib.Path, index_file: pathlib.Path) -> None:
+    (course_index, _) = load_or_build_counting_parses(courses_dir, index_file)
+    baylands_file = courses_dir / "baylands.yaml"
+    stat = baylands_file.stat()
+    os.utime(baylands_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    (touched_index, _) = load_or_build_counting_parses(courses_dir, index_file)
+    assert touched_index.digest() == course_index.digest()
+
+    baylands_file.write_text(BAYLANDS_COURSE_DATA_YAML.replace("baylands", "baylands golf links"))
+    (modified_index, _) = load_or_build_counting_parses(courses_dir, index_file)
+    assert modified_index.digest() != course_index.digest()
+    assert provider.IndexedCourseProvider(modified_index).digest() == modified_index.digest()
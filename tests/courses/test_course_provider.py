@@ -80,3 +80,13 @@ def test_instantiate_course_with_duplicate_course_names_raises_error() -> None:
     with temp_course_data_dir(course_files=course_files) as courses_dir:
         with pytest.raises(provider.CourseProviderError):
             provider.build_concrete_course_provider_from_folder(courses_dir)
+
+
+def test_build_default_indexed_course_provider_writes_index_to_given_file(tmp_path: pathlib.Path) -> None:
+    index_file = tmp_path / "course_index.json"
+
+    indexed_provider = provider.build_default_indexed_course_provider(index_file=index_file)
+
+    assert index_file.is_file()
+    for course in provider.build_default_concrete_course_provider().courses:
+        assert indexed_provider.get_course(course.name) == course
@@ -0,0 +1,198 @@
+from unittest import mock
+
+import gspread
+import pytest
+from google_sheet import (
+    CellFormat,
+    ConcreteGoogleSheetController,
+    ConcreteGoogleWorksheet,
+    RangeFormat,
+    RangeValues,
+    SortOrder,
+    SortSpec,
+)
+
+
+def create_controller(spreadsheet: mock.MagicMock) -> ConcreteGoogleSheetController:
+    gspread_client = mock.MagicMock()
+    gspread_client.open_by_key.return_value = spreadsheet
+    return ConcreteGoogleSheetController(gspread_client=gspread_client, sheet_id="fake-sheet-id")
+
+
+def spreadsheet_double(worksheets: dict[str, int] | None = None) -> mock.MagicMock:
+    """A spreadsheet whose metadata lists worksheets, given as a mapping of titles to worksheet IDs."""
+    worksheets = worksheets or {}
+
+    spreadsheet = mock.MagicMock()
+    spreadsheet.id = "fake-sheet-id"
+    spreadsheet.client = mock.MagicMock(spec=gspread.http_client.HTTPClient)
+    spreadsheet.fetch_sheet_metadata.return_value = {
+        "properties": {"title": "Season"},
+        "sheets": [
+            {"properties": {"title": title, "sheetId": worksheet_id, "index": idx}}
+            for idx, (title, worksheet_id) in enumerate(worksheets.items())
+        ],
+    }
+    return spreadsheet
+
+
+def test_batch_read_makes_single_request_and_pads_values() -> None:
+    spreadsheet = mock.MagicMock()
+    spreadsheet.values_batch_get.return_value = {
+        "spreadsheetId": "fake-sheet-id",
+        "valueRanges": [
+            # The API normalizes range names and omits trailing empty rows and cells
+            {"range": "Players!A1:Z1000", "values": [["Handicaps"], ["Golfer", "Gender"], ["John Doe"]]},
+            {"range": "'Event 1'!B6:V1000", "values": [["John Doe", "4", "5"]]},
+            {"range": "Finale!B4:B6", "values": [["John Doe"]]},
+            {"range": "'Event 2'!B6:V1000"},
+        ],
+    }
+    controller = create_controller(spreadsheet)
+
+    ranges = ["'Players'", "'Event 1'!B6:V", "'Finale'!B4:B6", "'Event 2'!B6:V"]
+    range_values = controller.batch_read(ranges)
+
+    spreadsheet.values_batch_get.assert_called_once_with(ranges=ranges)
+    assert range_values == {
+        "'Players'": [["Handicaps", ""], ["Golfer", "Gender"], ["John Doe", ""]],
+        "'Event 1'!B6:V": [["John Doe", "4", "5"]],
+        "'Finale'!B4:B6": [["John Doe"], [""], [""]],
+        "'Event 2'!B6:V": [],
+    }
+
+
+def test_batch_read_unformatted_makes_single_request_for_unformatted_values() -> None:
+    spreadsheet = mock.MagicMock()
+    spreadsheet.values_batch_get.return_value = {
+        "spreadsheetId": "fake-sheet-id",
+        "valueRanges": [
+            {"range": "'Event 1'!B6:V1000", "values": [["John Doe", 4, 5, "", 72.4]]},
+            {"range": "Leaderboard!B4:U1000"},
+        ],
+    }
+    controller = create_controller(spreadsheet)
+
+    ranges = ["'Event 1'!B6:V", "'Leaderboard'!B4:U"]
+    range_values = controller.batch_read_unformatted(ranges)
+
+    spreadsheet.values_batch_get.assert_called_once_with(
+        ranges=ranges, params={"valueRenderOption": "UNFORMATTED_VALUE"}
+    )
+    assert range_values == {
+        "'Event 1'!B6:V": [["John Doe", 4, 5, "", 72.4]],
+        "'Leaderboard'!B4:U": [],
+    }
+
+
+def test_revision_token_is_drive_modified_time() -> None:
+    spreadsheet = mock.MagicMock()
+    spreadsheet.id = "fake-sheet-id"
+    spreadsheet.get_lastUpdateTime.return_value = "2026-05-02T17:03:41.123Z"
+    controller = create_controller(spreadsheet)
+
+    assert controller.sheet_id() == "fake-sheet-id"
+    assert controller.revision_token() == "2026-05-02T17:03:41.123Z"
+
+
+def test_flush_writes_all_worksheets_in_one_request_before_sort_and_format_requests() -> None:
+    spreadsheet = spreadsheet_double({"Event 1": 11, "Leaderboard": 22})
+    calls = mock.MagicMock()
+    spreadsheet.values_batch_update.side_effect = calls.values_batch_update
+    spreadsheet.batch_update.side_effect = calls.batch_update
+    controller = create_controller(spreadsheet)
+
+    event_worksheet = controller.worksheet("Event 1")
+    leaderboard_worksheet = controller.worksheet("Leaderboard")
+
+    controller.begin_batch()
+    event_worksheet.write_multiple_ranges([RangeValues(range="B6:B7", values=[["a"], ["b"]])])
+    event_worksheet.sort_range(specs=[SortSpec(column="AD", order=SortOrder.ASCENDING)], range_name="B6:AD7")
+    event_worksheet.format_multiple_ranges([RangeFormat(range="C6", format=CellFormat())])
+    leaderboard_worksheet.write_multiple_ranges([RangeValues(range="B4:C4", values=[[1, "a"]])])
+    leaderboard_worksheet.sort_range(specs=[SortSpec(column="B", order=SortOrder.ASCENDING)], range_name="B4:C4")
+    controller.flush()
+
+    assert calls.mock_calls == [
+        mock.call.values_batch_update(
+            body={
+                "valueInputOption": "RAW",
+                "data": [
+                    {"range": "'Event 1'!B6:B7", "values": [["a"], ["b"]]},
+                    {"range": "'Leaderboard'!B4:C4", "values": [[1, "a"]]},
+                ],
+            }
+        ),
+        mock.call.batch_update(
+            {
+                "requests": [
+                    {"sortRange": mock.ANY},
+                    {"repeatCell": mock.ANY},
+                    {"sortRange": mock.ANY},
+                ]
+            }
+        ),
+    ]
+    sort_requests = [request["sortRange"] for request in calls.batch_update.call_args.args[0]["requests"][::2]]
+    assert [request["range"]["sheetId"] for request in sort_requests] == [11, 22]
+
+    # Writes after the batch is flushed are no longer buffered
+    leaderboard_worksheet.write_multiple_ranges([RangeValues(range="B5", values=[[2]])])
+    spreadsheet.client.values_batch_update.assert_called_once()
+
+
+def test_worksheets_are_built_from_a_single_metadata_fetch() -> None:
+    spreadsheet = spreadsheet_double({"Players": 0, "Event 1": 11, "Leaderboard": 22})
+    controller = create_controller(spreadsheet)
+
+    assert controller.worksheet_titles() == ["Players", "Event 1", "Leaderboard"]
+    for title in ["Players", "Event 1", "Leaderboard", "Event 1"]:
+        controller.worksheet(title)
+
+    spreadsheet.fetch_sheet_metadata.assert_called_once()
+    spreadsheet.worksheet.assert_not_called()
+    event_worksheet = controller.worksheet("Event 1")
+    assert isinstance(event_worksheet, ConcreteGoogleWorksheet)
+    assert event_worksheet.worksheet.id == 11
+
+
+def test_missing_worksheet_raises_worksheet_not_found() -> None:
+    controller = create_controller(spreadsheet_double({"Players": 0}))
+
+    with pytest.raises(gspread.exceptions.WorksheetNotFound):
+        controller.worksheet("Event 1")
+
+
+def test_invalidate_metadata_fetches_metadata_again() -> None:
+    spreadsheet = spreadsheet_double({"Players": 0})
+    controller = create_controller(spreadsheet)
+    controller.worksheet_titles()
+
+    spreadsheet.fetch_sheet_metadata.return_value = spreadsheet_double(
+        {"Players": 0, "Event 1": 11}
+    ).fetch_sheet_metadata()
+    controller.invalidate_metadata()
+
+    assert controller.worksheet_titles() == ["Players", "Event 1"]
+    assert spreadsheet.fetch_sheet_metadata.call_count == 2
+
+
+def test_changed_revision_token_invalidates_metadata() -> None:
+    spreadsheet = spreadsheet_double({"Event 1": 11})
+    spreadsheet.get_lastUpdateTime.return_value = "rev-1"
+    controller = create_controller(spreadsheet)
+    controller.revision_token()
+    controller.worksheet_titles()
+
+    # The token is unchanged, so the cached metadata is still current.
+    controller.revision_token()
+    controller.worksheet_titles()
+    spreadsheet.fetch_sheet_metadata.assert_called_once()
+
+    # The worksheet is renamed by someone else.
+    spreadsheet.fetch_sheet_metadata.return_value = spreadsheet_double({"Event 2": 11}).fetch_sheet_metadata()
+    spreadsheet.get_lastUpdateTime.return_value = "rev-2"
+    controller.revision_token()
+
+    assert controller.worksheet_titles() == ["Event 2"]
+    assert spreadsheet.fetch_sheet_metadata.call_count == 2
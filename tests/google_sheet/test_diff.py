@@ -0,0 +1,105 @@
+import pytest
+from google_sheet import RangeValues
+from google_sheet import diff as sheet_diff
+
+
+@pytest.mark.parametrize(
+    "value, current, expected",
+    [
+        (4, 4, True),
+        (4, 4.0, True),
+        (4.0, 4, True),
+        (37.5, 37.5, True),
+        # A rounding number format would display both values as "72"
+        (72, 72.4, False),
+        (72.4, 72, False),
+        (4, 5, False),
+        (4, "4", False),
+        (4, "", False),
+        (4, None, False),
+        (4, "N/A", False),
+        ("4", 4, False),
+        ("N/A", "N/A", True),
+        ("John Doe", "John Doe", True),
+        ("John Doe", "John Doe ", False),
+        (True, True, True),
+        (True, 1, False),
+        (1, True, False),
+        ("", "", True),
+        ("", None, True),
+        ("", 4, False),
+        (None, None, True),
+        (None, "", True),
+        (None, 4, False),
+    ],
+)
+def test_is_value_unchanged(value: sheet_diff.CellValueType, current: sheet_diff.CellValueType, expected: bool) -> None:
+    assert sheet_diff.is_value_unchanged(value, current) == expected
+
+
+def test_current_values_outside_of_values_are_empty() -> None:
+    current = sheet_diff.CurrentValues(values=[["a", "b"], ["c"]], start_cell="B6")
+
+    assert current.cell_value(row=6, col=2) == "a"
+    assert current.cell_value(row=6, col=3) == "b"
+    assert current.cell_value(row=7, col=2) == "c"
+    # Trailing empty cells and rows are omitted by the API
+    assert current.cell_value(row=7, col=3) is None
+    assert current.cell_value(row=8, col=2) is None
+    # Cells before the start cell
+    assert current.cell_value(row=5, col=2) is None
+    assert current.cell_value(row=6, col=1) is None
+
+
+def test_changed_range_values_without_changes_is_empty() -> None:
+    current = sheet_diff.CurrentValues(values=[[1, 2], [3, 4]], start_cell="B6")
+    write_ranges = [RangeValues(range="B6:C7", values=[[1, 2], [3, 4]])]
+
+    assert sheet_diff.changed_range_values(write_ranges, current) == []
+
+
+def test_changed_range_values_with_all_changes_is_unchanged() -> None:
+    current = sheet_diff.CurrentValues(values=[], start_cell="B6")
+    write_ranges = [RangeValues(range="B6:C7", values=[[1, 2], [3, 4]])]
+
+    assert sheet_diff.changed_range_values(write_ranges, current) == write_ranges
+
+
+def test_changed_range_values_coalesces_changed_cells_into_rectangles() -> None:
+    current = sheet_diff.CurrentValues(
+        values=[
+            ["x", "x", 3, "x"],
+            ["x", "x", 7, 8],
+            [9, "x", "x", 12],
+        ],
+        start_cell="A1",
+    )
+    write_ranges = [
+        RangeValues(
+            range="A1:D3",
+            values=[
+                [1, 2, 3, 4],
+                [5, 6, 7, 8],
+                [9, 10, 11, 12],
+            ],
+        )
+    ]
+
+    assert sheet_diff.changed_range_values(write_ranges, current) == [
+        RangeValues(range="D1:D1", values=[[4]]),
+        RangeValues(range="A1:B2", values=[[1, 2], [5, 6]]),
+        RangeValues(range="B3:C3", values=[[10, 11]]),
+    ]
+
+
+def test_changed_range_values_keeps_ranges_separate() -> None:
+    current = sheet_diff.CurrentValues(values=[[1, "", 3]], start_cell="B4")
+    write_ranges = [
+        RangeValues(range="B4:B5", values=[[1], [2]]),
+        RangeValues(range="D4:D5", values=[[4], [5]]),
+    ]
+
+    assert sheet_diff.changed_range_values(write_ranges, current) == [
+        RangeValues(range="B5:B5", values=[[2]]),
+        RangeValues(range="D4:D5", values=[[4], [5]]),
+    ]
@@ -0,0 +1,183 @@
+import json
+import pathlib
+from typing import Any
+
+import pytest
+from google_sheet import ApiCall, ApiCallRecorder
+from google_sheet import instrumentation as sheet_instrumentation
+
+SHEETS_URL = "https://sheets.googleapis.com/v4/spreadsheets/fake-sheet-id"
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def record_request(recorder: ApiCallRecorder, **kwargs: Any) -> ApiCall:
+    request: dict[str, Any] = {
+        "method": "get",
+        "url": SHEETS_URL,
+        "params": None,
+        "body": None,
+        "status_code": 200,
+        "response_bytes": 100,
+        "latency_seconds": 0.5,
+        "retries": 0,
+    }
+    request.update(kwargs)
+    recorder.record_request(**request)
+    return recorder.calls[-1]
+
+
+@pytest.mark.parametrize(
+    "method, url, params, body, expected_method, expected_worksheets, expected_range_count",
+    [
+        (
+            "get",
+            f"{SHEETS_URL}/values:batchGet",
+            {"ranges": ["'Players'", "'Event 1'!B6:AD"]},
+            None,
+            "GET values:batchGet",
+            ("Players", "Event 1"),
+            2,
+        ),
+        (
+            "post",
+            f"{SHEETS_URL}/values:batchUpdate",
+            None,
+            {"data": [{"range": "'Event 1'!B6", "values": [[1]]}, {"range": "'Event 1'!C6", "values": [[2]]}]},
+            "POST values:batchUpdate",
+            ("Event 1",),
+            2,
+        ),
+        (
+            "get",
+            f"{SHEETS_URL}/values/%27Event%201%27%21A1%3AB2",
+            None,
+            None,
+            "GET values",
+            ("Event 1",),
+            1,
+        ),
+        (
+            "get",
+            SHEETS_URL,
+            {"includeGridData": "true", "ranges": "'Event 1'!C6"},
+            None,
+            "GET spreadsheets",
+            ("Event 1",),
+            1,
+        ),
+        (
+            "post",
+            f"{SHEETS_URL}:batchUpdate",
+            None,
+            {"requests": [{"sortRange": {"range": {"sheetId": 11}}}, {"repeatCell": {"range": {"sheetId": 99}}}]},
+            "POST spreadsheets:batchUpdate",
+            ("Event 1", "#99"),
+            2,
+        ),
+        (
+            "get",
+            "https://www.googleapis.com/drive/v3/files/fake-sheet-id",
+            {"fields": "modifiedTime"},
+            None,
+            "GET drive",
+            (),
+            0,
+        ),
+    ],
+)
+def test_record_request_describes_request(
+    method: str,
+    url: str,
+    params: dict | None,
+    body: dict | None,
+    expected_method: str,
+    expected_worksheets: tuple[str, ...],
+    expected_range_count: int,
+) -> None:
+    recorder = ApiCallRecorder()
+    recorder.register_worksheet_titles({11: "Event 1"})
+
+    call = record_request(recorder, method=method, url=url, params=params, body=body)
+
+    assert call.method == expected_method
+    assert call.worksheets == expected_worksheets
+    assert call.range_count == expected_range_count
+    assert call.request_bytes == (len(json.dumps(body)) if body is not None else 0)
+
+
+def test_calls_are_recorded_in_the_current_phase() -> None:
+    clock = FakeClock()
+    recorder = ApiCallRecorder(clock=clock)
+
+    record_request(recorder)
+    recorder.start_phase("read")
+    record_request(recorder)
+    clock.now = 2.0
+    recorder.start_phase("compute")
+    clock.now = 5.0
+    recorder.start_phase("write")
+    record_request(recorder, method="post")
+    clock.now = 5.5
+    recorder.finish()
+
+    assert [call.phase for call in recorder.calls] == [sheet_instrumentation.SETUP_PHASE, "read", "write"]
+    assert [(timing.phase, timing.seconds) for timing in recorder.phases] == [
+        ("read", 2.0),
+        ("compute", 3.0),
+        ("write", 0.5),
+    ]
+    assert recorder.totals_by(lambda call: [call.phase])["read"].calls == 1
+
+
+def test_reset_discards_recorded_calls_and_phases() -> None:
+    clock = FakeClock()
+    recorder = ApiCallRecorder(clock=clock)
+    recorder.start_phase("read")
+    record_request(recorder)
+    recorder.finish()
+
+    recorder.reset()
+    recorder.start_phase("write")
+    record_request(recorder, method="post")
+    clock.now = 1.0
+    recorder.finish()
+
+    assert [call.phase for call in recorder.calls] == ["write"]
+    assert [(timing.phase, timing.seconds) for timing in recorder.phases] == [("write", 1.0)]
+
+
+def test_summary_includes_phases_without_calls_and_worksheets() -> None:
+    recorder = ApiCallRecorder(clock=FakeClock())
+    recorder.start_phase("read")
+    record_request(recorder, params={"ranges": ["'Players'"]}, latency_seconds=1.25)
+    recorder.start_phase("compute")
+    recorder.finish()
+
+    summary = recorder.summary()
+
+    assert "read (0.00s): 1 calls, 1 ranges, 1.25s" in summary
+    assert "compute (0.00s): 0 calls" in summary
+    assert "Players: 1 calls" in summary
+
+
+def test_write_json_report(tmp_path: pathlib.Path) -> None:
+    recorder = ApiCallRecorder(clock=FakeClock())
+    recorder.start_phase("read")
+    record_request(recorder, params={"ranges": ["'Players'", "'Event 1'!B6:AD"]}, retries=2)
+    recorder.finish()
+
+    report_file = tmp_path / "reports" / "api.json"
+    recorder.write_json(report_file)
+    report = json.loads(report_file.read_text())
+
+    assert report["phases"] == [{"phase": "read", "seconds": 0.0}]
+    assert report["by_phase"]["read"]["retries"] == 2
+    assert report["by_worksheet"]["Event 1"]["calls"] == 1
+    assert report["calls"][0]["worksheets"] == ["Players", "Event 1"]
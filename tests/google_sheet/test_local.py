@@ -0,0 +1,246 @@
+import json
+import pathlib
+from unittest import mock
+
+import gspread
+import pytest
+from google_sheet import (
+    CellFormat,
+    ColorRgb,
+    LocalGoogleSheetController,
+    LocalWorkbookError,
+    RangeFormat,
+    RangeValues,
+    SortOrder,
+    SortSpec,
+    save_local_workbook,
+)
+from google_sheet import local as sheet_local
+from google_sheet import utils as sheet_utils
+
+STUB_FORMAT = CellFormat(background_color=ColorRgb(red=255, green=0, blue=0))
+WHITE_FORMAT = CellFormat(background_color=ColorRgb(red=255, green=255, blue=255))
+
+
+def write_worksheet(workbook_dir: pathlib.Path, title: str, values: list[list], formats: dict | None = None) -> None:
+    worksheet_json = {"values": values, "formats": formats or {}}
+    (workbook_dir / f"{title}.json").write_text(json.dumps(worksheet_json))
+
+
+def read_worksheet(workbook_dir: pathlib.Path, title: str) -> dict:
+    return json.loads((workbook_dir / f"{title}.json").read_text())
+
+
+@pytest.fixture
+def workbook_dir(tmp_path: pathlib.Path) -> pathlib.Path:
+    write_worksheet(tmp_path, "Players", [["Handicaps"], ["Golfer", "Gender"], ["John Doe", "Male"]])
+    write_worksheet(
+        tmp_path,
+        "Event 1",
+        [
+            [],
+            ["", "", "Golfer", "Rank", "Score"],
+            ["", "", "John Doe", "2", "90"],
+            ["", "", "Jane Doe", "1", "85"],
+            ["", "", "Jim Doe"],
+        ],
+        formats={"C3": {"background_color": [255, 0, 0]}},
+    )
+    return tmp_path
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [(None, ""), (4, "4"), (4.0, "4"), (37.5, "37.5"), ("N/A", "N/A")],
+)
+def test_displayed_value(value: sheet_local.worksheet.CellValueType, expected: str) -> None:
+    assert sheet_local.displayed_value(value) == expected
+
+
+def test_missing_workbook_dir_raises_error(tmp_path: pathlib.Path) -> None:
+    with pytest.raises(LocalWorkbookError):
+        LocalGoogleSheetController(workbook_dir=tmp_path / "missing")
+
+
+def test_worksheet_titles_and_metadata(workbook_dir: pathlib.Path) -> None:
+    controller = LocalGoogleSheetController(workbook_dir=workbook_dir)
+
+    assert controller.worksheet_titles() == ["Event 1", "Players"]
+    assert [sheet["properties"]["title"] for sheet in controller.sheet_metadata()["sheets"]] == ["Event 1", "Players"]
+
+
+def test_missing_worksheet_raises_worksheet_not_found(workbook_dir: pathlib.Path) -> None:
+    controller = LocalGoogleSheetController(workbook_dir=workbook_dir)
+
+    with pytest.raises(gspread.exceptions.WorksheetNotFound):
+        controller.worksheet("Event 2")
+
+
+def test_invalidate_metadata_loads_renamed_worksheets(workbook_dir: pathlib.Path) -> None:
+    controller = LocalGoogleSheetController(workbook_dir=workbook_dir)
+    (workbook_dir / "Event 1.json").rename(workbook_dir / "Event 2.json")
+
+    controller.invalidate_metadata()
+
+    assert controller.worksheet_titles() == ["Event 2", "Players"]
+    assert controller.batch_read(["'Event 2'!C3:C3"]) == {"'Event 2'!C3:C3": [["John Doe"]]}
+
+
+def test_batch_read_pads_values_like_the_sheets_api(workbook_dir: pathlib.Path) -> None:
+    controller = LocalGoogleSheetController(workbook_dir=workbook_dir)
+
+    range_values = controller.batch_read(["'Players'", "'Event 1'!C3:F", "'Event 1'!C4:D7", "'Event 1'!C9:F"])
+
+    assert range_values == {
+        "'Players'": [["Handicaps", ""], ["Golfer", "Gender"], ["John Doe", "Male"]],
+        # Trailing empty rows are dropped from open-ended ranges, which are padded to their longest row
+        "'Event 1'!C3:F": [["John Doe", "2", "90"], ["Jane Doe", "1", "85"], ["Jim Doe", "", ""]],
+        "'Event 1'!C4:D7": [["Jane Doe", "1"], ["Jim Doe", ""], ["", ""], ["", ""]],
+        "'Event 1'!C9:F": [],
+    }
+
+
+def test_batch_read_unformatted_returns_stored_values(workbook_dir: pathlib.Path) -> None:
+    controller = LocalGoogleSheetController(workbook_dir=workbook_dir)
+    controller.worksheet("Event 1").write_multiple_ranges([RangeValues(range="D5:E5", values=[[3, 101.4]])])
+
+    range_values = controller.batch_read_unformatted(["'Event 1'!D3:F", "'Event 1'!C9:F"])
+
+    # Values aren't displayed or padded, and trailing empty rows and cells are dropped
+    assert range_values == {
+        "'Event 1'!D3:F": [["2", "90"], ["1", "85"], [3, 101.4]],
+        "'Event 1'!C9:F": [],
+    }
+
+
+def test_write_is_saved_immediately_without_batch(workbook_dir: pathlib.Path) -> None:
+    controller = LocalGoogleSheetController(workbook_dir=workbook_dir)
+    worksheet = controller.worksheet("Event 1")
+
+    worksheet.write_multiple_ranges([RangeValues(range="D5:E5", values=[[3, 101.0]])])
+
+    assert worksheet.range_values("C5:E5") == [["Jim Doe", "3", "101"]]
+    assert read_worksheet(workbook_dir, "Event 1")["values"][4] == ["", "", "Jim Doe", 3, 101.0]
+
+
+def test_batched_operations_are_applied_on_flush_with_values_first(workbook_dir: pathlib.Path) -> None:
+    controller = LocalGoogleSheetController(workbook_dir=workbook_dir)
+    revision_token = controller.revision_token()
+    worksheet = controller.worksheet("Event 1")
+
+    controller.begin_batch()
+    worksheet.sort_range(specs=[SortSpec(column="D", order=SortOrder.ASCENDING)], range_name="B3:D5")
+    worksheet.write_multiple_ranges([RangeValues(range="D5", values=[[3]])])
+
+    assert controller.batch_read(["'Event 1'!C3:D5"])["'Event 1'!C3:D5"] == [
+        ["John Doe", "2"],
+        ["Jane Doe", "1"],
+        ["Jim Doe", ""],
+    ]
+    assert controller.revision_token() == revision_token
+
+    controller.flush()
+
+    # The sort is applied after the value was written, as in a Sheets API batch
+    assert LocalGoogleSheetController(workbook_dir=workbook_dir).batch_read(["'Event 1'!C3:D5"]) == {
+        "'Event 1'!C3:D5": [["Jane Doe", "1"], ["John Doe", "2"], ["Jim Doe", "3"]],
+    }
+    assert controller.revision_token() != revision_token
+
+
+def test_sort_orders_numbers_numerically_and_empty_cells_last(workbook_dir: pathlib.Path) -> None:
+    controller = LocalGoogleSheetController(workbook_dir=workbook_dir)
+    worksheet = controller.worksheet("Event 1")
+    worksheet.write_multiple_ranges([RangeValues(range="D3:D4", values=[[9], ["10"]])])
+
+    worksheet.sort_range(specs=[SortSpec(column="D", order=SortOrder.DESCENDING)], range_name="B3:D5")
+
+    assert worksheet.column_range_values(column="C", first_row=3, last_row=5) == ["Jane Doe", "John Doe", "Jim Doe"]
+
+
+def test_sort_is_stable(workbook_dir: pathlib.Path) -> None:
+    controller = LocalGoogleSheetController(workbook_dir=workbook_dir)
+    worksheet = controller.worksheet("Event 1")
+    worksheet.write_multiple_ranges([RangeValues(range="E3:E5", values=[[1], [1], [1]])])
+
+    worksheet.sort_range(specs=[SortSpec(column="E", order=SortOrder.DESCENDING)], range_name="B3:E5")
+
+    assert worksheet.column_range_values(column="C", first_row=3, last_row=5) == ["John Doe", "Jane Doe", "Jim Doe"]
+
+
+def test_sort_moves_formats_with_rows(workbook_dir: pathlib.Path) -> None:
+    controller = LocalGoogleSheetController(workbook_dir=workbook_dir)
+    worksheet = controller.worksheet("Event 1")
+
+    worksheet.sort_range(specs=[SortSpec(column="E", order=SortOrder.ASCENDING)], range_name="B3:E5")
+
+    assert worksheet.cell_format("C4") == STUB_FORMAT
+    assert worksheet.cell_format("C3") == WHITE_FORMAT
+
+
+def test_format_multiple_ranges(workbook_dir: pathlib.Path) -> None:
+    controller = LocalGoogleSheetController(workbook_dir=workbook_dir)
+    worksheet = controller.worksheet("Event 1")
+
+    worksheet.format_multiple_ranges(
+        [
+            RangeFormat(range="C3:D4", format=WHITE_FORMAT),
+            RangeFormat(range="D4", format=STUB_FORMAT),
+        ]
+    )
+
+    assert worksheet.cell_format("C3") == WHITE_FORMAT
+    assert worksheet.cell_format("D4") == STUB_FORMAT
+    assert read_worksheet(workbook_dir, "Event 1")["formats"]["D4"] == {"background_color": [255, 0, 0]}
+
+
+def test_range_formats(workbook_dir: pathlib.Path) -> None:
+    controller = LocalGoogleSheetController(workbook_dir=workbook_dir)
+    worksheet = controller.worksheet("Event 1")
+
+    assert worksheet.range_formats("C3:D4") == [[STUB_FORMAT, WHITE_FORMAT], [WHITE_FORMAT, WHITE_FORMAT]]
+
+
+def test_save_local_workbook_copies_displayed_values(tmp_path: pathlib.Path) -> None:
+    source = mock.MagicMock()
+    source.worksheet_titles.return_value = ["Players", "Event 1"]
+    source.batch_read.return_value = {
+        "'Players'": [["Golfer", "Gender"]],
+        "'Event 1'": [["", "Golfer"], ["", "John Doe"]],
+    }
+
+    save_local_workbook(source=source, workbook_dir=tmp_path / "workbook")
+
+    source.batch_read.assert_called_once_with(["'Players'", "'Event 1'"])
+    controller = LocalGoogleSheetController(workbook_dir=tmp_path / "workbook")
+    assert controller.batch_read(["'Event 1'!B1:B2"]) == {"'Event 1'!B1:B2": [["Golfer"], ["John Doe"]]}
+
+
+@pytest.mark.parametrize("title", ["../Escaped", "Event 1/2", "Event: 1?", "..", "Événement"])
+def test_save_local_workbook_keeps_worksheet_files_in_workbook(tmp_path: pathlib.Path, title: str) -> None:
+    source = mock.MagicMock()
+    source.worksheet_titles.return_value = [title]
+    source.batch_read.return_value = {sheet_utils.absolute_range_name(title): [["Golfer"], ["John Doe"]]}
+
+    save_local_workbook(source=source, workbook_dir=tmp_path / "workbook")
+
+    [worksheet_file] = list(tmp_path.rglob("*.json"))
+    assert worksheet_file.parent == tmp_path / "workbook"
+    controller = LocalGoogleSheetController(workbook_dir=tmp_path / "workbook")
+    assert controller.worksheet_titles() == [title]
+
+    controller.worksheet(title).write_multiple_ranges([RangeValues(range="B2", values=[[90]])])
+    assert list(tmp_path.rglob("*.json")) == [worksheet_file]
+    assert json.loads(worksheet_file.read_text())["values"][1] == ["John Doe", 90]
+
+
+def test_worksheet_file_names_are_distinct_for_titles_with_the_same_slug() -> None:
+    assert sheet_local.worksheet_file_name("Event 1") != sheet_local.worksheet_file_name("Event/1")
+    assert sheet_local.worksheet_file_name("Players") != sheet_local.worksheet_file_name("players")
+
+
+def test_worksheet_in_several_files_raises_error(workbook_dir: pathlib.Path) -> None:
+    (workbook_dir / "Copy.json").write_text(json.dumps({"title": "Players", "values": []}))
+
+    with pytest.raises(LocalWorkbookError):
+        LocalGoogleSheetController(workbook_dir=workbook_dir)
@@ -0,0 +1,323 @@
+import concurrent.futures
+import json
+import multiprocessing
+import threading
+from typing import Any
+from unittest import mock
+
+import gspread
+import pytest
+import requests  # type: ignore [import-untyped]
+from google_sheet import ApiCallRecorder, ConcreteGoogleSheetController
+from google_sheet.scheduler import (
+    QuotaClass,
+    RequestScheduler,
+    RequestSchedulerConfig,
+    ScheduledHTTPClient,
+    SharedRateLimiter,
+    SharedRequestQuota,
+)
+
+SHEETS_URL = "https://sheets.googleapis.com/v4/spreadsheets/fake-sheet-id"
+
+
+class FakeClock:
+    """A clock that only advances when something sleeps."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class FakeTransport(requests.adapters.BaseAdapter):
+    """A requests transport that returns queued responses, which can be used to inject throttling and errors."""
+
+    def __init__(self, responses: list[tuple[int, dict[str, Any]] | tuple[int, dict[str, Any], dict[str, str]]]):
+        super().__init__()
+        self._responses = list(responses)
+        self.requests: list[requests.PreparedRequest] = []
+
+    def send(self, request: requests.PreparedRequest, **kwargs: Any) -> requests.Response:
+        self.requests.append(request)
+        (status_code, body, *headers) = self._responses.pop(0)
+
+        response = requests.Response()
+        response.status_code = status_code
+        response._content = json.dumps(body).encode()
+        response.headers.update(headers[0] if headers else {})
+        response.request = request
+        response.url = request.url
+        return response
+
+    def close(self) -> None:
+        pass
+
+
+def api_error_body(code: int, domain: str | None = None) -> dict[str, Any]:
+    error: dict[str, Any] = {"code": code, "message": "Error", "status": "ERROR"}
+    if domain is not None:
+        error["errors"] = [{"domain": domain, "reason": "rateLimitExceeded"}]
+    return {"error": error}
+
+
+def create_http_client(
+    transport: FakeTransport,
+    clock: FakeClock,
+    config: RequestSchedulerConfig = RequestSchedulerConfig(),
+) -> ScheduledHTTPClient:
+    session = requests.Session()
+    session.mount("https://", transport)
+    scheduler = RequestScheduler(config=config, clock=clock, sleep=clock.sleep, random_fraction=lambda: 0.5)
+    return ScheduledHTTPClient(auth=mock.MagicMock(), session=session, scheduler=scheduler)
+
+
+def test_requests_within_quota_are_not_delayed() -> None:
+    clock = FakeClock()
+    transport = FakeTransport([(200, {})] * 3)
+    client = create_http_client(transport, clock, RequestSchedulerConfig(read_requests_per_minute=3))
+
+    for _ in range(3):
+        client.request("get", SHEETS_URL)
+
+    assert len(transport.requests) == 3
+    assert clock.sleeps == []
+
+
+def test_requests_over_quota_are_delayed_until_a_token_is_available() -> None:
+    clock = FakeClock()
+    transport = FakeTransport([(200, {})] * 4)
+    client = create_http_client(transport, clock, RequestSchedulerConfig(read_requests_per_minute=2))
+
+    for _ in range(4):
+        client.request("get", SHEETS_URL)
+
+    # The bucket refills at 2 requests per minute, so each request after the first 2 waits 30 seconds.
+    assert clock.sleeps == [30.0, 30.0]
+    assert client.scheduler.stats[QuotaClass.READ].throttled_seconds == 60.0
+
+
+def test_read_and_write_quotas_are_independent() -> None:
+    clock = FakeClock()
+    transport = FakeTransport([(200, {})] * 2)
+    config = RequestSchedulerConfig(read_requests_per_minute=1, write_requests_per_minute=1)
+    client = create_http_client(transport, clock, config)
+
+    client.request("get", SHEETS_URL)
+    client.request("post", f"{SHEETS_URL}:batchUpdate")
+
+    assert clock.sleeps == []
+    assert client.scheduler.stats[QuotaClass.READ].requests == 1
+    assert client.scheduler.stats[QuotaClass.WRITE].requests == 1
+
+
+@pytest.mark.parametrize(
+    "error_response",
+    [
+        (429, api_error_body(429)),
+        (500, api_error_body(500)),
+        (503, api_error_body(503)),
+        (403, api_error_body(403, domain="usageLimits")),
+    ],
+)
+def test_throttled_and_server_errors_are_retried_with_backoff(error_response: tuple[int, dict[str, Any]]) -> None:
+    clock = FakeClock()
+    transport = FakeTransport([error_response, error_response, (200, {"ok": True})])
+    client = create_http_client(transport, clock)
+
+    response = client.request("get", SHEETS_URL)
+
+    assert response.json() == {"ok": True}
+    assert len(transport.requests) == 3
+    # Exponential backoff plus jitter
+    assert clock.sleeps == [1.5, 2.5]
+    assert client.scheduler.stats[QuotaClass.READ].retries == 2
+    assert client.scheduler.stats[QuotaClass.READ].backoff_seconds == 4.0
+
+
+def test_retry_after_header_is_used_for_backoff() -> None:
+    clock = FakeClock()
+    transport = FakeTransport([(429, api_error_body(429), {"Retry-After": "7"}), (200, {})])
+    client = create_http_client(transport, clock)
+
+    client.request("get", SHEETS_URL)
+
+    assert clock.sleeps == [7.0]
+
+
+@pytest.mark.parametrize(
+    "error_response",
+    [
+        (400, api_error_body(400)),
+        (403, api_error_body(403, domain="global")),
+        (404, api_error_body(404)),
+    ],
+)
+def test_client_errors_are_not_retried(error_response: tuple[int, dict[str, Any]]) -> None:
+    clock = FakeClock()
+    transport = FakeTransport([error_response])
+    client = create_http_client(transport, clock)
+
+    with pytest.raises(gspread.exceptions.APIError):
+        client.request("get", SHEETS_URL)
+
+    assert len(transport.requests) == 1
+    assert clock.sleeps == []
+
+
+def test_error_is_raised_when_retries_are_exhausted() -> None:
+    clock = FakeClock()
+    transport = FakeTransport([(429, api_error_body(429))] * 4)
+    config = RequestSchedulerConfig(max_retries=3, max_backoff_seconds=3.0)
+    client = create_http_client(transport, clock, config)
+
+    with pytest.raises(gspread.exceptions.APIError):
+        client.request("post", f"{SHEETS_URL}:batchUpdate")
+
+    assert len(transport.requests) == 4
+    # The backoff is capped
+    assert clock.sleeps == [1.5, 2.5, 3.0]
+
+
+def test_controller_requests_are_scheduled() -> None:
+    clock = FakeClock()
+    transport = FakeTransport(
+        [
+            (429, api_error_body(429)),
+            (200, {"properties": {"title": "Season"}, "sheets": []}),
+            (200, {"spreadsheetId": "fake-sheet-id", "valueRanges": [{"range": "Players!A1:B1", "values": [["a"]]}]}),
+        ]
+    )
+    session = requests.Session()
+    session.mount("https://", transport)
+    gspread_client = gspread.Client(auth=mock.MagicMock(), session=session)
+    scheduler = RequestScheduler(clock=clock, sleep=clock.sleep, random_fraction=lambda: 0.0)
+
+    controller = ConcreteGoogleSheetController(
+        gspread_client=gspread_client,
+        sheet_id="fake-sheet-id",
+        scheduler=scheduler,
+    )
+    range_values = controller.batch_read(["'Players'!A1:B1"])
+
+    assert range_values == {"'Players'!A1:B1": [["a", ""]]}
+    assert clock.sleeps == [1.0]
+    assert scheduler.stats[QuotaClass.READ].requests == 2
+    assert scheduler.stats[QuotaClass.READ].retries == 1
+
+
+def test_recorder_records_requests_with_retries() -> None:
+    clock = FakeClock()
+    transport = FakeTransport(
+        [
+            (200, {"properties": {"title": "Season"}, "sheets": []}),
+            (503, api_error_body(503)),
+            (200, {"spreadsheetId": "fake-sheet-id", "valueRanges": [{"range": "Players!A1:B1", "values": [["a"]]}]}),
+        ]
+    )
+    session = requests.Session()
+    session.mount("https://", transport)
+    gspread_client = gspread.Client(auth=mock.MagicMock(), session=session)
+    scheduler = RequestScheduler(clock=clock, sleep=clock.sleep, random_fraction=lambda: 0.0)
+    recorder = ApiCallRecorder(clock=clock)
+
+    controller = ConcreteGoogleSheetController(
+        gspread_client=gspread_client,
+        sheet_id="fake-sheet-id",
+        scheduler=scheduler,
+        recorder=recorder,
+    )
+    recorder.start_phase("read")
+    controller.batch_read(["'Players'!A1:B1"])
+
+    assert [(call.phase, call.method) for call in recorder.calls] == [
+        ("setup", "GET spreadsheets"),
+        ("read", "GET values:batchGet"),
+    ]
+    read_call = recorder.calls[1]
+    assert read_call.worksheets == ("Players",)
+    assert read_call.retries == 1
+    # The latency includes the backoff before the retry
+    assert read_call.latency_seconds == 1.0
+    assert read_call.status_code == 200
+
+
+def test_requests_from_several_threads_are_all_counted() -> None:
+    scheduler = RequestScheduler(config=RequestSchedulerConfig(read_requests_per_minute=1000), sleep=lambda _: None)
+
+    def send_requests() -> None:
+        for _ in range(100):
+            scheduler.send(QuotaClass.READ, mock.MagicMock())
+
+    threads = [threading.Thread(target=send_requests) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert scheduler.stats[QuotaClass.READ].requests == 800
+
+
+def test_shared_rate_limiter_allows_a_minute_of_requests_then_paces_them() -> None:
+    clock = FakeClock()
+    limiter = SharedRateLimiter(requests_per_minute=3, clock=clock)
+
+    assert [limiter.reserve() for _ in range(5)] == [0.0, 0.0, 0.0, 20.0, 40.0]
+
+    # Reservations that are waited for are accounted for, so waiting frees up the next request.
+    clock.now = 40.0
+    assert limiter.reserve() == 20.0
+
+
+def test_schedulers_with_shared_quota_are_throttled_together() -> None:
+    clock = FakeClock()
+    shared_quota = SharedRequestQuota(
+        read=SharedRateLimiter(requests_per_minute=2, clock=clock),
+        write=SharedRateLimiter(requests_per_minute=2, clock=clock),
+    )
+    # The shared quota is used instead of the quotas in the config.
+    schedulers = [
+        RequestScheduler(
+            config=RequestSchedulerConfig(read_requests_per_minute=10), sleep=lambda _: None, shared_quota=shared_quota
+        )
+        for _ in range(2)
+    ]
+
+    for scheduler in schedulers * 2:
+        scheduler.send(QuotaClass.READ, mock.MagicMock())
+
+    assert [scheduler.stats[QuotaClass.READ].throttled_seconds for scheduler in schedulers] == [30.0, 60.0]
+    assert shared_quota.write.reserve() == 0.0
+
+
+# The limiter of a worker process in the process pool test, which is set by the initializer of the pool.
+_worker_limiter: SharedRateLimiter | None = None
+
+
+def _init_worker(limiter: SharedRateLimiter) -> None:
+    global _worker_limiter
+    _worker_limiter = limiter
+
+
+def _reserve_twice(_: int) -> list[float]:
+    assert _worker_limiter is not None
+    return [_worker_limiter.reserve() for _ in range(2)]
+
+
+def test_shared_rate_limiter_is_shared_by_worker_processes() -> None:
+    context = multiprocessing.get_context("spawn")
+    limiter = SharedRateLimiter(requests_per_minute=1, context=context)
+
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=2, mp_context=context, initializer=_init_worker, initargs=(limiter,)
+    ) as executor:
+        waits = [wait for worker_waits in executor.map(_reserve_twice, range(2)) for wait in worker_waits]
+
+    # Each reservation waits a minute longer than the previous one, whichever process it was made by.
+    assert sorted(round(wait / 60.0) for wait in waits) == [0, 1, 2, 3]
@@ -1,4 +1,5 @@
 import pandas as pd
+import pytest
 from google_sheet import utils as sheet_utils
 from pandas import testing as pd_testing
 
@@ -136,3 +137,84 @@ def test_replace_empty_string_with_none_integer_values() -> None:
     )  # Convert NaN to None to match the function under test
 
     pd_testing.assert_frame_equal(left=modified_df, right=expected_df)
+
+
+def test_fill_range_gaps_bounded_range_is_padded_to_range_size() -> None:
+    values = sheet_utils.fill_range_gaps("'Sheet 1'!B2:D4", [["a"], ["b", "c"]])
+
+    assert values == [["a", "", ""], ["b", "c", ""], ["", "", ""]]
+
+
+def test_fill_range_gaps_open_ended_range_is_padded_to_longest_row() -> None:
+    assert sheet_utils.fill_range_gaps("'Sheet 1'!B2:D", [["a"], ["b", "c"]]) == [["a", ""], ["b", "c"]]
+    assert sheet_utils.fill_range_gaps("'Sheet 1'", [["a", "b"], []]) == [["a", "b"], ["", ""]]
+    assert sheet_utils.fill_range_gaps("'Sheet 1'", []) == []
+
+
+def test_records_df_nominal() -> None:
+    values = [
+        ["Title"],
+        ["Name", "Age", "Handicap"],
+        ["Jim", "34", "12.5"],
+        ["Bob", "", "8"],
+    ]
+
+    records = sheet_utils.records_df(values, header_row=2)
+
+    expected_df = pd.DataFrame(
+        {
+            "Name": ["Jim", "Bob"],
+            "Age": [34, ""],
+            "Handicap": [12.5, 8],
+        }
+    )
+    pd_testing.assert_frame_equal(left=records, right=expected_df)
+
+
+def test_records_df_duplicate_headers_raises_error() -> None:
+    with pytest.raises(ValueError):
+        sheet_utils.records_df([["Name", "Name"], ["Jim", "Bob"]])
+
+
+def test_records_df_no_header_row_is_empty() -> None:
+    assert sheet_utils.records_df([["Title"]], header_row=2).empty
+
+
+@pytest.mark.parametrize(
+    "range_name, expected",
+    [
+        ("'Event 1'!B6:AD", ("Event 1", "B6:AD")),
+        ("'Players'", ("Players", "")),
+        ("Players!A1", ("Players", "A1")),
+        ("'John''s Event'!A1:B2", ("John's Event", "A1:B2")),
+    ],
+)
+def test_split_range_name(range_name: str, expected: tuple[str, str]) -> None:
+    assert sheet_utils.split_range_name(range_name) == expected
+
+
+def test_numericise_grid() -> None:
+    data = pd.DataFrame(data=[["5", "4.5", ""], ["1,000", "3", "7"]], columns=["a", "b", "c"])
+
+    numbers = sheet_utils.numericise_grid(data)
+
+    expected = pd.DataFrame(data=[[5, 4.5, None], [1000, 3.0, 7.0]], columns=["a", "b", "c"])
+    pd_testing.assert_frame_equal(numbers, expected)
+
+
+def test_numericise_grid_keeps_invalid_values() -> None:
+    data = pd.DataFrame(data=[["5", "x"], ["inf", ""]])
+
+    numbers = sheet_utils.numericise_grid(data)
+
+    assert numbers.iat[0, 0] == 5
+    assert numbers.iat[0, 1] == "x"
+    assert numbers.iat[1, 0] == "inf"
+    assert pd.isna(numbers.iat[1, 1])
+
+
+def test_first_cell_position() -> None:
+    mask = pd.DataFrame(data=[[False, False], [False, True], [True, True]])
+
+    assert sheet_utils.first_cell_position(mask) == (1, 1)
+    assert sheet_utils.first_cell_position(mask & False) is None
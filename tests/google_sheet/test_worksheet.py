@@ -0,0 +1,205 @@
+from unittest import mock
+
+import gspread
+from google_sheet import RangeFormat, RangeValues, SortOrder, SortSpec
+from google_sheet.worksheet import BatchUpdateRequestBuilder, CellFormat, ColorRgb, ConcreteGoogleWorksheet, WriteBatch
+
+STUB_SHEET_ID = 1234
+STUB_FORMAT = CellFormat(background_color=ColorRgb(red=255, green=0, blue=0))
+
+EXPECTED_SORT_REQUEST = {
+    "sortRange": {
+        "range": {
+            "sheetId": STUB_SHEET_ID,
+            "startRowIndex": 5,
+            "endRowIndex": 8,
+            "startColumnIndex": 1,
+            "endColumnIndex": 30,
+        },
+        "sortSpecs": [{"dimensionIndex": 29, "sortOrder": "ASCENDING"}],
+    }
+}
+
+EXPECTED_FORMAT_REQUEST = {
+    "repeatCell": {
+        "range": {
+            "sheetId": STUB_SHEET_ID,
+            "startRowIndex": 5,
+            "endRowIndex": 6,
+            "startColumnIndex": 2,
+            "endColumnIndex": 3,
+        },
+        "cell": {"userEnteredFormat": {"backgroundColorStyle": {"rgbColor": {"red": 1.0, "green": 0.0, "blue": 0.0}}}},
+        "fields": "userEnteredFormat(backgroundColorStyle)",
+    }
+}
+
+
+def gspread_worksheet_double(title: str = "Event 1") -> mock.MagicMock:
+    worksheet = mock.MagicMock(spec=gspread.worksheet.Worksheet)
+    worksheet.title = title
+    worksheet.id = STUB_SHEET_ID
+    worksheet.spreadsheet_id = "spreadsheet-id"
+    worksheet.client = mock.MagicMock()
+    return worksheet
+
+
+def test_write_multiple_ranges_without_batch_writes_immediately() -> None:
+    gspread_worksheet = gspread_worksheet_double()
+    worksheet = ConcreteGoogleWorksheet(worksheet=gspread_worksheet, batch=WriteBatch())
+
+    worksheet.write_multiple_ranges([RangeValues(range="B6:B7", values=[["a"], ["b"]])])
+
+    gspread_worksheet.batch_update.assert_called_once_with(data=[{"range": "B6:B7", "values": [["a"], ["b"]]}])
+
+
+def test_writes_are_enqueued_with_qualified_ranges_while_batch_is_open() -> None:
+    gspread_worksheet = gspread_worksheet_double(title="Event 1")
+    batch = WriteBatch()
+    worksheet = ConcreteGoogleWorksheet(worksheet=gspread_worksheet, batch=batch)
+
+    batch.open()
+    worksheet.write_multiple_ranges([RangeValues(range="B6:B7", values=[["a"], ["b"]])])
+    worksheet.write_range(RangeValues(range="L6", values=[[44]]))
+
+    gspread_worksheet.batch_update.assert_not_called()
+    gspread_worksheet.update.assert_not_called()
+    assert batch.close().value_ranges == [
+        RangeValues(range="'Event 1'!B6:B7", values=[["a"], ["b"]]),
+        RangeValues(range="'Event 1'!L6", values=[[44]]),
+    ]
+
+
+def test_sort_and_format_without_batch_are_sent_immediately() -> None:
+    gspread_worksheet = gspread_worksheet_double()
+    worksheet = ConcreteGoogleWorksheet(worksheet=gspread_worksheet, batch=WriteBatch())
+
+    worksheet.sort_range(specs=[SortSpec(column="AD", order=SortOrder.ASCENDING)], range_name="B6:AD8")
+
+    gspread_worksheet.client.batch_update.assert_called_once_with(
+        gspread_worksheet.spreadsheet_id,
+        {"requests": [EXPECTED_SORT_REQUEST]},
+    )
+
+
+def test_sort_and_format_are_collected_while_batch_is_open() -> None:
+    gspread_worksheet = gspread_worksheet_double()
+    batch = WriteBatch()
+    worksheet = ConcreteGoogleWorksheet(worksheet=gspread_worksheet, batch=batch)
+
+    batch.open()
+    worksheet.sort_range(specs=[SortSpec(column="AD", order=SortOrder.ASCENDING)], range_name="B6:AD8")
+    worksheet.format_multiple_ranges([RangeFormat(range="C6", format=STUB_FORMAT)])
+
+    gspread_worksheet.client.batch_update.assert_not_called()
+    assert batch.close().requests.requests == [EXPECTED_SORT_REQUEST, EXPECTED_FORMAT_REQUEST]
+
+
+def test_request_builder_collects_requests_for_multiple_worksheets_in_order() -> None:
+    requests = BatchUpdateRequestBuilder()
+    assert requests.is_empty()
+
+    requests.add_sort_range(
+        sheet_id=STUB_SHEET_ID,
+        specs=[SortSpec(column="AD", order=SortOrder.ASCENDING)],
+        range_name="B6:AD8",
+    )
+    requests.add_format_ranges(sheet_id=STUB_SHEET_ID, range_formats=[RangeFormat(range="C6", format=STUB_FORMAT)])
+
+    other_requests = BatchUpdateRequestBuilder()
+    other_requests.add_sort_range(
+        sheet_id=99,
+        specs=[
+            SortSpec(column="B", order=SortOrder.DESCENDING),
+            SortSpec(column="C", order=SortOrder.ASCENDING),
+        ],
+        range_name="A2:C10",
+    )
+    requests.extend(other_requests)
+
+    assert requests.body() == {
+        "requests": [
+            EXPECTED_SORT_REQUEST,
+            EXPECTED_FORMAT_REQUEST,
+            {
+                "sortRange": {
+                    "range": {
+                        "sheetId": 99,
+                        "startRowIndex": 1,
+                        "endRowIndex": 10,
+                        "startColumnIndex": 0,
+                        "endColumnIndex": 3,
+                    },
+                    "sortSpecs": [
+                        {"dimensionIndex": 1, "sortOrder": "DESCENDING"},
+                        {"dimensionIndex": 2, "sortOrder": "ASCENDING"},
+                    ],
+                }
+            },
+        ]
+    }
+
+
+def test_write_batch_open_discards_unflushed_writes() -> None:
+    batch = WriteBatch()
+    batch.open()
+    batch.add_value_ranges([RangeValues(range="'Sheet'!A1", values=[[1]])])
+
+    batch.open()
+
+    assert batch.close().value_ranges == []
+    assert not batch.is_open
+
+
+def test_range_formats_are_read_in_a_single_request() -> None:
+    gspread_worksheet = gspread_worksheet_double(title="Event 1")
+    gspread_worksheet.client.fetch_sheet_metadata.return_value = {
+        "sheets": [
+            {
+                "data": [
+                    {
+                        "rowData": [
+                            {
+                                "values": [
+                                    # The API omits color components with a value of 0
+                                    {"effectiveFormat": {"backgroundColor": {"red": 1}}},
+                                    {"effectiveFormat": {"backgroundColor": {"red": 1, "green": 1, "blue": 1}}},
+                                ]
+                            },
+                            {"values": [{}]},
+                        ]
+                    }
+                ]
+            }
+        ]
+    }
+    worksheet = ConcreteGoogleWorksheet(worksheet=gspread_worksheet)
+
+    range_formats = worksheet.range_formats("C6:D8")
+
+    gspread_worksheet.client.fetch_sheet_metadata.assert_called_once_with(
+        "spreadsheet-id",
+        params={
+            "includeGridData": "true",
+            "ranges": "'Event 1'!C6:D8",
+            "fields": "sheets.data.rowData.values.effectiveFormat.backgroundColor",
+        },
+    )
+    # Cells without data are padded with the default format
+    white_format = CellFormat(background_color=ColorRgb(red=255, green=255, blue=255))
+    assert range_formats == [
+        [STUB_FORMAT, white_format],
+        [white_format, white_format],
+        [white_format, white_format],
+    ]
+
+
+def test_cell_format_reads_a_single_cell_range() -> None:
+    gspread_worksheet = gspread_worksheet_double(title="Event 1")
+    gspread_worksheet.client.fetch_sheet_metadata.return_value = {
+        "sheets": [{"data": [{"rowData": [{"values": [{"effectiveFormat": {"backgroundColor": {"red": 1}}}]}]}]}]
+    }
+    worksheet = ConcreteGoogleWorksheet(worksheet=gspread_worksheet)
+
+    assert worksheet.cell_format("C6") == STUB_FORMAT
+    assert gspread_worksheet.client.fetch_sheet_metadata.call_args.kwargs["params"]["ranges"] == "'Event 1'!C6"
@@ -207,3 +207,24 @@ def test_no_rank_value_is_not_top_five() -> None:
 
 def test_no_rank_value_is_not_top_ten() -> None:
     assert not rank.NoRankValue().is_top_ten()
+
+
+@pytest.mark.parametrize(
+    "values, rank_order, tie_method, expected_ranks",
+    [
+        ([], rank.RankOrder.ASCENDING, rank.RankTieMethod.MIN, []),
+        ([7], rank.RankOrder.DESCENDING, rank.RankTieMethod.MIN, [1]),
+        ([3, 1, 3, 2, 3], rank.RankOrder.ASCENDING, rank.RankTieMethod.MIN, [3, 1, 3, 2, 3]),
+        ([3, 1, 3, 2, 3], rank.RankOrder.ASCENDING, rank.RankTieMethod.MAX, [5, 1, 5, 2, 5]),
+        ([3, 1, 3, 2, 3], rank.RankOrder.DESCENDING, rank.RankTieMethod.MIN, [1, 5, 1, 4, 1]),
+        ([3, 1, 3, 2, 3], rank.RankOrder.DESCENDING, rank.RankTieMethod.MAX, [3, 5, 3, 4, 3]),
+        ([1.5, 0.5, 1.5], rank.RankOrder.DESCENDING, rank.RankTieMethod.MIN, [1, 3, 1]),
+    ],
+)
+def test_rank_values(
+    values: list[float],
+    rank_order: rank.RankOrder,
+    tie_method: rank.RankTieMethod,
+    expected_ranks: list[int],
+) -> None:
+    assert rank.rank_values(values=values, rank_order=rank_order, tie_method=tie_method).tolist() == expected_ranks
@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 from season_common import scorecard
 
@@ -80,3 +81,120 @@ def test_scorecard_validator_empty_string_value_raises_error() -> None:
     scores = create_test_hole_scores_dict(score_values)  # type: ignore
     with pytest.raises(scorecard.ScorecardValidationError):
         scorecard.ScorecardValidator(scores).validate()  # type: ignore
+
+
+SCORES_1 = [5, 4, 5, 6, 5, 6, 4, 4, 5, 6, 6, 5, 4, 4, 4, 4, 4, 5]
+SCORES_2 = [4] * 18
+
+
+def test_score_matrix_from_hole_scores_marks_incomplete_rows() -> None:
+    hole_scores = np.array([SCORES_1, SCORES_2, SCORES_2, SCORES_2], dtype=float)
+    hole_scores[1:, 17] = [np.nan, 0, 0.5]
+
+    matrix = scorecard.EventScoreMatrix.from_hole_scores(
+        player_names=["Complete", "Missing", "Zero", "Fraction"],
+        hole_scores=hole_scores,
+    )
+
+    assert matrix.is_complete.tolist() == [True, False, False, False]
+    assert matrix.hole_scores.dtype == scorecard.EventScoreMatrix.SCORE_DTYPE
+    assert matrix.hole_scores[1:].tolist() == [[0] * 18] * 3
+    assert matrix.scorecard("Missing") is scorecard.IncompleteScorecard()
+
+
+def test_score_matrix_from_hole_scores_truncates_fractional_scores_like_int(caplog: pytest.LogCaptureFixture) -> None:
+    hole_scores = np.array([SCORES_2], dtype=float)
+    hole_scores[0, [0, 17]] = [4.5, 5.9]
+
+    matrix = scorecard.EventScoreMatrix.from_hole_scores(player_names=["Fraction"], hole_scores=hole_scores)
+
+    assert matrix.is_complete.tolist() == [True]
+    assert matrix.scorecard("Fraction") == scorecard.scorecard_factory(
+        {hole_num: int(score) for (hole_num, score) in zip(scorecard.HOLE_NUMS, hole_scores[0])}
+    )
+    assert matrix.hole_scores[0, [0, 17]].tolist() == [4, 5]
+    assert caplog.records == []
+
+
+def test_score_matrix_from_hole_scores_warns_about_invalid_scores(caplog: pytest.LogCaptureFixture) -> None:
+    hole_scores = np.array([SCORES_2, SCORES_2, SCORES_2], dtype=float)
+    hole_scores[1, 17] = np.nan
+    hole_scores[2, [0, 17]] = [0.5, 0]
+
+    scorecard.EventScoreMatrix.from_hole_scores(
+        player_names=["Complete", "Missing", "Invalid"], hole_scores=hole_scores
+    )
+
+    # Missing scores are expected while an event is being played, so only the entered scores that are invalid are
+    # warned about.
+    [record] = caplog.records
+    assert record.levelname == "WARNING"
+    assert "Player Invalid" in record.message
+    assert "{1: 0.5, 18: 0.0}" in record.message
+
+
+def test_score_matrix_scorecard_is_a_view_of_its_row() -> None:
+    matrix = scorecard.EventScoreMatrix.from_hole_scores(player_names=["A", "B"], hole_scores=[SCORES_1, SCORES_2])
+
+    player_scorecard = matrix.scorecard("A")
+
+    assert player_scorecard.is_complete_score()
+    assert player_scorecard.hole_strokes(4) == 6
+    assert player_scorecard == scorecard.CompleteScorecard(dict(zip(scorecard.HOLE_NUMS, SCORES_1)))
+    with pytest.raises(scorecard.ScorecardError):
+        player_scorecard.hole_strokes(19)
+
+
+def test_score_matrix_round_trips_scorecards() -> None:
+    scorecards = {
+        "A": scorecard.CompleteScorecard(dict(zip(scorecard.HOLE_NUMS, SCORES_1))),
+        "B": scorecard.IncompleteScorecard(),
+    }
+
+    matrix = scorecard.EventScoreMatrix.from_scorecards(scorecards)
+
+    assert matrix.player_names == ["A", "B"]
+    assert matrix.scorecards() == scorecards
+
+
+def test_score_matrix_with_incomplete() -> None:
+    matrix = scorecard.EventScoreMatrix.from_hole_scores(player_names=["A", "B"], hole_scores=[SCORES_1, SCORES_2])
+
+    updated = matrix.with_incomplete(["B"])
+
+    assert updated.is_complete.tolist() == [True, False]
+    assert matrix.is_complete.tolist() == [True, True]
+    assert not updated.scorecard("B").is_complete_score()
+
+
+def test_score_matrix_is_read_only() -> None:
+    matrix = scorecard.EventScoreMatrix.from_hole_scores(player_names=["A"], hole_scores=[SCORES_1])
+
+    with pytest.raises(ValueError):
+        matrix.hole_scores[0, 0] = 1
+
+
+@pytest.mark.parametrize(
+    "player_names, hole_scores, is_complete",
+    [
+        (["A", "A"], [SCORES_1, SCORES_2], [True, True]),
+        (["A"], [SCORES_1[:17]], [True]),
+        (["A"], [[0] + SCORES_1[1:]], [True]),
+        (["A"], [[float(score) for score in SCORES_1]], [True]),
+    ],
+)
+def test_score_matrix_validation_errors(
+    player_names: list[str],
+    hole_scores: list[list[int]],
+    is_complete: list[bool],
+) -> None:
+    with pytest.raises(scorecard.ScorecardValidationError):
+        scorecard.EventScoreMatrix(player_names=player_names, hole_scores=hole_scores, is_complete=is_complete)
+
+
+def test_score_matrix_missing_player_raises_error() -> None:
+    matrix = scorecard.EventScoreMatrix.from_hole_scores(player_names=["A"], hole_scores=[SCORES_1])
+
+    assert "B" not in matrix
+    with pytest.raises(scorecard.ScorecardError):
+        matrix.scorecard("B")
@@ -82,6 +82,103 @@ def test_load_season_config_file() -> None:
         assert season_config.leaderboard_sheet_name == "Leaderboard"
 
 
+def test_load_season_config_file_default_sheet_api_limits() -> None:
+    with temp_season_config_file() as config_file:
+        season_config = config.load_season_config_file(config_file)
+
+        assert season_config.sheet_api_limits == config.SheetApiLimitsConfig()
+        assert season_config.sheet_api_limits.read_requests_per_minute == 60
+        assert season_config.sheet_api_limits.write_requests_per_minute == 60
+
+
+def test_load_season_config_file_sheet_api_limits() -> None:
+    yaml_data = (
+        TEST_SEASON_CONFIG_YAML
+        + """
+sheet_api_limits: {
+  read_requests_per_minute: 30,
+  write_requests_per_minute: 20,
+  max_retries: 2,
+  max_backoff_seconds: 10,
+}
+"""
+    )
+    with temp_season_config_file(yaml_data=yaml_data) as config_file:
+        season_config = config.load_season_config_file(config_file)
+
+        assert season_config.sheet_api_limits == config.SheetApiLimitsConfig(
+            read_requests_per_minute=30,
+            write_requests_per_minute=20,
+            max_retries=2,
+            max_backoff_seconds=10.0,
+        )
+
+
+def test_load_season_config_file_invalid_sheet_api_limits_raises_error() -> None:
+    yaml_data = (
+        TEST_SEASON_CONFIG_YAML
+        + """
+sheet_api_limits: {
+  read_requests_per_minute: 0,
+}
+"""
+    )
+    with temp_season_config_file(yaml_data=yaml_data) as config_file:
+        with pytest.raises(config.SeasonConfigLoadError):
+            config.load_season_config_file(config_file)
+
+
+def test_load_season_config_file_default_points_schedules() -> None:
+    with temp_season_config_file() as config_file:
+        season_config = config.load_season_config_file(config_file)
+
+        schedules = season_config.points_schedules
+        assert schedules.for_event_type(config.EventType.STANDARD) == config.DEFAULT_STANDARD_POINTS_SCHEDULE
+        assert schedules.for_event_type(config.EventType.MAJOR).multiplier == 2.0
+
+
+def test_load_season_config_file_points_schedules() -> None:
+    yaml_data = (
+        TEST_SEASON_CONFIG_YAML
+        + """
+points_schedules: {
+  standard: {
+    points_by_rank: [100, 80, 60],
+    tail_step: 5,
+    tail_min_points: 1,
+  },
+}
+"""
+    )
+    with temp_season_config_file(yaml_data=yaml_data) as config_file:
+        season_config = config.load_season_config_file(config_file)
+
+        assert season_config.points_schedules.standard == config.PointsScheduleConfig(
+            points_by_rank=[100.0, 80.0, 60.0],
+            tail_step=5.0,
+            tail_min_points=1.0,
+        )
+        assert season_config.points_schedules.major == config.DEFAULT_MAJOR_POINTS_SCHEDULE
+
+
+@pytest.mark.parametrize(
+    "schedule",
+    [
+        "points_by_rank: []",
+        "points_by_rank: [10, 20]",
+        "points_by_rank: [10, 5, 5, 6]",
+        "points_by_rank: [10, -1]",
+        # The points past the table would increase with rank
+        "points_by_rank: [10, 5], tail_min_points: 6",
+    ],
+)
+def test_load_season_config_file_invalid_points_schedule_raises_error(schedule: str) -> None:
+    yaml_data = TEST_SEASON_CONFIG_YAML + f"\npoints_schedules: {{standard: {{{schedule}}}}}\n"
+    with temp_season_config_file(yaml_data=yaml_data) as config_file:
+        with pytest.raises(config.SeasonConfigLoadError):
+            config.load_season_config_file(config_file)
+
+
 TEST_SEASON_CONFIG_YAML_WRONG_EVENT_KEYS = """
 name: SFSGT 2024
 sheet_id: test_sheet_id
@@ -125,6 +125,11 @@ def build_expected_model_input_data(stub_course: mock.MagicMock) -> season_model
                             scorecard=build_test_player_scorecard(),
                         )
                     ],
+                    points_schedule=season_model.SeasonModelPointsSchedule(
+                        points_by_rank=(50.0, 45.0, 37.5, 30.0, 25.0, 20.0),
+                        tail_step=0.5,
+                        tail_min_points=0.5,
+                    ),
                 )
             ]
         ),
@@ -0,0 +1,148 @@
+from unittest import mock
+
+import gspread
+import pytest
+import season_config
+import season_controller
+import season_model
+import season_view
+from courses import CourseProvider
+from google_sheet import ConcreteGoogleSheetController
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def build_watcher(
+    controller: mock.MagicMock,
+    clock: FakeClock,
+    sleeps: list[float],
+    interval_seconds: float = 30.0,
+    after_run: mock.MagicMock | None = None,
+) -> season_controller.SeasonWatcher:
+    def sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+        clock.now += seconds
+
+    return season_controller.SeasonWatcher(
+        controller=controller,
+        interval_seconds=interval_seconds,
+        after_run=after_run,
+        clock=clock,
+        sleep=sleep,
+    )
+
+
+def test_watch_runs_season_every_interval_from_the_start_of_each_run() -> None:
+    clock = FakeClock()
+    sleeps: list[float] = []
+    controller = mock.MagicMock(spec=season_controller.SeasonController)
+    run_seconds = iter([2.0, 45.0, 0.5])
+
+    def run_season() -> None:
+        clock.now += next(run_seconds)
+
+    controller.run_season.side_effect = run_season
+
+    build_watcher(controller, clock, sleeps).watch(max_runs=3)
+
+    assert controller.run_season.call_count == 3
+    # A run that takes longer than the interval is followed immediately by the next run.
+    assert sleeps == [28.0, 0.0]
+
+
+def test_watch_continues_after_failed_run(caplog: pytest.LogCaptureFixture) -> None:
+    clock = FakeClock()
+    sleeps: list[float] = []
+    controller = mock.MagicMock(spec=season_controller.SeasonController)
+    controller.run_season.side_effect = [ValueError("Invalid hole score"), None]
+
+    build_watcher(controller, clock, sleeps).watch(max_runs=2)
+
+    assert controller.run_season.call_count == 2
+    assert "The season run failed" in caplog.text
+
+
+def test_watch_refreshes_controller_only_after_failed_runs() -> None:
+    controller = mock.MagicMock(spec=season_controller.SeasonController)
+    controller.run_season.side_effect = [None, ValueError("Invalid hole score"), None]
+
+    build_watcher(controller, FakeClock(), []).watch(max_runs=3)
+
+    controller.refresh.assert_called_once()
+
+
+def sheet_metadata(worksheet_titles: list[str]) -> dict:
+    return {
+        "properties": {"title": "Season"},
+        "sheets": [
+            {"properties": {"title": title, "sheetId": idx, "index": idx}} for idx, title in enumerate(worksheet_titles)
+        ],
+    }
+
+
+def test_watch_recovers_after_worksheet_is_renamed_between_runs(caplog: pytest.LogCaptureFixture) -> None:
+    spreadsheet = mock.MagicMock()
+    spreadsheet.client = mock.MagicMock(spec=gspread.http_client.HTTPClient)
+    spreadsheet.fetch_sheet_metadata.return_value = sheet_metadata(["Players", "Sheet3"])
+    gspread_client = mock.MagicMock()
+    gspread_client.open_by_key.return_value = spreadsheet
+    sheet_controller = ConcreteGoogleSheetController(gspread_client=gspread_client, sheet_id="fake-sheet-id")
+
+    view = mock.MagicMock(spec=season_view.SeasonView)
+    view.read_season.side_effect = lambda: sheet_controller.worksheet("Event 1")
+    view.is_season_unchanged.return_value = True
+    view.refresh.side_effect = sheet_controller.invalidate_metadata
+    controller = season_controller.SeasonController(
+        model=mock.MagicMock(spec=season_model.SeasonModel),
+        view=view,
+        config=mock.MagicMock(spec=season_config.SeasonConfig),
+        course_provider=mock.MagicMock(spec=CourseProvider),
+    )
+
+    def rename_worksheet_while_sleeping(seconds: float) -> None:
+        spreadsheet.fetch_sheet_metadata.return_value = sheet_metadata(["Players", "Event 1"])
+
+    watcher = season_controller.SeasonWatcher(
+        controller=controller, interval_seconds=30.0, clock=FakeClock(), sleep=rename_worksheet_while_sleeping
+    )
+    watcher.watch(max_runs=2)
+
+    # Only the first run fails, since the metadata that was cached before the rename is discarded after it.
+    assert caplog.text.count("The season run failed") == 1
+    assert view.read_season.call_count == 2
+    assert spreadsheet.fetch_sheet_metadata.call_count == 2
+
+
+def test_watch_calls_after_run_after_every_run() -> None:
+    controller = mock.MagicMock(spec=season_controller.SeasonController)
+    controller.run_season.side_effect = [ValueError("Invalid hole score"), None, KeyboardInterrupt()]
+    after_run = mock.MagicMock()
+
+    with pytest.raises(KeyboardInterrupt):
+        build_watcher(controller, FakeClock(), [], after_run=after_run).watch()
+
+    # Including the run that failed and the run that was interrupted
+    assert after_run.call_count == 3
+
+
+def test_watch_stops_when_interrupted() -> None:
+    controller = mock.MagicMock(spec=season_controller.SeasonController)
+    controller.run_season.side_effect = [None, KeyboardInterrupt()]
+
+    with pytest.raises(KeyboardInterrupt):
+        build_watcher(controller, FakeClock(), []).watch()
+
+    assert controller.run_season.call_count == 2
+
+
+def test_non_positive_interval_raises_error() -> None:
+    controller = mock.MagicMock(spec=season_controller.SeasonController)
+
+    with pytest.raises(ValueError):
+        build_watcher(controller, FakeClock(), [], interval_seconds=0.0)
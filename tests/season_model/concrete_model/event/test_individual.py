@@ -1,6 +1,9 @@
+import random
+
+import pytest
 from courses.course import Course, TeeInfo
 from season_common.player import Player, PlayerGender
-from season_common.scorecard import CompleteScorecard, IncompleteScorecard
+from season_common.scorecard import CompleteScorecard, EventScoreMatrix, IncompleteScorecard, Scorecard
 from season_model.api.input import SeasonModelEventPlayerInput
 from season_model.api.result import (
     SeasonModelCompleteEventPlayerIndividualResult,
@@ -8,7 +11,9 @@ from season_model.api.result import (
 )
 from season_model.api.result.notable_holes import NotableHoles, NotableHoleType
 from season_model.concrete_model.event.individual import (
+    EventIndividualResultsGenerator,
     PlayerIndividualResultGenerator,
+    PlayerResultError,
 )
 
 STUB_PLAYER_HOLE_SCORES = {
@@ -190,3 +195,70 @@ def test_result_generator_individual_result() -> None:
     )
 
     assert generator.generate() == expected_result
+
+
+def random_player_inputs(num_players: int, seed: int) -> list[SeasonModelEventPlayerInput]:
+    rng = random.Random(seed)
+    scorecards: dict[str, Scorecard] = {}
+    for idx in range(num_players):
+        if rng.random() < 0.1:
+            scorecards[f"Player {idx}"] = IncompleteScorecard()
+        else:
+            scores = [max(1, par + rng.choice([-3, -2, -1, 0, 0, 1, 1, 2, 3, 6])) for par in STUB_COURSE_HOLE_PARS]
+            scorecards[f"Player {idx}"] = CompleteScorecard(scores=dict(zip(range(1, 19), scores)))
+
+    # Score matrix views and standalone scorecards are both used as inputs.
+    if seed % 2 == 0:
+        scorecards = EventScoreMatrix.from_scorecards(scorecards).scorecards()
+
+    return [
+        SeasonModelEventPlayerInput(
+            # Handicap indices to the tenth, like the indices read from the players worksheet.
+            handicap_index=rng.randint(-30, 400) / 10,
+            scorecard=player_scorecard,
+            player=Player(name=name, gender=rng.choice([PlayerGender.MALE, PlayerGender.FEMALE])),
+        )
+        for (name, player_scorecard) in scorecards.items()
+    ]
+
+
+BATCH_STUB_COURSE = Course(
+    name="Presidio",
+    mens_tees={"blue": TeeInfo(rating=71.3, slope=133)},
+    womens_tees={STUB_COURSE_TEE: TeeInfo(rating=69.5, slope=129)},
+    hole_pars=STUB_COURSE_HOLE_PARS,
+)
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2, 3])
+def test_event_results_generator_matches_player_results(seed: int) -> None:
+    inputs = random_player_inputs(num_players=200, seed=seed)
+    tees = ["blue" if input.gender is PlayerGender.MALE else STUB_COURSE_TEE for input in inputs]
+
+    results = EventIndividualResultsGenerator(inputs=inputs, course=BATCH_STUB_COURSE, tees=tees).generate()
+
+    for input, tee in zip(inputs, tees):
+        expected = PlayerIndividualResultGenerator(input=input, course=BATCH_STUB_COURSE, tee=tee).generate()
+        assert results[input.player_name] == expected
+        if expected.is_complete_result():
+            assert repr(results[input.player_name].score_differential) == repr(expected.score_differential)
+
+
+def test_event_results_generator_individual_result() -> None:
+    results = EventIndividualResultsGenerator(
+        inputs=[STUB_PLAYER_INPUT], course=STUB_COURSE, tees=[STUB_COURSE_TEE]
+    ).generate()
+
+    assert results == {
+        STUB_PLAYER.name: PlayerIndividualResultGenerator(
+            input=STUB_PLAYER_INPUT, course=STUB_COURSE, tee=STUB_COURSE_TEE
+        ).generate()
+    }
+    assert results[STUB_PLAYER.name].notable_holes == EXPECTED_NOTABLE_HOLES
+
+
+def test_event_results_generator_unknown_tee_raises_error() -> None:
+    generator = EventIndividualResultsGenerator(inputs=[STUB_PLAYER_INPUT], course=STUB_COURSE, tees=["red"])
+
+    with pytest.raises(PlayerResultError):
+        generator.generate()
@@ -1,5 +1,5 @@
 import pytest
-from season_model.api.input import SeasonModelEventType
+from season_model.api.input import SeasonModelEventType, SeasonModelPointsSchedule
 from season_model.concrete_model.event import points
 
 TEST_PLAYER_RANKS_NO_TIES = {
@@ -15,19 +15,6 @@ TEST_PLAYER_RANKS_NO_TIES = {
     "Player_10": 9,
 }
 
-TEST_PLAYERS_AT_EACH_RANK_NO_TIES: dict[int, list[str]] = {
-    1: ["Player_8"],
-    2: ["Player_6"],
-    3: ["Player_4"],
-    4: ["Player_9"],
-    5: ["Player_7"],
-    6: ["Player_1"],
-    7: ["Player_3"],
-    8: ["Player_2"],
-    9: ["Player_10"],
-    10: ["Player_5"],
-}
-
 TEST_PLAYER_POINTS_NO_TIES_STANDARD_EVENT = {
     "Player_1": 20.0,
     "Player_2": 19.0,
@@ -54,19 +41,6 @@ TEST_PLAYER_RANKS_WITH_TIES = {
     "Player_10": 9,
 }
 
-TEST_PLAYERS_AT_EACH_RANK_WITH_TIES: dict[int, list[str]] = {
-    1: ["Player_8"],
-    2: ["Player_4", "Player_6"],
-    3: [],
-    4: ["Player_9"],
-    5: ["Player_7"],
-    6: ["Player_1"],
-    7: ["Player_2", "Player_3"],
-    8: [],
-    9: ["Player_10"],
-    10: ["Player_5"],
-}
-
 TEST_PLAYER_POINTS_WITH_TIES_STANDARD_EVENT = {
     "Player_1": 20.0,
     "Player_2": 19.25,
@@ -143,45 +117,77 @@ def test_verify_player_ranks_raises_error_if_rank_not_in_allowed_range() -> None
         points_._verify_player_ranks(player_ranks)
 
 
-def test_players_at_each_rank_no_ties() -> None:
+def test_points_from_ranks_one_player_standard_event() -> None:
     points_ = points.Points(SeasonModelEventType.STANDARD)
 
-    assert points_._players_at_each_rank(TEST_PLAYER_RANKS_NO_TIES) == TEST_PLAYERS_AT_EACH_RANK_NO_TIES
+    assert points_.points_from_ranks([1]).tolist() == [50.0]
 
 
-def test_players_at_each_rank_with_ties() -> None:
+def test_points_from_ranks_two_players_standard_event() -> None:
     points_ = points.Points(SeasonModelEventType.STANDARD)
 
-    assert points_._players_at_each_rank(TEST_PLAYER_RANKS_WITH_TIES) == TEST_PLAYERS_AT_EACH_RANK_WITH_TIES
+    # Points for rank 3 and 4 split evenly
+    assert points_.points_from_ranks([3, 3]).tolist() == [33.75, 33.75]
 
 
-def test_player_points_no_ties_standard_event() -> None:
+def test_points_from_ranks_three_players_standard_event() -> None:
     points_ = points.Points(SeasonModelEventType.STANDARD)
 
-    assert points_._player_points(TEST_PLAYERS_AT_EACH_RANK_NO_TIES) == TEST_PLAYER_POINTS_NO_TIES_STANDARD_EVENT
+    # Points for rank 6, 7, and 8 split evenly
+    assert points_.points_from_ranks([6, 6, 6]).tolist() == [19.5, 19.5, 19.5]
 
 
-def test_player_points_with_ties_standard_event() -> None:
+def test_points_from_ranks_matches_player_points_from_ranks() -> None:
     points_ = points.Points(SeasonModelEventType.STANDARD)
+    player_ranks = TEST_PLAYER_RANKS_WITH_TIES
 
-    assert points_._player_points(TEST_PLAYERS_AT_EACH_RANK_WITH_TIES) == TEST_PLAYER_POINTS_WITH_TIES_STANDARD_EVENT
+    player_points = points_.points_from_ranks(list(player_ranks.values()))
 
+    assert dict(zip(player_ranks.keys(), player_points.tolist())) == TEST_PLAYER_POINTS_WITH_TIES_STANDARD_EVENT
 
-def test_points_for_players_at_rank_one_player_standard_event() -> None:
-    points_ = points.Points(SeasonModelEventType.STANDARD)
 
-    assert points_._points_for_players_at_rank(rank=1, num_players=1) == 50.0
+def test_points_from_ranks_empty_ranks_returns_empty_array() -> None:
+    points_ = points.Points(SeasonModelEventType.MAJOR)
+
+    assert points_.points_from_ranks([]).tolist() == []
 
 
-def test_points_for_players_at_rank_two_players_standard_event() -> None:
+@pytest.mark.parametrize("ranks", [[0, 1], [52], [50, 50, 50]])
+def test_points_from_ranks_invalid_ranks_raise_error(ranks: list[int]) -> None:
     points_ = points.Points(SeasonModelEventType.STANDARD)
 
-    # Points for rank 3 and 4 split evenly
-    assert points_._points_for_players_at_rank(rank=3, num_players=2) == 33.75
+    with pytest.raises(points.InvalidPlayerRanksError):
+        points_.points_from_ranks(ranks)
 
 
-def test_points_for_players_at_rank_three_players_standard_event() -> None:
-    points_ = points.Points(SeasonModelEventType.STANDARD)
+def test_points_for_large_field_use_schedule_tail() -> None:
+    schedule = SeasonModelPointsSchedule(points_by_rank=(10.0, 8.0), tail_step=3.0, tail_min_points=1.0, multiplier=2.0)
+    points_ = points.Points(SeasonModelEventType.STANDARD, schedule=schedule, num_ranks=200)
 
-    # Points for rank 6, 7, and 8 split evenly
-    assert points_._points_for_players_at_rank(rank=6, num_players=3) == 19.5
+    assert points_.points_from_ranks([1, 2, 3, 4, 200]).tolist() == [20.0, 16.0, 10.0, 4.0, 2.0]
+    # Players tied at the last rank share its points
+    assert points_.player_points_from_ranks({"Player_1": 199, "Player_2": 199}) == {"Player_1": 2.0, "Player_2": 2.0}
+
+
+def test_default_schedules_cover_large_fields() -> None:
+    points_ = points.Points(SeasonModelEventType.MAJOR, num_ranks=150)
+
+    assert points_.points_from_ranks([1, 51, 150]).tolist() == [100.0, 1.0, 1.0]
+
+
+def test_default_points_tables_are_built_from_the_default_config_schedules() -> None:
+    # 50 points for a win down to 20 points for 6th place, then half a point less for each rank down to half a point.
+    assert len(points.STANDARD_EVENT_POINTS_BY_RANK) == 51
+    assert [points.STANDARD_EVENT_POINTS_BY_RANK[rank] for rank in [1, 2, 3, 6, 7, 44, 45, 51]] == [
+        50.0,
+        45.0,
+        37.5,
+        20.0,
+        19.5,
+        1.0,
+        0.5,
+        0.5,
+    ]
+    assert points.MAJOR_EVENT_POINTS_BY_RANK == {
+        rank: points_ * 2 for rank, points_ in points.STANDARD_EVENT_POINTS_BY_RANK.items()
+    }
@@ -0,0 +1,164 @@
+import dataclasses
+import pathlib
+from typing import Any
+
+import pytest
+import season_model
+from season_common import scorecard
+from season_model.concrete_model import result_cache, scoring_version, season
+from season_model.concrete_model.event import EventResultGenerator
+
+from tests.benchmarks.test_scaling import build_season_input
+
+NUM_PLAYERS = 20
+
+
+@pytest.fixture
+def cache(tmp_path: pathlib.Path) -> result_cache.EventResultCache:
+    return result_cache.EventResultCache(cache_dir=tmp_path / "event_results")
+
+
+def with_player_changes(
+    event_input: season_model.SeasonModelEventInput,
+    player_name: str,
+    **changes: Any,
+) -> season_model.SeasonModelEventInput:
+    players = [
+        player._replace(**changes) if player.player_name == player_name else player for player in event_input.players
+    ]
+    return dataclasses.replace(event_input, players=players)
+
+
+def test_digest_is_stable() -> None:
+    event_input = build_season_input(NUM_PLAYERS).event_input("Event 0")
+    same_event_input = build_season_input(NUM_PLAYERS).event_input("Event 0")
+
+    assert result_cache.event_input_digest(event_input) == result_cache.event_input_digest(same_event_input)
+
+
+def test_digest_changes_with_any_input_that_affects_results() -> None:
+    event_input = build_season_input(NUM_PLAYERS).event_input("Event 0")
+    player = next(player for player in event_input.players if player.is_complete_score)
+    changed_scores = player.scorecard.scores() | {18: player.scorecard.hole_strokes(18) + 1}
+
+    changed_inputs = [
+        with_player_changes(event_input, player.player_name, scorecard=scorecard.CompleteScorecard(changed_scores)),
+        with_player_changes(event_input, player.player_name, scorecard=scorecard.IncompleteScorecard()),
+        with_player_changes(event_input, player.player_name, handicap_index=player.handicap_index + 0.1),
+        dataclasses.replace(event_input, event_type=season_model.SeasonModelEventType.MAJOR),
+        dataclasses.replace(event_input, tees=event_input.tees._replace(mens_tee="white")),
+        dataclasses.replace(
+            event_input,
+            points_schedule=season_model.SeasonModelPointsSchedule(points_by_rank=(10.0, 5.0)),
+        ),
+    ]
+
+    digests = {result_cache.event_input_digest(changed_input) for changed_input in changed_inputs}
+    digests.add(result_cache.event_input_digest(event_input))
+    assert len(digests) == len(changed_inputs) + 1
+
+
+def test_load_without_result_returns_none(cache: result_cache.EventResultCache) -> None:
+    assert cache.load(event_name="Event 0", input_digest="digest") is None
+
+
+def test_store_and_load_round_trip(cache: result_cache.EventResultCache) -> None:
+    event_input = build_season_input(NUM_PLAYERS).event_input("Event 0")
+    event_result = EventResultGenerator(input=event_input).generate()
+
+    cache.store(input_digest="digest", result=event_result)
+
+    assert cache.load(event_name="Event 0", input_digest="digest") == event_result
+    assert cache.load(event_name="Event 0", input_digest="other digest") is None
+    assert cache.load(event_name="Event 1", input_digest="digest") is None
+
+
+def test_corrupt_result_is_ignored(cache: result_cache.EventResultCache, tmp_path: pathlib.Path) -> None:
+    event_input = build_season_input(NUM_PLAYERS).event_input("Event 0")
+    cache.store(input_digest="digest", result=EventResultGenerator(input=event_input).generate())
+    for result_file in (tmp_path / "event_results").glob("*.pickle"):
+        result_file.write_bytes(b"not a pickle")
+
+    new_cache = result_cache.EventResultCache(cache_dir=tmp_path / "event_results")
+    assert new_cache.load(event_name="Event 0", input_digest="digest") is None
+
+
+def test_results_are_kept_in_memory(cache: result_cache.EventResultCache, tmp_path: pathlib.Path) -> None:
+    event_input = build_season_input(NUM_PLAYERS).event_input("Event 0")
+    event_result = EventResultGenerator(input=event_input).generate()
+    cache.store(input_digest="digest", result=event_result)
+    new_cache = result_cache.EventResultCache(cache_dir=tmp_path / "event_results")
+    loaded_result = new_cache.load(event_name="Event 0", input_digest="digest")
+
+    for result_file in (tmp_path / "event_results").glob("*.pickle"):
+        result_file.unlink()
+
+    assert cache.load(event_name="Event 0", input_digest="digest") is event_result
+    assert new_cache.load(event_name="Event 0", input_digest="digest") is loaded_result
+
+
+def test_clear_removes_results(cache: result_cache.EventResultCache) -> None:
+    event_input = build_season_input(NUM_PLAYERS).event_input("Event 0")
+    cache.store(input_digest="digest", result=EventResultGenerator(input=event_input).generate())
+
+    cache.clear()
+
+    assert cache.load(event_name="Event 0", input_digest="digest") is None
+
+
+def test_model_only_recalculates_changed_events(
+    cache: result_cache.EventResultCache,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    season_input = build_season_input(NUM_PLAYERS)
+    expected_results = season_model.ConcreteSeasonModel().calculate_results(season_input)
+    model = season_model.ConcreteSeasonModel(result_cache=cache)
+    assert model.calculate_results(season_input) == expected_results
+
+    # Change one score in the last event, which changes the results of that event and of the season.
+    event_inputs = [season_input.event_input(event_name) for event_name in season_input.event_names]
+    last_event = event_inputs[-1]
+    player = next(player for player in last_event.players if player.is_complete_score)
+    event_inputs[-1] = with_player_changes(last_event, player.player_name, scorecard=scorecard.IncompleteScorecard())
+    changed_season_input = season_model.SeasonModelInput(
+        player_names=season_input.player_names,
+        events=season_model.SeasonModelEventInputs(events=event_inputs),
+    )
+
+    generated_events: list[str] = []
+    generate = season.EventResultGenerator.generate
+
+    def tracking_generate(self: EventResultGenerator) -> season_model.SeasonModelEventResult:
+        generated_events.append(self._input.event_name)
+        return generate(self)
+
+    monkeypatch.setattr(season.EventResultGenerator, "generate", tracking_generate)
+    results = model.calculate_results(changed_season_input)
+
+    assert generated_events == [last_event.event_name]
+    assert results == season_model.ConcreteSeasonModel().calculate_results(changed_season_input)
+    assert results != expected_results
+
+
+def test_model_recalculates_every_event_when_scoring_version_changes(
+    cache: result_cache.EventResultCache,
+    tmp_path: pathlib.Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    season_input = build_season_input(NUM_PLAYERS)
+    season_model.ConcreteSeasonModel(result_cache=cache).calculate_results(season_input)
+
+    generated_events: list[str] = []
+    generate = season.EventResultGenerator.generate
+
+    def tracking_generate(self: EventResultGenerator) -> season_model.SeasonModelEventResult:
+        generated_events.append(self._input.event_name)
+        return generate(self)
+
+    monkeypatch.setattr(season.EventResultGenerator, "generate", tracking_generate)
+    monkeypatch.setattr(scoring_version, "SCORING_VERSION", scoring_version.SCORING_VERSION + 1)
+    # The results that were cached on disk by the older scoring code are ignored.
+    reloaded_cache = result_cache.EventResultCache(cache_dir=tmp_path / "event_results")
+    season_model.ConcreteSeasonModel(result_cache=reloaded_cache).calculate_results(season_input)
+
+    assert generated_events == list(season_input.event_names)
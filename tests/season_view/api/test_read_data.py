@@ -1,11 +1,13 @@
 import math
 
 import pytest
+from season_common import scorecard
 from season_common.player import Player, PlayerGender
 from season_view.api.read_data import (
     SeasonViewEventHandicapIndices,
     SeasonViewReadDataInitError,
     SeasonViewReadDataResourceNotFoundError,
+    SeasonViewReadEvent,
     SeasonViewReadPlayer,
 )
 
@@ -41,3 +43,20 @@ class TestSeasonViewReadPlayer:
 
         assert player.is_handicap_available(event_name="Baylands")
         assert not player.is_handicap_available(event_name="Corica")
+
+
+class TestSeasonViewReadEvent:
+    def test_event_from_score_matrix_equals_event_from_scorecards(self) -> None:
+        scores = {hole_num: 4 for hole_num in scorecard.HOLE_NUMS}
+        scorecards: dict[str, scorecard.Scorecard] = {
+            "John Doe": scorecard.CompleteScorecard(scores),
+            "Jane Doe": scorecard.IncompleteScorecard(),
+        }
+        score_matrix = scorecard.EventScoreMatrix.from_scorecards(scorecards)
+
+        event = SeasonViewReadEvent.from_score_matrix(event_name="Baylands", score_matrix=score_matrix)
+
+        assert event == SeasonViewReadEvent(event_name="Baylands", player_scorecards=scorecards)
+        assert event.player_scorecard("John Doe").scores() == scores
+        assert event.score_matrix is score_matrix
+        assert SeasonViewReadEvent(event_name="Baylands", player_scorecards=scorecards).score_matrix == score_matrix
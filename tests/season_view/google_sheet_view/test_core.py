@@ -1,16 +1,54 @@
+import threading
+import time
 from unittest import mock
 
 import pytest
 from google_sheet import GoogleSheetController
 from season_view.api import read_data, write_data
+from season_view.google_sheet_view import snapshot
 from season_view.google_sheet_view.core import (
     GoogleSheetSeasonView,
     GoogleSheetSeasonViewConfig,
     GoogleSheetSeasonViewError,
     GoogleSheetSeasonViewEventConfig,
+    GoogleSheetSeasonViewFinaleConfig,
 )
 
 
+class InFlightRequests:
+    """Tracks how many fake requests are in flight at once, across threads."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.max_count = 0
+        self._lock = threading.Lock()
+
+    def request(self, result=None, on_done=None):
+        def send(*args, **kwargs):
+            with self._lock:
+                self.count += 1
+                self.max_count = max(self.max_count, self.count)
+            # Give requests on other threads a chance to overlap with this one.
+            time.sleep(0.01)
+            with self._lock:
+                self.count -= 1
+            if on_done is not None:
+                on_done()
+            return result
+
+        return send
+
+
+def stub_write_data() -> mock.MagicMock:
+    # Fields of the write data dataclass aren't class attributes, so they're added to the spec explicitly.
+    return mock.MagicMock(
+        spec=write_data.SeasonViewWriteData,
+        leaderboard=mock.MagicMock(),
+        events=[],
+        finale=mock.MagicMock(),
+    )
+
+
 class TestGoogleSheetSeasonViewEventConfig:
     def test_construction_and_properties(self):
         """Test basic construction and property access."""
@@ -503,22 +541,19 @@ class TestGoogleSheetSeasonView:
         mock_players_worksheet.read.return_value = mock_players_data
         mock_players_worksheet_class.return_value = mock_players_worksheet
 
-        mock_worksheet_controller = mock.MagicMock()
-        mock_sheet_controller.worksheet.return_value = mock_worksheet_controller
-
-        result = season_view._read_players_worksheet()
+        values = [["Handicaps"], ["Golfer", "Event A", "Event B"]]
+        result = season_view._read_players_worksheet(values)
 
         # Verify PlayersWorksheet was created correctly
         mock_players_worksheet_class.assert_called_once_with(
-            worksheet_controller=mock_worksheet_controller,
             events=["Event A", "Event B"],
         )
 
-        # Verify worksheet controller was requested
-        mock_sheet_controller.worksheet.assert_called_with("Players")
+        # Players are read from values that have already been fetched
+        mock_sheet_controller.worksheet.assert_not_called()
 
         # Verify read was called and result returned
-        mock_players_worksheet.read.assert_called_once()
+        mock_players_worksheet.read.assert_called_once_with(values)
         assert result == mock_players_data
 
     @mock.patch("season_view.google_sheet_view.worksheets.EventWorksheet")
@@ -532,8 +567,7 @@ class TestGoogleSheetSeasonView:
         mock_worksheet_controller_b = mock.MagicMock()
         mock_sheet_controller.worksheet.side_effect = [mock_worksheet_controller_a, mock_worksheet_controller_b]
 
-        players = ["Player 1", "Player 2", "Player 3"]
-        result = season_view._generate_event_worksheets(players)
+        result = season_view._generate_event_worksheets()
 
         # Verify EventWorksheet created for each event
         assert len(mock_event_worksheet_class.call_args_list) == 2
@@ -543,14 +577,12 @@ class TestGoogleSheetSeasonView:
         assert call_args_a[1]["event_name"] == "Event A"
         assert call_args_a[1]["worksheet_controller"] == mock_worksheet_controller_a
         assert call_args_a[1]["scorecard_start_cell"] == "B5"
-        assert call_args_a[1]["players"] == players
 
         # Check Event B worksheet creation
         call_args_b = mock_event_worksheet_class.call_args_list[1]
         assert call_args_b[1]["event_name"] == "Event B"
         assert call_args_b[1]["worksheet_controller"] == mock_worksheet_controller_b
         assert call_args_b[1]["scorecard_start_cell"] == "B6"
-        assert call_args_b[1]["players"] == players
 
         # Verify result structure
         assert result == {
@@ -567,6 +599,8 @@ class TestGoogleSheetSeasonView:
         # Set up mock event worksheets
         mock_event_worksheet_a = mock.MagicMock()
         mock_event_worksheet_b = mock.MagicMock()
+        mock_event_worksheet_a.read_range.return_value = "B5:V"
+        mock_event_worksheet_b.read_range.return_value = "B6:V"
         mock_event_data_a = mock.MagicMock(spec=read_data.SeasonViewReadEvent)
         mock_event_data_b = mock.MagicMock(spec=read_data.SeasonViewReadEvent)
         mock_event_worksheet_a.read.return_value = mock_event_data_a
@@ -577,11 +611,19 @@ class TestGoogleSheetSeasonView:
             "Event B": mock_event_worksheet_b,
         }
 
-        result = season_view._read_event_worksheets()
+        players = ["Player 1", "Player 2"]
+        values_a = [["Player 1", "4"]]
+        values_b = [["Player 2", "5"]]
+        range_values = {
+            "'EventA_Sheet'!B5:V": values_a,
+            "'EventB_Sheet'!B6:V": values_b,
+        }
+
+        result = season_view._read_event_worksheets(players=players, range_values=range_values)
 
-        # Verify read called on all event worksheets
-        mock_event_worksheet_a.read.assert_called_once()
-        mock_event_worksheet_b.read.assert_called_once()
+        # Verify read called on all event worksheets with their slice of the read values
+        mock_event_worksheet_a.read.assert_called_once_with(values=values_a, players=players)
+        mock_event_worksheet_b.read.assert_called_once_with(values=values_b, players=players)
 
         # Verify result is correct type with expected data
         assert isinstance(result, read_data.SeasonViewReadEvents)
@@ -604,6 +646,8 @@ class TestGoogleSheetSeasonView:
         # Set up mock event worksheets
         mock_event_worksheet_a = mock.MagicMock()
         mock_event_worksheet_b = mock.MagicMock()
+        mock_event_worksheet_a.read_range.return_value = "B5:V"
+        mock_event_worksheet_b.read_range.return_value = "B6:V"
         mock_event_data_a = mock.MagicMock(spec=read_data.SeasonViewReadEvent)
         mock_event_data_b = mock.MagicMock(spec=read_data.SeasonViewReadEvent)
         mock_event_worksheet_a.read.return_value = mock_event_data_a
@@ -611,11 +655,29 @@ class TestGoogleSheetSeasonView:
         mock_event_worksheet_class.side_effect = [mock_event_worksheet_a, mock_event_worksheet_b]
 
         # Set up sheet controller mocks
-        mock_worksheet_controllers = [mock.MagicMock() for _ in range(3)]
+        mock_worksheet_controllers = [mock.MagicMock() for _ in range(2)]
         mock_sheet_controller.worksheet.side_effect = mock_worksheet_controllers
+        range_values = {
+            "'Players'": [["Handicaps"]],
+            "'EventA_Sheet'!B5:V": [["Player 1"]],
+            "'EventB_Sheet'!B6:V": [["Player 2"]],
+        }
+        mock_sheet_controller.batch_read.return_value = range_values
+        written_range_values = {
+            "'EventA_Sheet'!B5:V": [["Player 1", 4]],
+            "'EventB_Sheet'!B6:V": [["Player 2", 5]],
+            "'Leaderboard'!B4:U": [[1, "Player 1"]],
+        }
+        mock_sheet_controller.batch_read_unformatted.return_value = written_range_values
 
         result = season_view.read_season()
 
+        # Verify all worksheets were read with a single request
+        mock_sheet_controller.batch_read.assert_called_once_with(list(range_values.keys()))
+        mock_players_worksheet.read.assert_called_once_with([["Handicaps"]])
+        mock_event_worksheet_a.read.assert_called_once_with(values=[["Player 1"]], players=["Player 1", "Player 2"])
+        mock_event_worksheet_b.read.assert_called_once_with(values=[["Player 2"]], players=["Player 1", "Player 2"])
+
         # Verify result structure
         assert isinstance(result, read_data.SeasonViewReadData)
         assert result.players == mock_players_data
@@ -626,9 +688,59 @@ class TestGoogleSheetSeasonView:
         assert season_view._event_worksheets["Event A"] == mock_event_worksheet_a
         assert season_view._event_worksheets["Event B"] == mock_event_worksheet_b
 
+        # Verify the unformatted values of the written ranges were fetched in the background with a single request
+        season_view._write_prefetch.result()
+        mock_sheet_controller.batch_read_unformatted.assert_called_once_with(list(written_range_values.keys()))
+        mock_event_worksheet_a.set_current_values.assert_called_once_with([["Player 1", 4]])
+        mock_event_worksheet_b.set_current_values.assert_called_once_with([["Player 2", 5]])
+        assert season_view._leaderboard_values == [[1, "Player 1"]]
+
+    @mock.patch("season_view.google_sheet_view.worksheets.FinaleWorksheet")
+    @mock.patch("season_view.google_sheet_view.worksheets.PlayersWorksheet")
+    @mock.patch("season_view.google_sheet_view.worksheets.EventWorksheet")
+    def test_read_season_reads_finale_in_same_request(
+        self, mock_event_worksheet_class, mock_players_worksheet_class, mock_finale_worksheet_class, sample_config
+    ):
+        """Test read_season reads the finale player names along with the other worksheets."""
+        config = GoogleSheetSeasonViewConfig(
+            leaderboard_worksheet_name=sample_config.leaderboard_worksheet_name,
+            players_worksheet_name=sample_config.players_worksheet_name,
+            event_worksheet_configs=sample_config.event_worksheet_configs,
+            finale_config=GoogleSheetSeasonViewFinaleConfig(
+                workshet_name="Finale",
+                player_names_range="B4:B6",
+                season_handicap_column="C",
+                finale_handicap_index_column="D",
+                course_handicap_column="E",
+            ),
+        )
+        controller = mock.MagicMock(spec=GoogleSheetController)
+        controller.worksheet_titles.return_value = ["Players", "Leaderboard", "EventA_Sheet", "EventB_Sheet", "Finale"]
+
+        mock_players_worksheet_class.return_value.read.return_value.player_names = ["Player 1"]
+        mock_event_worksheet_class.return_value.read_range.return_value = "B5:V"
+        mock_finale_worksheet = mock_finale_worksheet_class.return_value
+        mock_finale_worksheet.read_range.return_value = "B4:B6"
+        controller.batch_read.return_value = mock.MagicMock()
+        controller.batch_read.return_value.__getitem__.side_effect = lambda range_name: [[range_name]]
+
+        season_view = GoogleSheetSeasonView(config=config, sheet_controller=controller)
+        with mock.patch("season_view.google_sheet_view.core._verify_season_read_data"):
+            season_view.read_season()
+
+        controller.batch_read.assert_called_once_with(
+            ["'Players'", "'EventA_Sheet'!B5:V", "'EventB_Sheet'!B5:V", "'Finale'!B4:B6"]
+        )
+        mock_finale_worksheet.read.assert_called_once_with([["'Finale'!B4:B6"]])
+
+        # The finale worksheet that was read is the one that is written
+        mock_write_data = stub_write_data()
+        season_view.write_season(mock_write_data)
+        mock_finale_worksheet.write.assert_called_once_with(data=mock_write_data.finale)
+
     def test_write_season_before_read_raises_error(self, season_view):
         """Test write_season raises error when called before read_season."""
-        mock_write_data = mock.MagicMock(spec=write_data.SeasonViewWriteData)
+        mock_write_data = stub_write_data()
 
         with pytest.raises(GoogleSheetSeasonViewError) as exc_info:
             season_view.write_season(mock_write_data)
@@ -637,6 +749,16 @@ class TestGoogleSheetSeasonView:
         assert "An unexpected error has occurred" in error_msg
         assert "read before it was written to" in error_msg
 
+    def test_refresh_invalidates_sheet_metadata_and_read_worksheets(self, season_view, mock_sheet_controller):
+        """Test refresh discards the cached sheet structure, so the season must be read again before it's written."""
+        season_view._event_worksheets = {"Event A": mock.MagicMock()}
+
+        season_view.refresh()
+
+        mock_sheet_controller.invalidate_metadata.assert_called_once()
+        with pytest.raises(GoogleSheetSeasonViewError):
+            season_view.write_season(stub_write_data())
+
     @mock.patch("season_view.google_sheet_view.worksheets.LeaderboardWorksheet")
     def test_write_season_complete_workflow(self, mock_leaderboard_worksheet_class, season_view, mock_sheet_controller):
         """Test complete write_season workflow."""
@@ -649,7 +771,7 @@ class TestGoogleSheetSeasonView:
         }
 
         # Set up write data
-        mock_write_data = mock.MagicMock(spec=write_data.SeasonViewWriteData)
+        mock_write_data = stub_write_data()
         mock_event_data_a = mock.MagicMock()
         mock_event_data_b = mock.MagicMock()
         mock_write_data.get_event.side_effect = lambda event_name: {
@@ -679,10 +801,15 @@ class TestGoogleSheetSeasonView:
             data=mock_leaderboard_data,
             worksheet_controller=mock_leaderboard_controller,
             ordered_event_names=["Event A", "Event B"],
+            current_values=season_view._leaderboard_values,
         )
         mock_leaderboard_worksheet.write.assert_called_once()
 
-    def test_write_season_missing_event_data(self, season_view):
+        # Verify all writes were made in a single batch
+        mock_sheet_controller.begin_batch.assert_called_once()
+        mock_sheet_controller.flush.assert_called_once()
+
+    def test_write_season_missing_event_data(self, season_view, mock_sheet_controller):
         """Test write_season when write data is missing an event."""
         # Set up event worksheets (simulate after read)
         mock_event_worksheet_a = mock.MagicMock()
@@ -693,7 +820,7 @@ class TestGoogleSheetSeasonView:
         }
 
         # Set up write data missing Event B
-        mock_write_data = mock.MagicMock(spec=write_data.SeasonViewWriteData)
+        mock_write_data = stub_write_data()
 
         def mock_get_event(event_name):
             if event_name == "Event A":
@@ -707,6 +834,234 @@ class TestGoogleSheetSeasonView:
         with pytest.raises(KeyError):
             season_view.write_season(mock_write_data)
 
+        # Nothing buffered before the error is written
+        mock_sheet_controller.flush.assert_not_called()
+
+    @pytest.fixture
+    def mock_snapshot_cache(self):
+        """Create mock ReadSnapshotCache, with no stored snapshot."""
+        cache = mock.MagicMock(spec=snapshot.ReadSnapshotCache)
+        cache.key.side_effect = lambda sheet_id, revision_token, view_config: snapshot.ReadSnapshotKey(
+            sheet_id=sheet_id, revision_token=revision_token, config_digest="digest"
+        )
+        cache.load.return_value = None
+        return cache
+
+    def test_read_season_from_unchanged_snapshot_skips_sheet_read(
+        self, sample_config, mock_sheet_controller, mock_snapshot_cache
+    ):
+        """Test read_season returns the snapshot without reading the sheet when the sheet is unchanged."""
+        mock_sheet_controller.sheet_id.return_value = "sheet"
+        mock_sheet_controller.revision_token.return_value = "rev-1"
+        snapshot_data = mock.MagicMock(spec=read_data.SeasonViewReadData)
+        mock_snapshot_cache.load.return_value = snapshot_data
+        season_view = GoogleSheetSeasonView(
+            config=sample_config,
+            sheet_controller=mock_sheet_controller,
+            snapshot_cache=mock_snapshot_cache,
+        )
+
+        result = season_view.read_season()
+
+        assert result == snapshot_data
+        assert season_view.is_season_unchanged()
+        mock_snapshot_cache.load.assert_called_once_with(snapshot.ReadSnapshotKey("sheet", "rev-1", "digest"))
+        mock_sheet_controller.batch_read.assert_not_called()
+
+        with pytest.raises(GoogleSheetSeasonViewError, match="nothing new to write"):
+            season_view.write_season(stub_write_data())
+
+    @mock.patch("season_view.google_sheet_view.worksheets.LeaderboardWorksheet")
+    def test_write_season_stores_snapshot_with_revision_after_write(
+        self, mock_leaderboard_worksheet_class, sample_config, mock_sheet_controller, mock_snapshot_cache
+    ):
+        """Test the data that was read is stored with the sheet revision after the write."""
+        mock_sheet_controller.sheet_id.return_value = "sheet"
+        # Revisions when the season is read, just before it is written, and after it is written.
+        mock_sheet_controller.revision_token.side_effect = ["rev-1", "rev-1", "rev-2"]
+        season_view = GoogleSheetSeasonView(
+            config=sample_config,
+            sheet_controller=mock_sheet_controller,
+            snapshot_cache=mock_snapshot_cache,
+        )
+
+        sheet_data = mock.MagicMock(spec=read_data.SeasonViewReadData)
+        with mock.patch.object(season_view, "_read_season_from_sheet", return_value=sheet_data):
+            assert season_view.read_season() == sheet_data
+        assert not season_view.is_season_unchanged()
+
+        season_view._event_worksheets = {"Event A": mock.MagicMock(), "Event B": mock.MagicMock()}
+        with mock.patch.object(season_view, "_are_inputs_unchanged_since_read", return_value=True):
+            season_view.write_season(stub_write_data())
+
+        mock_sheet_controller.flush.assert_called_once()
+        mock_snapshot_cache.store.assert_called_once_with(
+            key=snapshot.ReadSnapshotKey("sheet", "rev-2", "digest"), data=sheet_data
+        )
+
+    @mock.patch("season_view.google_sheet_view.worksheets.LeaderboardWorksheet")
+    def test_write_season_checks_revision_after_buffering_writes(
+        self, mock_leaderboard_worksheet_class, sample_config, mock_sheet_controller, mock_snapshot_cache
+    ):
+        """Test the sheet is checked for modifications just before the buffered writes are sent."""
+        mock_sheet_controller.sheet_id.return_value = "sheet"
+        season_view = GoogleSheetSeasonView(
+            config=sample_config,
+            sheet_controller=mock_sheet_controller,
+            snapshot_cache=mock_snapshot_cache,
+        )
+        with mock.patch.object(season_view, "_read_season_from_sheet"):
+            mock_sheet_controller.revision_token.return_value = "rev-1"
+            season_view.read_season()
+
+        mock_event_worksheets = {"Event A": mock.MagicMock(), "Event B": mock.MagicMock()}
+        season_view._event_worksheets = mock_event_worksheets
+
+        def revision_token():
+            # The check before the write is made once everything is buffered, but before it's sent.
+            assert all(worksheet.write.called for worksheet in mock_event_worksheets.values())
+            assert not mock_sheet_controller.flush.called
+            return "rev-2"
+
+        mock_sheet_controller.revision_token.side_effect = revision_token
+        season_view.write_season(stub_write_data())
+
+        mock_sheet_controller.flush.assert_called_once()
+        mock_snapshot_cache.store.assert_not_called()
+
+    @mock.patch("season_view.google_sheet_view.worksheets.PlayersWorksheet")
+    @mock.patch("season_view.google_sheet_view.worksheets.EventWorksheet")
+    @pytest.mark.parametrize(
+        ("changed_range", "changed_event_data", "expected_unchanged"),
+        [
+            (None, False, True),
+            # A result cell that was written, which isn't part of the read data.
+            ("'EventA_Sheet'!B5:V", False, True),
+            ("'Players'", False, False),
+            ("'EventA_Sheet'!B5:V", True, False),
+        ],
+    )
+    def test_inputs_unchanged_since_read(
+        self,
+        mock_event_worksheet_class,
+        mock_players_worksheet_class,
+        changed_range,
+        changed_event_data,
+        expected_unchanged,
+        season_view,
+        mock_sheet_controller,
+    ):
+        """Test the season is read again and compared with the inputs that were read before the write."""
+        mock_players_worksheet_class.return_value.read.return_value.player_names = ["Player 1"]
+        event_data = {"Event A": mock.sentinel.event_a, "Event B": mock.sentinel.event_b}
+        reread_event_data = (
+            {**event_data, "Event A": mock.sentinel.edited_event_a} if changed_event_data else event_data
+        )
+        mock_event_worksheet_class.side_effect = [
+            mock.MagicMock(read_range=mock.MagicMock(return_value=f"B{row}:V"), read=mock.MagicMock(return_value=data))
+            for (row, data) in [(5, event_data["Event A"]), (6, event_data["Event B"])]
+            + [(5, reread_event_data["Event A"]), (6, reread_event_data["Event B"])]
+        ]
+        range_values = {
+            "'Players'": [["Handicaps"]],
+            "'EventA_Sheet'!B5:V": [["Player 1"]],
+            "'EventB_Sheet'!B6:V": [["Player 2"]],
+        }
+        reread_range_values = dict(range_values)
+        if changed_range is not None:
+            reread_range_values[changed_range] = [["Edited"]]
+        mock_sheet_controller.batch_read.side_effect = [range_values, reread_range_values]
+
+        with mock.patch("season_view.google_sheet_view.core._verify_season_read_data"):
+            season_view.read_season()
+
+        assert season_view._are_inputs_unchanged_since_read() == expected_unchanged
+
+    @mock.patch("season_view.google_sheet_view.worksheets.LeaderboardWorksheet")
+    def test_write_season_skips_snapshot_when_sheet_modified_after_read(
+        self, mock_leaderboard_worksheet_class, sample_config, mock_sheet_controller, mock_snapshot_cache
+    ):
+        """Test no snapshot is stored when someone else modified the sheet between the read and the write."""
+        mock_sheet_controller.sheet_id.return_value = "sheet"
+        mock_sheet_controller.revision_token.side_effect = ["rev-1", "rev-2"]
+        season_view = GoogleSheetSeasonView(
+            config=sample_config,
+            sheet_controller=mock_sheet_controller,
+            snapshot_cache=mock_snapshot_cache,
+        )
+
+        with mock.patch.object(season_view, "_read_season_from_sheet"):
+            season_view.read_season()
+
+        season_view._event_worksheets = {"Event A": mock.MagicMock(), "Event B": mock.MagicMock()}
+        season_view.write_season(stub_write_data())
+
+        mock_sheet_controller.flush.assert_called_once()
+        mock_snapshot_cache.store.assert_not_called()
+
+    @mock.patch("season_view.google_sheet_view.worksheets.LeaderboardWorksheet")
+    @mock.patch("season_view.google_sheet_view.worksheets.PlayersWorksheet")
+    @mock.patch("season_view.google_sheet_view.worksheets.EventWorksheet")
+    def test_written_values_and_formats_are_fetched_while_results_are_computed_without_overlapping_requests(
+        self,
+        mock_event_worksheet_class,
+        mock_players_worksheet_class,
+        mock_leaderboard_worksheet_class,
+        sample_config,
+        mock_sheet_controller,
+        mock_snapshot_cache,
+    ):
+        """Test the values and formats for the write are fetched in the background after the read, one request at a
+        time."""
+        in_flight = InFlightRequests()
+        formats_fetched = threading.Event()
+
+        mock_event_worksheets = [mock.MagicMock(), mock.MagicMock()]
+        for mock_event_worksheet in mock_event_worksheets:
+            mock_event_worksheet.read_range.return_value = "B5:V"
+            mock_event_worksheet.fetch_background_format.side_effect = in_flight.request()
+        mock_event_worksheets[-1].fetch_background_format.side_effect = in_flight.request(on_done=formats_fetched.set)
+        mock_event_worksheet_class.side_effect = mock_event_worksheets
+        mock_players_worksheet_class.return_value.read.return_value.player_names = ["Player 1"]
+
+        mock_sheet_controller.sheet_id.return_value = "sheet"
+        mock_sheet_controller.revision_token.side_effect = in_flight.request("rev-1")
+        mock_sheet_controller.batch_read.side_effect = in_flight.request(mock.MagicMock())
+        mock_sheet_controller.batch_read_unformatted.side_effect = in_flight.request(mock.MagicMock())
+        mock_sheet_controller.flush.side_effect = in_flight.request()
+        season_view = GoogleSheetSeasonView(
+            config=sample_config,
+            sheet_controller=mock_sheet_controller,
+            snapshot_cache=mock_snapshot_cache,
+        )
+
+        with mock.patch("season_view.google_sheet_view.core._verify_season_read_data"):
+            season_view.read_season()
+
+        # The values and formats are fetched without waiting for the write, i.e. while the results are computed.
+        assert formats_fetched.wait(timeout=5.0)
+        season_view.write_season(stub_write_data())
+
+        mock_sheet_controller.batch_read_unformatted.assert_called_once()
+        for mock_event_worksheet in mock_event_worksheets:
+            mock_event_worksheet.set_current_values.assert_called_once()
+            mock_event_worksheet.fetch_background_format.assert_called_once()
+        mock_sheet_controller.flush.assert_called_once()
+        assert in_flight.max_count == 1
+
+    def test_write_season_raises_prefetch_error_before_writing(self, season_view, mock_sheet_controller):
+        """Test an error in fetching the formats in the background is raised before anything is written."""
+        mock_event_worksheet = mock.MagicMock()
+        mock_event_worksheet.fetch_background_format.side_effect = ValueError("Quota exceeded")
+        season_view._event_worksheets = {"Event A": mock_event_worksheet, "Event B": mock.MagicMock()}
+        season_view._write_prefetch = season_view._prefetch_for_write_in_background()
+
+        with pytest.raises(ValueError, match="Quota exceeded"):
+            season_view.write_season(stub_write_data())
+
+        mock_event_worksheet.write.assert_not_called()
+        mock_sheet_controller.flush.assert_not_called()
+
     def test_large_number_of_events(self):
         """Test configuration and workflow with many events."""
         # Create 10 events
@@ -0,0 +1,141 @@
+import pathlib
+
+import pytest
+import season_view
+from season_common import player, scorecard
+from season_view.google_sheet_view import snapshot
+
+from tests.testing_utils.score_generator import (
+    ScoreGeneratorCourse,
+    SimpleHoleScoreGenerator,
+    SimpleHoleScoreGeneratorStrategy,
+)
+
+
+def build_read_data() -> season_view.SeasonViewReadData:
+    return season_view.SeasonViewReadData(
+        players=season_view.SeasonViewReadPlayers(
+            players=[
+                season_view.SeasonViewReadPlayer(
+                    player=player.Player(name="Mickey", gender=player.PlayerGender.MALE),
+                    event_handicap_indices=season_view.SeasonViewEventHandicapIndices({"Baylands": 16.0}),
+                ),
+            ],
+            are_finale_hcps_available=True,
+        ),
+        events=season_view.SeasonViewReadEvents(
+            {
+                "Baylands": season_view.SeasonViewReadEvent(
+                    event_name="Baylands",
+                    player_scorecards={
+                        "Mickey": scorecard.CompleteScorecard(
+                            scores=SimpleHoleScoreGenerator(
+                                course=ScoreGeneratorCourse.BAYLANDS,
+                                strategy=SimpleHoleScoreGeneratorStrategy.BOGIE_GOLF,
+                            ).generate()
+                        ),
+                    },
+                ),
+            }
+        ),
+    )
+
+
+@pytest.fixture
+def cache(tmp_path: pathlib.Path) -> snapshot.ReadSnapshotCache:
+    return snapshot.ReadSnapshotCache(cache_dir=tmp_path / "snapshots", config_salt="season config")
+
+
+def test_load_without_snapshot_returns_none(cache: snapshot.ReadSnapshotCache) -> None:
+    key = cache.key(sheet_id="sheet", revision_token="rev-1", view_config="view config")
+    assert cache.load(key) is None
+
+
+def test_store_and_load_round_trip(cache: snapshot.ReadSnapshotCache) -> None:
+    key = cache.key(sheet_id="sheet", revision_token="rev-1", view_config="view config")
+    data = build_read_data()
+
+    cache.store(key=key, data=data)
+    loaded = cache.load(key)
+
+    assert loaded is not None
+    assert loaded.players == data.players
+    assert loaded.are_finale_hcps_available
+    assert loaded.events == data.events
+
+
+@pytest.mark.parametrize(
+    "changed_key_args",
+    [
+        {"revision_token": "rev-2"},
+        {"view_config": "other view config"},
+        {"sheet_id": "other sheet"},
+    ],
+)
+def test_load_with_different_key_returns_none(
+    cache: snapshot.ReadSnapshotCache,
+    changed_key_args: dict[str, str],
+) -> None:
+    key_args = {"sheet_id": "sheet", "revision_token": "rev-1", "view_config": "view config"}
+    cache.store(key=cache.key(**key_args), data=build_read_data())
+
+    assert cache.load(cache.key(**(key_args | changed_key_args))) is None
+
+
+def test_load_with_different_config_salt_returns_none(tmp_path: pathlib.Path) -> None:
+    cache = snapshot.ReadSnapshotCache(cache_dir=tmp_path, config_salt="season config")
+    key = cache.key(sheet_id="sheet", revision_token="rev-1", view_config="view config")
+    cache.store(key=key, data=build_read_data())
+
+    other_cache = snapshot.ReadSnapshotCache(cache_dir=tmp_path, config_salt="changed season config")
+    other_key = other_cache.key(sheet_id="sheet", revision_token="rev-1", view_config="view config")
+
+    assert other_cache.load(other_key) is None
+
+
+def test_load_corrupt_snapshot_returns_none(tmp_path: pathlib.Path) -> None:
+    cache = snapshot.ReadSnapshotCache(cache_dir=tmp_path)
+    (tmp_path / "sheet.pickle").write_bytes(b"not a pickle")
+
+    assert cache.load(cache.key(sheet_id="sheet", revision_token="rev-1", view_config="")) is None
+
+
+def test_load_snapshot_with_old_format_version_returns_none(
+    cache: snapshot.ReadSnapshotCache,
+    tmp_path: pathlib.Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    key = cache.key(sheet_id="sheet", revision_token="rev-1", view_config="view config")
+    monkeypatch.setattr(snapshot, "SNAPSHOT_FORMAT_VERSION", 0)
+    cache.store(key=key, data=build_read_data())
+    monkeypatch.undo()
+
+    # The snapshot was written by older code, which is loaded by a new process.
+    new_cache = snapshot.ReadSnapshotCache(cache_dir=tmp_path / "snapshots", config_salt="season config")
+    assert new_cache.load(key) is None
+
+
+def test_stored_snapshot_is_kept_in_memory(cache: snapshot.ReadSnapshotCache, tmp_path: pathlib.Path) -> None:
+    key = cache.key(sheet_id="sheet", revision_token="rev-1", view_config="view config")
+    data = build_read_data()
+    cache.store(key=key, data=data)
+
+    for snapshot_file in (tmp_path / "snapshots").iterdir():
+        snapshot_file.unlink()
+
+    assert cache.load(key) is data
+
+
+def test_clear_removes_snapshot(cache: snapshot.ReadSnapshotCache) -> None:
+    key = cache.key(sheet_id="sheet", revision_token="rev-1", view_config="view config")
+    cache.store(key=key, data=build_read_data())
+
+    cache.clear(sheet_id="sheet")
+
+    assert cache.load(key) is None
+    # Clearing a missing snapshot is not an error
+    cache.clear(sheet_id="sheet")
+
+
+def test_config_digest_separates_parts() -> None:
+    assert snapshot.config_digest("ab", "c") != snapshot.config_digest("a", "bc")
@@ -4,7 +4,9 @@ from unittest.mock import patch
 
 import pandas as pd
 import pytest
-from google_sheet import GoogleWorksheet, RangeValues, SortOrder, SortSpec
+from google_sheet import CellValues, GoogleWorksheet, RangeValues, SortOrder, SortSpec
+from google_sheet.diff import CurrentValues
+from gspread import utils as gspread_utils
 from pandas import testing as pd_testing
 from season_common.scorecard import CompleteScorecard, IncompleteScorecard
 from season_view.api.read_data import SeasonViewReadEvent
@@ -44,6 +46,7 @@ STUB_WORKSHEET_DATA_RAW = pd.DataFrame(
     ],
 )
 # fmt: on
+STUB_WORKSHEET_VALUES_RAW: list[list[str]] = STUB_WORKSHEET_DATA_RAW.values.tolist()
 
 STUB_WORKSHEET_DATA_PROCESSED = pd.DataFrame(
     data=[
@@ -138,25 +141,17 @@ EXPECTED_SEASON_VIEW_READ_DATA = SeasonViewReadEvent(
 STUB_SEASON_VIEW_READ_DATA = EXPECTED_SEASON_VIEW_READ_DATA
 
 
-def google_worksheet_double(data: pd.DataFrame = STUB_WORKSHEET_DATA_RAW) -> mock.MagicMock:
-    stub_worksheet = mock.MagicMock(spec=event.google_sheet.GoogleWorksheet)
-    stub_worksheet.range_to_df.return_value = data
-
-    return stub_worksheet
+def google_worksheet_double() -> mock.MagicMock:
+    return mock.MagicMock(spec=event.google_sheet.GoogleWorksheet)
 
 
 def create_event_worksheet_reader(
     event_name: str = STUB_EVENT,
-    google_worksheet: GoogleWorksheet | None = None,
-    raw_worksheet_data: pd.DataFrame = STUB_WORKSHEET_DATA_RAW,
     scorecard_start_cell: str = STUB_SCORECARD_START_CELL,
     players: list[str] = STUB_PLAYERS,
 ) -> EventWorksheetReader:
-    ws_controller = google_worksheet or google_worksheet_double(data=raw_worksheet_data)
-
     return EventWorksheetReader(
         event_name=event_name,
-        worksheet_controller=ws_controller,
         scorecard_start_cell=scorecard_start_cell,
         players=players,
     )
@@ -167,6 +162,7 @@ def create_event_worksheet_writer(
     data: SeasonViewWriteEvent = STUB_WORKSHEET_WRITE_DATA,
     scorecard_start_cell: str = STUB_SCORECARD_START_CELL,
     players_ordered_at_read_time: list[str] = STUB_PLAYERS,
+    current_values: CurrentValues | None = None,
 ) -> EventWorksheetWriter:
     ws_controller = google_worksheet or google_worksheet_double()
     return EventWorksheetWriter(
@@ -174,46 +170,98 @@ def create_event_worksheet_writer(
         worksheet_controller=ws_controller,
         scorecard_start_cell=scorecard_start_cell,
         players_ordered_at_read_time=players_ordered_at_read_time,
+        current_values=current_values,
     )
 
 
+def displayed_values_after_write() -> list[list[str]]:
+    """The values displayed in the worksheet after STUB_WORKSHEET_WRITE_DATA has been written, before sorting."""
+    computed_values = {
+        "Stanton Turner": ("44", ["50", "94", "14", "80", "2", "2", "90", "2"]),
+        "John Fratello": ("46", ["43", "89", "16", "73", "1", "1", "100", "1"]),
+        "Steve Harasym": ("43", ["52", "95", "7", "88", "3", "3", "75", "3"]),
+    }
+
+    values: list[list[str]] = []
+    for row in copy.deepcopy(STUB_WORKSHEET_VALUES_RAW):
+        (front_nine, results) = computed_values[row[0]]
+        row[EventWorksheetColumnOffsets.FRONT_NINE_STROKES.value] = front_nine
+        values.append(row + results)
+
+    return values
+
+
+def current_values_after_write() -> CellValues:
+    """The unformatted values in the worksheet after STUB_WORKSHEET_WRITE_DATA has been written, before sorting."""
+    return [[gspread_utils.numericise(value) for value in row] for row in displayed_values_after_write()]
+
+
+def test_event_worksheet_read() -> None:
+    event_worksheet = event.EventWorksheet(
+        event_name=STUB_EVENT,
+        worksheet_controller=google_worksheet_double(),
+        scorecard_start_cell="B8",
+    )
+    assert event_worksheet.read_range() == "B8:AD"
+
+    read_data = event_worksheet.read(values=STUB_WORKSHEET_VALUES_RAW, players=STUB_PLAYERS)
+
+    assert read_data == EXPECTED_SEASON_VIEW_READ_DATA
+    assert event_worksheet._players_ordered_at_read_time == STUB_PLAYERS
+
+
 def test_reader_read() -> None:
     reader = create_event_worksheet_reader()
-    read_data = reader.read()
+    read_data = reader.read(STUB_WORKSHEET_VALUES_RAW)
 
     assert read_data == EXPECTED_SEASON_VIEW_READ_DATA
 
 
 def test_reader_raw_worksheet_data() -> None:
     reader = create_event_worksheet_reader()
-    worksheet_data = reader._raw_worksheet_data()
+    worksheet_data = reader._raw_worksheet_data(STUB_WORKSHEET_VALUES_RAW)
 
     pd_testing.assert_frame_equal(left=worksheet_data, right=STUB_WORKSHEET_DATA_RAW)
 
 
-def test_reader_processed_worksheet_data() -> None:
+def test_reader_raw_worksheet_data_ignores_rows_after_last_player() -> None:
     reader = create_event_worksheet_reader()
-    worksheet_data = reader._process_raw_worksheet_data(STUB_WORKSHEET_DATA_RAW)
-    pd_testing.assert_frame_equal(left=worksheet_data, right=STUB_WORKSHEET_DATA_PROCESSED)
+    values = STUB_WORKSHEET_VALUES_RAW + [["Not A Player"] + [""] * 20]
+    worksheet_data = reader._raw_worksheet_data(values)
 
+    pd_testing.assert_frame_equal(left=worksheet_data, right=STUB_WORKSHEET_DATA_RAW)
 
-def test_reader_read_range() -> None:
-    reader = create_event_worksheet_reader(
-        scorecard_start_cell="B8",
-    )
-    assert reader._read_range() == "B8:V10"
 
+def test_reader_raw_worksheet_data_pads_missing_rows_and_columns() -> None:
+    reader = create_event_worksheet_reader()
+    # The API omits trailing empty rows and cells
+    values = [STUB_WORKSHEET_VALUES_RAW[0], STUB_WORKSHEET_VALUES_RAW[1][:10]]
+    worksheet_data = reader._raw_worksheet_data(values)
 
-def test_reader_read_range_end_cell() -> None:
-    reader = create_event_worksheet_reader(
-        scorecard_start_cell="B8",
-    )
-    assert reader._read_range_end_cell() == "V10"
+    expected_data = STUB_WORKSHEET_DATA_RAW.copy()
+    expected_data.iloc[1, 10:] = ""
+    expected_data.iloc[2, :] = ""
+    pd_testing.assert_frame_equal(left=worksheet_data, right=expected_data)
 
 
-def test_reader_read_range_row_offset() -> None:
+def test_reader_raw_worksheet_data_ignores_computed_columns() -> None:
     reader = create_event_worksheet_reader()
-    assert reader._read_range_row_offset() == 2
+    worksheet_data = reader._raw_worksheet_data(displayed_values_after_write())
+
+    expected_data = STUB_WORKSHEET_DATA_RAW.copy()
+    expected_data.iloc[:, EventWorksheetColumnOffsets.FRONT_NINE_STROKES.value] = ["44", "46", "43"]
+    pd_testing.assert_frame_equal(left=worksheet_data, right=expected_data)
+
+
+def test_reader_processed_worksheet_data() -> None:
+    reader = create_event_worksheet_reader()
+    worksheet_data = reader._process_raw_worksheet_data(STUB_WORKSHEET_DATA_RAW)
+    pd_testing.assert_frame_equal(left=worksheet_data, right=STUB_WORKSHEET_DATA_PROCESSED)
+
+
+def test_read_range() -> None:
+    assert event.read_range(scorecard_start_cell="B8") == "B8:AD"
+    assert event.read_range(scorecard_start_cell="D12") == "D12:AF"
 
 
 def test_reader_num_players() -> None:
@@ -268,16 +316,24 @@ def test_reader_check_worksheet_data_non_numeric_and_non_empty_data_value_raises
         reader._check_worksheet_data(worksheet_data=test_data)
 
 
+def test_reader_read_non_numeric_hole_score_raises_error_with_location() -> None:
+    values = copy.deepcopy(STUB_WORKSHEET_VALUES_RAW)
+    # John Fratello's 3rd hole
+    values[1][3] = "x"
+
+    reader = create_event_worksheet_reader()
+    with pytest.raises(EventWorksheetError, match="row: John Fratello, col: HOLE_3 is invalid. Found: x"):
+        reader.read(values)
+
+
 def test_reader_read_with_empty_scores_for_one_player() -> None:
     test_data: pd.DataFrame = STUB_WORKSHEET_DATA_RAW.copy()
     # test_data = test_data.astype(object)
     # Set the first player's 9th hole to an empty score
     test_data.iloc[0, 9] = ""
 
-    stub_google_worksheet = google_worksheet_double(data=test_data)
-    reader = create_event_worksheet_reader(google_worksheet=stub_google_worksheet)
-
-    read_data = reader.read()
+    reader = create_event_worksheet_reader()
+    read_data = reader.read(test_data.values.tolist())
 
     expected_read_data: SeasonViewReadEvent = copy.deepcopy(EXPECTED_SEASON_VIEW_READ_DATA)
     expected_read_data._player_scorecards["Stanton Turner"] = IncompleteScorecard()
@@ -291,9 +347,8 @@ def test_reader_read_with_empty_scores_for_all_players() -> None:
     # This sets all of the hole scores to empty strings, but leaves the player names alone
     test_data.iloc[:, 1:] = ""
 
-    stub_google_worksheet = google_worksheet_double(data=test_data)
-    reader = create_event_worksheet_reader(google_worksheet=stub_google_worksheet)
-    read_data = reader.read()
+    reader = create_event_worksheet_reader()
+    read_data = reader.read(test_data.values.tolist())
 
     expected_read_data: SeasonViewReadEvent = copy.deepcopy(EXPECTED_SEASON_VIEW_READ_DATA)
     expected_read_data._player_scorecards["Stanton Turner"] = IncompleteScorecard()
@@ -305,7 +360,6 @@ def test_reader_read_with_empty_scores_for_all_players() -> None:
 
 def test_writer_write() -> None:
     spy_google_worksheet = google_worksheet_double()
-    spy_google_worksheet.column_range_values.return_value = STUB_PLAYERS
 
     writer = create_event_worksheet_writer(google_worksheet=spy_google_worksheet)
 
@@ -353,6 +407,84 @@ def test_writer_write() -> None:
     # TODO: This assertion could be made more precise
     spy_google_worksheet.format_multiple_ranges.assert_called_once()
 
+    # Player rows are not read back from the worksheet since writes may be batched
+    spy_google_worksheet.column_range_values.assert_not_called()
+
+
+def test_writer_write_without_changes_writes_nothing() -> None:
+    spy_google_worksheet = google_worksheet_double()
+    sorted_players = ["John Fratello", "Stanton Turner", "Steve Harasym"]
+    current_values = sorted(current_values_after_write(), key=lambda row: sorted_players.index(str(row[0])))
+
+    writer = create_event_worksheet_writer(
+        google_worksheet=spy_google_worksheet,
+        players_ordered_at_read_time=sorted_players,
+        current_values=CurrentValues(values=current_values, start_cell=STUB_SCORECARD_START_CELL),
+    )
+    writer.write()
+
+    spy_google_worksheet.write_multiple_ranges.assert_not_called()
+    # The rows are already in sorted order
+    spy_google_worksheet.sort_range.assert_not_called()
+
+
+def test_writer_write_only_writes_changed_cells() -> None:
+    spy_google_worksheet = google_worksheet_double()
+    current_values = current_values_after_write()
+    # Stanton's back nine changed, which changes his gross and net strokes.
+    current_values[0][EventWorksheetColumnOffsets.BACK_NINE_STROKES.value] = 51
+    current_values[0][EventWorksheetColumnOffsets.GROSS_STROKES.value] = 95
+    current_values[0][EventWorksheetColumnOffsets.NET_STROKES.value] = 81
+    # Steve's course handicap changed by less than a rounding number format would display, his net strokes changed,
+    # and his rank isn't stored yet.
+    current_values[2][EventWorksheetColumnOffsets.COURSE_HANDICAP.value] = 7.4
+    current_values[2][EventWorksheetColumnOffsets.NET_STROKES.value] = 87
+    del current_values[2][EventWorksheetColumnOffsets.EVENT_RANK.value]
+
+    writer = create_event_worksheet_writer(
+        google_worksheet=spy_google_worksheet,
+        current_values=CurrentValues(values=current_values, start_cell=STUB_SCORECARD_START_CELL),
+    )
+    writer.write()
+
+    spy_google_worksheet.write_multiple_ranges.assert_called_once_with(
+        [
+            RangeValues(range="W6:X6", values=[[50, 94]]),
+            RangeValues(range="Z6:Z6", values=[[80]]),
+            RangeValues(range="Y8:Z8", values=[[7, 88]]),
+            RangeValues(range="AD8:AD8", values=[[3]]),
+        ]
+    )
+    spy_google_worksheet.sort_range.assert_called_once()
+
+
+def test_writer_player_name_to_written_row_map_is_in_written_order() -> None:
+    writer = create_event_worksheet_writer(players_ordered_at_read_time=["Unknown Player"] + STUB_PLAYERS)
+
+    assert writer._player_name_to_written_row_map() == {
+        "Unknown Player": 6,
+        "Stanton Turner": 7,
+        "John Fratello": 8,
+        "Steve Harasym": 9,
+    }
+
+
+def test_writer_formats_rows_before_sorting_them() -> None:
+    # The sort moves the formats with their rows, so the formats are applied to the rows as they're written.
+    spy_google_worksheet = google_worksheet_double()
+    writer = create_event_worksheet_writer(google_worksheet=spy_google_worksheet)
+
+    writer.write()
+
+    method_names = [name for (name, _, _) in spy_google_worksheet.method_calls]
+    assert method_names.index("format_multiple_ranges") < method_names.index("sort_range")
+    [range_formats] = spy_google_worksheet.format_multiple_ranges.call_args[0]
+    # Stanton Turner is written to the first row, and his birdies are on holes 3 and 16.
+    birdie_ranges = {
+        range_format.range for range_format in range_formats if range_format.format == event.BIRDIE_HOLE_CELL_FORMAT
+    }
+    assert {range_name for range_name in birdie_ranges if range_name.endswith("6")} == {"E6", "T6"}
+
 
 def test_writer_player_names_write_range() -> None:
     writer = create_event_worksheet_writer()
@@ -575,10 +707,9 @@ class TestEventWorksheetReaderNameProcessing:
         )
         # fmt: on
 
-        # Using mock worksheet controller since we're only testing data processing, empty players list is fine
+        # We're only testing data processing, so an empty players list is fine
         reader = EventWorksheetReader(
             event_name=STUB_EVENT,
-            worksheet_controller=google_worksheet_double(),
             scorecard_start_cell=STUB_SCORECARD_START_CELL,
             players=[],
         )
@@ -611,10 +742,9 @@ class TestEventWorksheetReaderNameProcessing:
         )
         # fmt: on
 
-        # Using mock worksheet controller since we're only testing data processing, empty players list is fine
+        # We're only testing data processing, so an empty players list is fine
         reader = EventWorksheetReader(
             event_name=STUB_EVENT,
-            worksheet_controller=google_worksheet_double(),
             scorecard_start_cell=STUB_SCORECARD_START_CELL,
             players=[],
         )
@@ -643,10 +773,9 @@ class TestEventWorksheetReaderNameProcessing:
         )
         # fmt: on
 
-        # Using mock worksheet controller since we're only testing data processing, empty players list is fine
+        # We're only testing data processing, so an empty players list is fine
         reader = EventWorksheetReader(
             event_name=STUB_EVENT,
-            worksheet_controller=google_worksheet_double(),
             scorecard_start_cell=STUB_SCORECARD_START_CELL,
             players=[],
         )
@@ -674,10 +803,9 @@ class TestEventWorksheetReaderNameProcessing:
         )
         # fmt: on
 
-        # Using mock worksheet controller since we're only testing data processing, empty players list is fine
+        # We're only testing data processing, so an empty players list is fine
         reader = EventWorksheetReader(
             event_name=STUB_EVENT,
-            worksheet_controller=google_worksheet_double(),
             scorecard_start_cell=STUB_SCORECARD_START_CELL,
             players=[],
         )
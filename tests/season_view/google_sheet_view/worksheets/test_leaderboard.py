@@ -1,15 +1,35 @@
 from unittest import mock
 
 import pytest
-from google_sheet import GoogleWorksheet, RangeValues
+from google_sheet import CellValues, GoogleWorksheet, RangeValues
+from google_sheet import utils as sheet_utils
 from season_view.api.write_data import SeasonViewWriteLeaderboard, SeasonViewWriteLeaderboardPlayer
 from season_view.google_sheet_view.worksheets.leaderboard import (
     FIRST_PLAYER_ROW,
     LeaderboardColumns,
     LeaderboardWorksheet,
+    read_range,
 )
 
 
+def current_values_for(write_ranges: list[RangeValues]) -> CellValues:
+    """Unformatted values in the leaderboard read range once the ranges have been written."""
+    (start_row, start_col) = sheet_utils.a1_to_rowcol("B4")
+    values: CellValues = []
+    for write_range in write_ranges:
+        (first_row, first_col) = sheet_utils.a1_to_rowcol(write_range.range.split(":")[0])
+        for row_offset, row_values in enumerate(write_range.values):
+            row_idx = first_row + row_offset - start_row
+            while len(values) <= row_idx:
+                values.append([])
+            for col_offset, value in enumerate(row_values):
+                col_idx = first_col + col_offset - start_col
+                values[row_idx].extend([None] * (col_idx + 1 - len(values[row_idx])))
+                values[row_idx][col_idx] = value
+
+    return values
+
+
 class TestLeaderboardColumns:
     def test_column_string_values(self):
         """Test that enum values map to correct column letters."""
@@ -331,6 +351,64 @@ class TestLeaderboardWorksheet:
         for range_value in call_args:
             assert range_value.values == []
 
+    def test_read_range(self):
+        """Test the read range spans all written columns."""
+        assert read_range(["Event 1", "Event 2", "Event 3"]) == "B4:U"
+        # Event points columns can extend past the last fixed column
+        assert read_range([f"Event {idx}" for idx in range(1, 17)]) == "B4:V"
+
+    def test_write_only_writes_changed_values(self, sample_leaderboard_data, mock_worksheet, ordered_events):
+        """Test only values that differ from the current values are written."""
+        unfiltered_worksheet = mock.MagicMock(spec=GoogleWorksheet)
+        LeaderboardWorksheet(
+            data=sample_leaderboard_data,
+            worksheet_controller=unfiltered_worksheet,
+            ordered_event_names=ordered_events,
+        ).write()
+        current_values = current_values_for(unfiltered_worksheet.write_multiple_ranges.call_args[0][0])
+
+        # Numbers are stored as doubles, so a whole number matches its integer value
+        assert current_values[0][:4] == [1, "John Doe", 150.0, 3]
+        current_values[0][2] = 150
+        # Bob's points for the third event changed by less than a rounding number format would display, and his
+        # birdies changed
+        current_values[2][7] = 80.4
+        current_values[2][19] = 3
+
+        worksheet = LeaderboardWorksheet(
+            data=sample_leaderboard_data,
+            worksheet_controller=mock_worksheet,
+            ordered_event_names=ordered_events,
+            current_values=current_values,
+        )
+        worksheet.write()
+
+        mock_worksheet.write_multiple_ranges.assert_called_once_with(
+            [
+                RangeValues(range="I6:I6", values=[[80.0]]),
+                RangeValues(range="U6:U6", values=[[4]]),
+            ]
+        )
+
+    def test_write_without_changes_writes_nothing(self, sample_leaderboard_data, mock_worksheet, ordered_events):
+        """Test nothing is written when all values are already stored."""
+        unfiltered_worksheet = mock.MagicMock(spec=GoogleWorksheet)
+        LeaderboardWorksheet(
+            data=sample_leaderboard_data,
+            worksheet_controller=unfiltered_worksheet,
+            ordered_event_names=ordered_events,
+        ).write()
+        current_values = current_values_for(unfiltered_worksheet.write_multiple_ranges.call_args[0][0])
+
+        LeaderboardWorksheet(
+            data=sample_leaderboard_data,
+            worksheet_controller=mock_worksheet,
+            ordered_event_names=ordered_events,
+            current_values=current_values,
+        ).write()
+
+        mock_worksheet.write_multiple_ranges.assert_not_called()
+
     def test_player_data_is_rank_sorted(self, leaderboard_worksheet):
         """Test that player data is sorted by rank in all range methods."""
         # Create data with players in non-rank order
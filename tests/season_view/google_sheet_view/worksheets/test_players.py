@@ -4,7 +4,7 @@ from unittest.mock import patch
 import pandas as pd
 from season_common import player
 from season_view.google_sheet_view.features import NameCase
-from season_view.google_sheet_view.worksheets.players import PlayersWorksheetData
+from season_view.google_sheet_view.worksheets.players import PlayersWorksheet, PlayersWorksheetData
 
 STUB_EVENTS = ["Baylands", "Corica"]
 
@@ -101,3 +101,21 @@ class TestPlayersWorksheetDataNameProcessing:
         assert jane.name() == "Jane Smith"
         assert math.isnan(jane.event_handicap_indices["Baylands"])
         assert jane.event_handicap_indices["Corica"] == 17.9
+
+
+class TestPlayersWorksheet:
+    def test_read_uses_second_row_as_header(self) -> None:
+        values = [
+            ["SFSGT Handicaps"],
+            ["Golfer", "Gender", "Baylands", "Corica"],
+            ["John Doe", "Male", "15.2", "14.8"],
+            ["Jane Smith", "Female", "18.5"],
+        ]
+
+        players = PlayersWorksheet(events=list(STUB_EVENTS)).read(values)
+
+        assert players.player_names == ["John Doe", "Jane Smith"]
+        assert not players.are_finale_hcps_available
+        assert players["John Doe"].event_handicap_index("Corica") == 14.8
+        assert players["Jane Smith"].player.gender == player.PlayerGender.FEMALE
+        assert not players.is_handicap_available(player_name="Jane Smith", event_name="Corica")
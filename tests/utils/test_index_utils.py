@@ -0,0 +1,18 @@
+from utils import index_utils
+
+
+def test_name_index_positions() -> None:
+    index = index_utils.NameIndex(["Snoopy", "Linus", "Snoopy"])
+
+    assert index.position("Snoopy") == 0
+    assert index.position("Linus") == 1
+    assert index.position("Lucy") is None
+    assert "Linus" in index
+    assert len(index) == 2
+
+
+def test_name_index_duplicates() -> None:
+    index = index_utils.NameIndex(["Snoopy", "Linus", "Snoopy"])
+
+    assert index.is_duplicated("Snoopy")
+    assert not index.is_duplicated("Linus")
@@ -0,0 +1,89 @@
+import json
+import pathlib
+
+from utils import tracing
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 10.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_spans_are_recorded_with_nesting_and_args() -> None:
+    clock = FakeClock()
+    tracer = tracing.Tracer(clock=clock)
+
+    with tracer.span("model", category="controller"):
+        clock.now = 11.0
+        with tracer.span("event results", category="model", event="Baylands"):
+            clock.now = 13.5
+        clock.now = 14.0
+
+    assert [(span.name, span.start_seconds, span.duration_seconds) for span in tracer.spans] == [
+        ("event results", 1.0, 2.5),
+        ("model", 0.0, 4.0),
+    ]
+    assert tracer.spans[0].args == {"event": "Baylands"}
+
+
+def test_span_is_recorded_when_block_raises() -> None:
+    tracer = tracing.Tracer(clock=FakeClock())
+
+    try:
+        with tracer.span("read"):
+            raise ValueError()
+    except ValueError:
+        pass
+
+    assert [span.name for span in tracer.spans] == ["read"]
+
+
+def test_module_span_only_records_with_active_tracer() -> None:
+    tracer = tracing.Tracer(clock=FakeClock())
+
+    with tracing.span("before"):
+        pass
+    with tracing.activate(tracer):
+        with tracing.span("during", category="view", worksheet="Event 1"):
+            pass
+    with tracing.span("after"):
+        pass
+
+    assert [(span.name, span.category) for span in tracer.spans] == [("during", "view")]
+
+
+def test_write_chrome_trace(tmp_path: pathlib.Path) -> None:
+    clock = FakeClock()
+    tracer = tracing.Tracer(clock=clock)
+    with tracer.span("write worksheet", category="view", worksheet="Event 1", rows=pathlib.Path("x")):
+        clock.now = 10.25
+
+    trace_file = tmp_path / "traces" / "trace.json"
+    tracer.write_chrome_trace(trace_file)
+    trace = json.loads(trace_file.read_text())
+
+    [event] = trace["traceEvents"]
+    assert event["name"] == "write worksheet"
+    assert event["cat"] == "view"
+    assert event["ph"] == "X"
+    assert (event["ts"], event["dur"]) == (0.0, 250000.0)
+    assert event["args"] == {"worksheet": "Event 1", "rows": "x"}
+
+
+def test_summary_totals_spans_by_name() -> None:
+    clock = FakeClock()
+    tracer = tracing.Tracer(clock=clock)
+    for seconds in (1.0, 2.0):
+        with tracer.span("event results"):
+            clock.now += seconds
+    with tracer.span("write"):
+        clock.now += 0.5
+
+    assert tracer.summary().splitlines() == [
+        "Time by span, slowest first:",
+        "  event results: 3.000s (2 spans)",
+        "  write: 0.500s (1 spans)",
+    ]